@@ -1,78 +1,858 @@
+import io
 import os
+import re
+import time
+import bisect
+import codecs
+import hashlib
+import sqlite3
+import threading
 import webbrowser
+import urllib.parse
 import pyperclip
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QFileDialog, QLabel, 
     QMessageBox, QHBoxLayout, QListWidget, QSplitter, QPlainTextEdit,
     QProgressBar, QMainWindow, QStatusBar, QMenu, QMenuBar, QAction,
-    QFontDialog, QInputDialog
+    QFontDialog, QStackedWidget, QScrollBar, QListWidgetItem,
+    QLineEdit, QCheckBox, QTextEdit, QShortcut, QListView
 )
 
-from PyQt5.QtGui import QTextCursor, QTextCharFormat, QColor, QFont, QSyntaxHighlighter, QIcon
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QSize
+from PyQt5.QtGui import (
+    QTextCursor, QTextCharFormat, QColor, QFont, QTextLayout, QIcon, QKeySequence
+)
+from PyQt5.QtCore import (
+    Qt, QObject, QTimer, QThread, pyqtSignal, QSize, QEvent, QFileSystemWatcher, QPoint,
+    QAbstractListModel, QModelIndex
+)
+
+from donusturucu import atomic_output
+from buyuk_dosya import LARGE_FILE_THRESHOLD, LargeDocument
+from klasor_indeksi import FolderIndex, format_entry
+from metin_indeksi import TextIndex
+from yerellestirme_ayristirici import SegmentTable
+from ceviri_bellegi import (
+    ORIGIN_MEMORY, ORIGIN_FUZZY, TranslationMemory, Translator, backend_from_environment
+)
+
+# İlk parça küçük tutulur ki ilk ekran hemen dolsun; sonraki parçalar büyür
+FIRST_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 4 * 1024 * 1024
 
 class FileLoader(QThread):
     progress = pyqtSignal(int)
+    chunk_loaded = pyqtSignal(str)
     finished = pyqtSignal(str)
     
     def __init__(self, file_path):
         super().__init__()
         self.file_path = file_path
+        self.content_hash = None
+        self.lines = None
         
     def run(self):
+        # Ham baytlar artımlı çözücüden geçirilir: parça sınırında bölünen UTF-8
+        # karakterleri ve \r\n çiftleri bir sonraki parçaya taşınır. İlerleme
+        # okunan bayt sayısından hesaplanır ve en fazla saniyede on kez bildirilir.
+        # Özet dosyanın ham baytlarınındır (SaveWorker yazacağı baytları özetler);
+        # satırlar DocumentMirror için burada bölünür.
         try:
-            with open(self.file_path, "r", encoding="utf-8") as file:
-                content = []
-                file.seek(0, 2)
-                file_size = file.tell()
-                file.seek(0)
-                
-                chunk_size = 8192
+            lines = []
+            rest = ''
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")(), translate=True
+            )
+            hasher = hashlib.blake2b(digest_size=16)
+            with open(self.file_path, "rb") as file:
+                file_size = os.fstat(file.fileno()).st_size
+                chunk_size = FIRST_CHUNK_SIZE
                 bytes_read = 0
+                last_report = 0
                 
-                while True:
+                while not self.isInterruptionRequested():
                     data = file.read(chunk_size)
+                    hasher.update(data)
+                    text = decoder.decode(data, final=not data)
+                    if text:
+                        self.chunk_loaded.emit(text)
+                        parts = text.split("\n")
+                        parts[0] = rest + parts[0]
+                        rest = parts.pop()
+                        lines.extend(parts)
                     if not data:
+                        lines.append(rest)
+                        self.lines = lines
+                        self.content_hash = hasher.hexdigest()
                         break
-                    content.append(data)
-                    bytes_read += len(data.encode('utf-8'))
-                    progress = int((bytes_read / file_size) * 100)
-                    self.progress.emit(progress)
+                    
+                    bytes_read += len(data)
+                    chunk_size = min(chunk_size * 2, MAX_CHUNK_SIZE)
+                    now = time.monotonic()
+                    if now - last_report >= 0.1:
+                        last_report = now
+                        self.progress.emit(int(bytes_read * 100 / file_size))
                 
-                self.finished.emit("".join(content))
+                self.finished.emit("")
+        except Exception as e:
+            self.finished.emit(str(e))
+
+class SaveWorker(QThread):
+    # Belgenin satır listesi (DocumentMirror.snapshot) arka planda birleştirilip
+    # kodlanır ve özeti alınır. Özet son kaydedilenle aynıysa dosyaya dokunulmaz;
+    # değilse geçici dosyaya yazılıp diske işlenir ve yerine taşınır, yarıda
+    # kalan kayıt özgün dosyayı bozmaz. Sonuç: content_hash ve error (başarılıysa
+    # boş), written.
+    finished = pyqtSignal()
+    
+    def __init__(self, file_path, lines, previous_hash=None, autosave=False):
+        super().__init__()
+        self.file_path = file_path
+        self.lines = lines
+        self.previous_hash = previous_hash
+        self.autosave = autosave
+        self.content_hash = None
+        self.error = ""
+        self.written = False
+    
+    def run(self):
+        try:
+            # Eski kayıt gibi satır sonları platform biçiminde yazılır; özet diske
+            # yazılacak baytlarındır, böylece yüklenen dosyanın özetiyle karşılaştırılabilir
+            data = os.linesep.join(self.lines).encode("utf-8")
+            self.lines = None
+            self.content_hash = hashlib.blake2b(data, digest_size=16).hexdigest()
+            if self.content_hash != self.previous_hash or not os.path.exists(self.file_path):
+                template_file = self.file_path if os.path.exists(self.file_path) else None
+                with atomic_output(self.file_path, "wb", template_file) as file:
+                    file.write(data)
+                self.written = True
+        except Exception as e:
+            self.error = str(e)
+        self.finished.emit()
+
+class LargeSaveWorker(QThread):
+    # LargeDocument.write_temp arka planda çalışır; geçici dosyanın yerine
+    # taşınması (eşlemenin yeniden açılması) arayüz iş parçacığında yapılır
+    finished = pyqtSignal()
+    
+    def __init__(self, document, file_path, autosave=False):
+        super().__init__()
+        self.document = document
+        self.file_path = file_path
+        self.autosave = autosave
+        self.temp_file = None
+        self.error = ""
+    
+    def run(self):
+        try:
+            self.temp_file = self.document.write_temp(self.file_path)
         except Exception as e:
-            self.finished.emit(f"Hata: {str(e)}")
+            self.error = str(e)
+        self.finished.emit()
 
-class SyntaxHighlighter(QSyntaxHighlighter):
+# Otomatik kayıt açıkken değişiklikler bu aralıkla kaydedilir (ms)
+AUTOSAVE_INTERVAL = 60 * 1000
+
+class LineIndexer(QThread):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(bool)
+    
+    def __init__(self, document):
+        super().__init__()
+        self.document = document
+        self.stop_event = threading.Event()
+        self.last_report = 0
+    
+    def run(self):
+        completed = self.document.index.build(self.report_progress, self.stop_event)
+        self.finished.emit(completed)
+    
+    def report_progress(self, indexed_bytes, total_bytes):
+        # Her parçada değil, en fazla saniyede on kez bildirilir
+        now = time.monotonic()
+        if now - self.last_report >= 0.1:
+            self.last_report = now
+            self.progress.emit(int(indexed_bytes * 100 / total_bytes))
+    
+    def stop(self):
+        self.stop_event.set()
+
+# Belge içi aramada metin satır sınırlarında bu boyutta parçalarla taranır; her
+# parça arasında durdurma isteğine bakılır ve GIL arayüze bırakılır
+FIND_CHUNK_SIZE = 1024 * 1024
+
+# QTextDocument konumları UTF-16 birimidir; BMP dışı karakterler iki birim sayılır
+ASTRAL_PATTERN = re.compile('[\U00010000-\U0010FFFF]')
+
+def utf16_column(text, column):
+    # Python karakter sütununu QTextBlock konumuna çevirir
+    return column + len(ASTRAL_PATTERN.findall(text, 0, column))
+
+def python_column(text, column):
+    # utf16_column'ın tersi
+    if not ASTRAL_PATTERN.search(text):
+        return column
+    units = 0
+    for index, char in enumerate(text):
+        if units >= column:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(text)
+
+# Görünen alanda en fazla bu kadar eşleşme boyanır
+MAX_VISIBLE_MATCHES = 2000
+
+class SearchWorker(QThread):
+    # Belgenin anlık görüntüsü üzerinde arar; (başlangıç, uzunluk) çiftleri
+    # belge konumlarına çevrilerek toplu halde bildirilir. Parçalar satır
+    # sınırında kesildiğinden satır sonu içeren eşleşmeler bulunmaz.
+    matches_found = pyqtSignal(list)
+    finished = pyqtSignal(int)
+    
+    def __init__(self, text, expression):
+        super().__init__()
+        self.text = text
+        self.expression = expression
+        self.stop_event = threading.Event()
+    
+    def run(self):
+        text = self.text
+        batch = []
+        found = 0
+        shift = 0
+        position = 0
+        last_report = time.monotonic()
+        while position <= len(text) and not self.stop_event.is_set():
+            end = text.find('\n', position + FIND_CHUNK_SIZE)
+            if end < 0:
+                end = len(text)
+            
+            astral = [match.start() for match in ASTRAL_PATTERN.finditer(text, position, end)]
+            for match in self.expression.finditer(text, position, end):
+                start, stop = match.span()
+                if start == stop:
+                    continue
+                if astral:
+                    before = bisect.bisect_left(astral, start)
+                    inside = bisect.bisect_left(astral, stop) - before
+                    batch.append((start + shift + before, stop - start + inside))
+                else:
+                    batch.append((start + shift, stop - start))
+            shift += len(astral)
+            position = end + 1
+            
+            now = time.monotonic()
+            if batch and now - last_report >= 0.1:
+                found += len(batch)
+                self.matches_found.emit(batch)
+                batch = []
+                last_report = now
+        
+        if batch:
+            found += len(batch)
+            self.matches_found.emit(batch)
+        self.finished.emit(found)
+    
+    def stop(self):
+        self.stop_event.set()
+
+class FolderIndexer(QThread):
+    # Dosyalar bulundukça toplu halde bildirilir; liste tarama bitmeden dolar
+    files_found = pyqtSignal(list)
+    finished = pyqtSignal(bool)
+    
+    def __init__(self, index):
+        super().__init__()
+        self.index = index
+        self.stop_event = threading.Event()
+    
+    def run(self):
+        batch = []
+        last_report = time.monotonic()
+        for file_name, entry in self.index.scan(self.stop_event):
+            batch.append((file_name, entry))
+            now = time.monotonic()
+            if len(batch) >= 1000 or now - last_report >= 0.1:
+                self.files_found.emit(batch)
+                batch = []
+                last_report = now
+        if batch:
+            self.files_found.emit(batch)
+        
+        completed = not self.stop_event.is_set()
+        if completed:
+            self.index.save()
+        self.finished.emit(completed)
+    
+    def stop(self):
+        self.stop_event.set()
+
+class TextIndexer(QThread):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(bool)
+    
+    def __init__(self, index, entries, load=False):
+        super().__init__()
+        self.index = index
+        self.entries = entries
+        self.load = load
+        self.stop_event = threading.Event()
+        self.last_report = 0
+    
+    def run(self):
+        if self.load:
+            self.index.load()
+        self.index.update(self.entries, self.stop_event, self.report_progress)
+        self.index.save()
+        self.finished.emit(not self.stop_event.is_set())
+    
+    def report_progress(self, done, total):
+        now = time.monotonic()
+        if now - self.last_report >= 0.1:
+            self.last_report = now
+            self.progress.emit(int(done * 100 / total))
+    
+    def stop(self):
+        self.stop_event.set()
+
+class TranslationWorker(QThread):
+    # Segmentler önce çeviri belleğinde aranır, kalanlar servise gönderilir.
+    # finished: (girdiyle aynı sırada sonuçlar, hata mesajı; başarılıysa boş)
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(list, str)
+    
+    def __init__(self, translator, segments):
+        super().__init__()
+        self.translator = translator
+        self.segments = segments
+        self.stop_event = threading.Event()
+        self.last_report = 0
+    
+    def run(self):
+        try:
+            results = self.translator.translate(self.segments, self.stop_event, self.report_progress)
+        except Exception as e:
+            self.finished.emit([], str(e))
+            return
+        self.finished.emit(results, '')
+    
+    def report_progress(self, done, total):
+        now = time.monotonic()
+        if now - self.last_report >= 0.1:
+            self.last_report = now
+            self.progress.emit(int(done * 100 / total))
+    
+    def stop(self):
+        self.stop_event.set()
+
+class FolderSearcher(QThread):
+    # Sonuçlar bulundukça toplu halde bildirilir
+    results_found = pyqtSignal(list)
+    finished = pyqtSignal(int)
+    
+    def __init__(self, index, pattern, regex, case_sensitive, keys):
+        super().__init__()
+        self.index = index
+        self.pattern = pattern
+        self.regex = regex
+        self.case_sensitive = case_sensitive
+        self.keys = keys
+        self.stop_event = threading.Event()
+    
+    def run(self):
+        batch = []
+        found = 0
+        last_report = time.monotonic()
+        for hit in self.index.search(self.pattern, self.regex, self.case_sensitive,
+                                     self.keys, stop_event=self.stop_event):
+            batch.append(hit)
+            found += 1
+            now = time.monotonic()
+            if now - last_report >= 0.1:
+                self.results_found.emit(batch)
+                batch = []
+                last_report = now
+        if batch:
+            self.results_found.emit(batch)
+        self.finished.emit(found)
+    
+    def stop(self):
+        self.stop_event.set()
+
+class LargeFileView(QWidget):
+    # Büyük dosyalar için pencereli görünüm: düzenleyicide yalnızca ekrana sığan
+    # satırlar bulunur, kaydırma çubuğu tüm belgeyi temsil eder. Pencere
+    # değişmeden önce yapılan düzenlemeler belgenin parça tablosuna aktarılır.
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.rules = []
-        self.setup_rules()
-        
-    def setup_rules(self):
-        tag_format = QTextCharFormat()
-        tag_format.setForeground(QColor("red"))
-        tag_format.setFontWeight(QFont.Bold)
-        
-        key_format = QTextCharFormat()
-        key_format.setForeground(QColor("#FFD700"))  # Altın sarısı
-        
-        string_format = QTextCharFormat()
-        string_format.setForeground(QColor("#98FB98"))  # Açık yeşil
-        
-        self.rules = [
-            (r'\[.*?\]', tag_format),  # Köşeli parantez içindekiler
-            (r'".*?"', string_format),  # Tırnak içindeki metinler
-            (r'[A-Z][A-Za-z]*:', key_format),  # Büyük harfle başlayan kelimeler
-        ]
-    
-    def highlightBlock(self, text):
-        for pattern, format in self.rules:
-            import re
-            for match in re.finditer(pattern, text):
-                start = match.start()
-                length = match.end() - match.start()
-                self.setFormat(start, length, format)
+        self.document = None
+        self.first_line = 0
+        self.loaded_lines = 0
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        
+        self.editor = QPlainTextEdit()
+        self.editor.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.editor.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.editor.setReadOnly(True)
+        self.editor.installEventFilter(self)
+        self.editor.viewport().installEventFilter(self)
+        
+        self.scroll_bar = QScrollBar(Qt.Vertical)
+        self.scroll_bar.valueChanged.connect(self.scroll_to)
+        
+        layout.addWidget(self.editor)
+        layout.addWidget(self.scroll_bar)
+    
+    def set_document(self, document):
+        self.document = document
+        self.first_line = 0
+        self.loaded_lines = 0
+        self.editor.setReadOnly(True)
+        self.load_window()
+    
+    def set_editable(self, editable):
+        self.editor.setReadOnly(not editable)
+    
+    def is_modified(self):
+        return self.document is not None and (
+            self.document.modified or self.editor.document().isModified()
+        )
+    
+    def window_size(self):
+        line_height = self.editor.fontMetrics().lineSpacing()
+        return max(1, self.editor.viewport().height() // line_height)
+    
+    def update_scroll_range(self):
+        line_count = self.document.line_count() if self.document else 0
+        self.scroll_bar.blockSignals(True)
+        self.scroll_bar.setRange(0, max(0, line_count - self.window_size()))
+        self.scroll_bar.setPageStep(self.window_size())
+        self.scroll_bar.setValue(self.first_line)
+        self.scroll_bar.blockSignals(False)
+    
+    def load_window(self):
+        if self.document is None:
+            self.editor.clear()
+            self.loaded_lines = 0
+            self.update_scroll_range()
+            return
+        
+        # İmleç pencere içindeki satır ve sütununu korur
+        cursor = self.editor.textCursor()
+        block, column = cursor.blockNumber(), cursor.positionInBlock()
+        
+        lines = self.document.get_lines(self.first_line, self.window_size())
+        self.loaded_lines = len(lines)
+        self.editor.setPlainText('\n'.join(lines))
+        self.editor.document().setModified(False)
+        
+        target = self.editor.document().findBlockByNumber(
+            min(block, self.editor.document().blockCount() - 1)
+        )
+        cursor = QTextCursor(target)
+        cursor.movePosition(QTextCursor.Right, QTextCursor.MoveAnchor, min(column, target.length() - 1))
+        self.editor.setTextCursor(cursor)
+        self.editor.verticalScrollBar().setValue(0)
+        self.update_scroll_range()
+    
+    def commit_window(self):
+        if self.document is None or not self.editor.document().isModified():
+            return
+        text = self.editor.toPlainText()
+        new_lines = text.split('\n') if text or self.loaded_lines else []
+        self.document.replace_lines(self.first_line, self.loaded_lines, new_lines)
+        self.loaded_lines = len(new_lines)
+        self.editor.document().setModified(False)
+    
+    def scroll_to(self, line):
+        if self.document is None:
+            return
+        self.commit_window()
+        last_line = max(0, self.document.line_count() - self.window_size())
+        self.first_line = max(0, min(line, last_line))
+        self.load_window()
+    
+    def scroll_by(self, lines):
+        self.scroll_to(self.first_line + lines)
+    
+    def refresh(self):
+        # Dizinleme sürerken yeni satırlar göründükçe eksik pencere doldurulur
+        if self.loaded_lines < self.window_size() and not self.editor.document().isModified():
+            self.load_window()
+        else:
+            self.update_scroll_range()
+    
+    def eventFilter(self, obj, event):
+        if self.document is None:
+            return super().eventFilter(obj, event)
+        
+        if event.type() == QEvent.Wheel:
+            self.scroll_by(-event.angleDelta().y() // 40)
+            return True
+        
+        if event.type() == QEvent.Resize and obj is self.editor.viewport():
+            self.commit_window()
+            self.load_window()
+        
+        if event.type() == QEvent.KeyPress and obj is self.editor:
+            key = event.key()
+            block = self.editor.textCursor().blockNumber()
+            control = event.modifiers() & Qt.ControlModifier
+            if key == Qt.Key_Up and block == 0 and self.first_line > 0:
+                self.scroll_by(-1)
+                return True
+            if key == Qt.Key_Down and block == self.editor.document().blockCount() - 1:
+                self.scroll_by(1)
+                return True
+            if key == Qt.Key_PageUp:
+                self.scroll_by(-self.window_size())
+                return True
+            if key == Qt.Key_PageDown:
+                self.scroll_by(self.window_size())
+                return True
+            if key == Qt.Key_Home and control:
+                self.scroll_to(0)
+                self.editor.moveCursor(QTextCursor.Start)
+                return True
+            if key == Qt.Key_End and control:
+                self.scroll_to(self.document.line_count())
+                self.editor.moveCursor(QTextCursor.End)
+                return True
+        
+        return super().eventFilter(obj, event)
+
+# Dosya türüne göre vurgulama kuralları: (ad, desen, renk, kalın). Bir türün
+# kuralları tek bir alternasyonda derlenir; aynı konumda önce yazılan kural kazanır.
+HIGHLIGHT_RULES = {
+    '.txt': [
+        ('string', r'".*?"', "#98FB98", False),  # Tırnak içindeki metinler
+        ('tag', r'\[.*?\]', "red", True),  # Köşeli parantez içindekiler
+        ('key', r'[A-Z][A-Za-z]*:', "#FFD700", False),  # Büyük harfle başlayan anahtarlar
+    ],
+    '.csv': [
+        ('string', r'"(?:[^"]|"")*"', "#98FB98", False),  # Tırnaklı alanlar
+        ('number', r'(?<![\w.])-?\d+(?:[.,]\d+)?(?![\w.])', "#87CEFA", False),
+        ('separator', r'[,;\t]', "#7f8c8d", False),
+    ],
+    '.json': [
+        ('key', r'"(?:[^"\\]|\\.)*"(?=\s*:)', "#FFD700", False),
+        ('string', r'"(?:[^"\\]|\\.)*"', "#98FB98", False),
+        ('number', r'-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?', "#87CEFA", False),
+        ('literal', r'\b(?:true|false|null)\b', "red", True),
+    ],
+}
+
+# Bu boyutu aşan belgelerde vurgulama kendiliğinden kapanır
+HIGHLIGHT_SIZE_LIMIT = 32 * 1024 * 1024
+
+# Ertelenen bloklar için olay döngüsü turu başına ayrılan süre (saniye)
+HIGHLIGHT_TIME_BUDGET = 0.01
+
+HIGHLIGHT_CACHE_LIMIT = 200000
+
+class SyntaxHighlighter(QObject):
+    # QSyntaxHighlighter her eklenen blok için highlightBlock çağırdığından büyük
+    # yüklemelerde Python tarafı darboğaz olur. Burada biçimler blok düzenlerine
+    # doğrudan yazılır: değişiklik sinyali parça başına bir kez gelir, görünen
+    # bloklar hemen, diğerleri zamanlayıcıyla ve tur başına süre bütçesiyle
+    # vurgulanır. Vurgulanmış bloklar userState ile işaretlenir.
+    def __init__(self, editor, file_type='.txt'):
+        super().__init__(editor)
+        self.editor = editor
+        self.document = editor.document()
+        self.scan_block = 0
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.process_pending)
+        
+        self.document.contentsChange.connect(self.contents_changed)
+        editor.verticalScrollBar().valueChanged.connect(self.highlight_visible)
+        
+        self.set_file_type(file_type)
+    
+    def set_file_type(self, file_type):
+        rules = HIGHLIGHT_RULES.get(file_type.lower(), HIGHLIGHT_RULES['.txt'])
+        self.formats = {}
+        for name, pattern, color, bold in rules:
+            format = QTextCharFormat()
+            format.setForeground(QColor(color))
+            if bold:
+                format.setFontWeight(QFont.Bold)
+            self.formats[name] = format
+        self.pattern = re.compile('|'.join(
+            f'(?P<{name}>{pattern})' for name, pattern, _, _ in rules
+        ))
+        
+        # Önbellek blok metninin özetiyle anahtarlanır; kurallar değişince geçersizdir
+        self.cache = {}
+        self.enabled = True
+        self.rehighlight()
+    
+    def rehighlight(self):
+        block = self.document.firstBlock()
+        while block.isValid():
+            block.setUserState(-1)
+            block = block.next()
+        self.scan_block = 0
+        self.highlight_visible()
+        self.schedule()
+    
+    def contents_changed(self, position, removed, added):
+        if not self.enabled or (removed == 0 and added == 0):
+            return
+        if self.document.characterCount() > HIGHLIGHT_SIZE_LIMIT:
+            self.enabled = False
+            self.timer.stop()
+            return
+        
+        # Araya eklenen bloklar zaten işaretsizdir; yalnızca uçlar sıfırlanır
+        first = self.document.findBlock(position)
+        last = self.document.findBlock(position + added)
+        first.setUserState(-1)
+        last.setUserState(-1)
+        self.scan_block = min(self.scan_block, first.blockNumber())
+        self.highlight_visible()
+        self.schedule()
+    
+    def visible_blocks(self):
+        # Sarma kapalıyken kaydırma çubuğunun değeri ilk görünen bloğun numarasıdır
+        first = self.editor.verticalScrollBar().value()
+        lines = self.editor.viewport().height() // self.editor.fontMetrics().lineSpacing()
+        return first, first + lines + 1
+    
+    def highlight_visible(self):
+        if not self.enabled:
+            return
+        first, last = self.visible_blocks()
+        block = self.document.findBlockByNumber(first)
+        while block.isValid() and block.blockNumber() <= last:
+            if block.userState() == -1:
+                self.highlight_block(block)
+            block = block.next()
+    
+    def highlight_block(self, block):
+        text = block.text()
+        key = hash(text)
+        ranges = self.cache.get(key)
+        if ranges is None:
+            if len(self.cache) >= HIGHLIGHT_CACHE_LIMIT:
+                self.cache.clear()
+            ranges = self.cache[key] = []
+            for match in self.pattern.finditer(text):
+                if match.end() > match.start():
+                    format_range = QTextLayout.FormatRange()
+                    format_range.start = match.start()
+                    format_range.length = match.end() - match.start()
+                    format_range.format = self.formats[match.lastgroup]
+                    ranges.append(format_range)
+        
+        layout = block.layout()
+        if ranges or layout.formats():
+            layout.setFormats(ranges)
+            self.document.markContentsDirty(block.position(), block.length())
+        block.setUserState(0)
+    
+    def schedule(self):
+        if self.enabled and self.scan_block < self.document.blockCount() and not self.timer.isActive():
+            self.timer.start()
+    
+    def process_pending(self):
+        # Önce görünen bloklar, sonra belge sırasıyla işaretsiz bloklar; bütçe
+        # dolunca kalan iş bir sonraki tura bırakılır
+        if not self.enabled:
+            return
+        deadline = time.perf_counter() + HIGHLIGHT_TIME_BUDGET
+        self.highlight_visible()
+        
+        block = self.document.findBlockByNumber(self.scan_block)
+        while block.isValid() and time.perf_counter() < deadline:
+            if block.userState() == -1:
+                self.highlight_block(block)
+            block = block.next()
+        
+        self.scan_block = block.blockNumber() if block.isValid() else self.document.blockCount()
+        self.schedule()
+
+# Ayrıştırılan dosya türleri; diğerlerinde segment tablosu boş kalır
+SEGMENT_FILE_TYPES = ('.txt',)
+
+# Bundan çok bloğa dokunan değişiklikler (yükleme parçaları, büyük yapıştırmalar)
+# hemen değil, olay döngüsü turu başına süre bütçesiyle ayrıştırılır
+SEGMENT_DEFER_LINES = 200
+SEGMENT_TIME_BUDGET = 0.01
+
+def changed_blocks(document, position, added, block_count):
+    # contentsChange'in kapsadığı ilk ve son blok ile bu aralığın yerini aldığı
+    # eski blok sayısı; eklenen/silinen bloklar önceki blok sayısıyla farktan bulunur
+    first = document.findBlock(position)
+    last = document.findBlock(position + added)
+    if not last.isValid():
+        last = document.lastBlock()
+    count = last.blockNumber() - first.blockNumber() + 1
+    return first, last, count - (document.blockCount() - block_count)
+
+class DocumentMirror(QObject):
+    # Kayıt için belgenin satır listesi. Yüklenen dosyanın satırları FileLoader'dan
+    # gelir; düzenlemede değişen bloklar yalnızca kirli (None) olarak işaretlenir
+    # ve metinleri kayıt anında belgeden okunur. Böylece kayıt arayüz iş
+    # parçacığında belgenin tamamını değil, yalnızca kirli blokları kopyalar.
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.document = editor.document()
+        self.reset()
+        self.document.contentsChange.connect(self.contents_changed)
+    
+    def reset(self, lines=None):
+        # Satırlar belgeyle örtüşmüyorsa (ör. yükleme yarıda kaldı) tümü kirli sayılır
+        self.block_count = self.document.blockCount()
+        if lines is None or len(lines) != self.block_count:
+            lines = [None] * self.block_count
+        self.lines = lines
+    
+    def contents_changed(self, position, removed, added):
+        first, last, removed = changed_blocks(self.document, position, added, self.block_count)
+        self.block_count = self.document.blockCount()
+        line = first.blockNumber()
+        self.lines[line:line + removed] = [None] * (last.blockNumber() - line + 1)
+    
+    def dirty_count(self):
+        return self.lines.count(None)
+    
+    def snapshot(self):
+        # Kirli bloklar belgeden okunur; dönen liste işçiye verilebilecek sığ bir kopyadır
+        lines = self.lines
+        line = 0
+        while True:
+            try:
+                line = lines.index(None, line)
+            except ValueError:
+                break
+            block = self.document.findBlockByNumber(line)
+            while block.isValid() and line < len(lines) and lines[line] is None:
+                lines[line] = block.text()
+                block = block.next()
+                line += 1
+        return list(lines)
+
+class SegmentTracker(QObject):
+    # Belge değişikliklerini SegmentTable'a aktarır: contentsChange'in kapsadığı
+    # bloklar yeniden ayrıştırılır, eklenen/silinen blok sayısı önceki blok
+    # sayısıyla farktan bulunur. Yazarken yalnızca düzenlenen satır ayrıştırılır.
+    changed = pyqtSignal()
+    
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.document = editor.document()
+        self.table = SegmentTable()
+        self.enabled = False
+        self.block_count = self.document.blockCount()
+        self.scan_line = 0
+        
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.process_pending)
+        
+        self.document.contentsChange.connect(self.contents_changed)
+    
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+        self.block_count = self.document.blockCount()
+        self.table.reset([])
+        if enabled:
+            self.table.mark_pending(0, 0, self.block_count)
+            self.scan_line = 0
+            self.timer.start()
+        self.changed.emit()
+    
+    @property
+    def pending(self):
+        return self.enabled and self.table.first_pending(self.scan_line) is not None
+    
+    def block_texts(self, first, last):
+        texts = []
+        block = first
+        while block.isValid():
+            texts.append(block.text())
+            if block == last:
+                break
+            block = block.next()
+        return texts
+    
+    def contents_changed(self, position, removed, added):
+        if not self.enabled:
+            return
+        first, last, removed = changed_blocks(self.document, position, added, self.block_count)
+        self.block_count = self.document.blockCount()
+        count = last.blockNumber() - first.blockNumber() + 1
+        # Silinen satırlar bekleyenleri yukarı kaydırabilir; tarama buradan sürer
+        self.scan_line = min(self.scan_line, first.blockNumber())
+        if count > SEGMENT_DEFER_LINES:
+            self.table.mark_pending(first.blockNumber(), removed, count)
+            self.timer.start()
+        else:
+            self.table.replace_lines(first.blockNumber(), removed, self.block_texts(first, last))
+        self.changed.emit()
+    
+    def parse_pending(self, deadline=None):
+        # Bekleyen satırları belge sırasıyla ayrıştırır; deadline verilmişse süre
+        # dolunca durur. Hepsi bittiyse True döner.
+        while True:
+            line = self.table.first_pending(self.scan_line)
+            if line is None:
+                self.scan_line = len(self.table.lines)
+                return True
+            self.scan_line = line
+            block = self.document.findBlockByNumber(line)
+            texts = []
+            end = min(line + SEGMENT_DEFER_LINES, len(self.table.lines))
+            while block.isValid() and line + len(texts) < end and self.table.lines[line + len(texts)] is False:
+                texts.append(block.text())
+                block = block.next()
+            self.table.replace_lines(line, len(texts), texts)
+            if deadline is not None and time.perf_counter() >= deadline:
+                return False
+    
+    def process_pending(self):
+        if not self.enabled:
+            return
+        if not self.parse_pending(time.perf_counter() + SEGMENT_TIME_BUDGET):
+            self.timer.start()
+        self.changed.emit()
+    
+    def flush(self):
+        # Gezinme gibi tüm tabloya ihtiyaç duyan işlemlerden önce çağrılır
+        if self.enabled:
+            self.parse_pending()
+
+class SegmentListModel(QAbstractListModel):
+    # "Yalnızca çevrilecek metinler" listesi. Satırlar segment tablosunun anlık
+    # görüntüsüdür; metin gösterilirken belgeden okunur, böylece 100 bin
+    # segmentte bile liste yalnızca görünen satırlar için metin üretir.
+    def __init__(self, tracker):
+        super().__init__()
+        self.tracker = tracker
+        self.rows = []
+    
+    def refresh(self):
+        self.beginResetModel()
+        self.rows = list(self.tracker.table.segments())
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        line, key, start, end = self.rows[index.row()]
+        text = self.tracker.document.findBlockByNumber(line).text()[start:end]
+        return f'{line + 1}  {key}: {text}' if key else f'{line + 1}  {text}'
 
 class TranslationTool(QMainWindow):
     def __init__(self):
@@ -139,10 +919,42 @@ class TranslationTool(QMainWindow):
         """)
         self.file_list.itemClicked.connect(self.load_selected_file)
         
+        # Klasör genelinde arama paneli
+        self.search_panel = QWidget()
+        search_layout = QVBoxLayout(self.search_panel)
+        search_layout.setContentsMargins(0, 0, 0, 0)
+        search_options = QHBoxLayout()
+        self.search_entry = QLineEdit()
+        self.search_entry.setPlaceholderText("Klasörde ara (Enter)")
+        self.search_entry.returnPressed.connect(self.start_folder_search)
+        self.regex_check = QCheckBox("Regex")
+        self.case_check = QCheckBox("Aa")
+        self.case_check.setToolTip("Büyük/küçük harf duyarlı")
+        search_options.addWidget(self.search_entry)
+        search_options.addWidget(self.regex_check)
+        search_options.addWidget(self.case_check)
+        self.search_results = QListWidget()
+        self.search_results.setStyleSheet(self.file_list.styleSheet())
+        self.search_results.itemClicked.connect(self.open_search_result)
+        search_layout.addLayout(search_options)
+        search_layout.addWidget(self.search_results)
+        
+        self.side_splitter = QSplitter(Qt.Vertical)
+        self.side_splitter.addWidget(self.file_list)
+        self.side_splitter.addWidget(self.search_panel)
+        self.side_splitter.setSizes([500, 300])
+        
+        # Klasör değişiklikleri kısa bir bekleme sonrası toplu uygulanır
+        self.file_watcher = QFileSystemWatcher(self)
+        self.file_watcher.directoryChanged.connect(self.folder_changed)
+        self.changed_folders = set()
+        self.watch_timer = QTimer(self)
+        self.watch_timer.setSingleShot(True)
+        self.watch_timer.setInterval(300)
+        self.watch_timer.timeout.connect(self.apply_folder_changes)
+        
         # Text Edit
-        self.text_edit = QPlainTextEdit()
-        self.text_edit.setReadOnly(True)
-        self.text_edit.setStyleSheet("""
+        editor_style = """
             QPlainTextEdit {
                 background-color: #1e1e1e;
                 color: white;
@@ -151,16 +963,64 @@ class TranslationTool(QMainWindow):
                 border-radius: 5px;
                 padding: 5px;
             }
-        """)
+        """
+        self.text_edit = QPlainTextEdit()
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setStyleSheet(editor_style)
         self.text_edit.setLineWrapMode(QPlainTextEdit.NoWrap)
         
+        # Büyük dosyalar için pencereli görünüm
+        self.large_view = LargeFileView()
+        self.large_view.editor.setStyleSheet(editor_style)
+        
+        self.editor_stack = QStackedWidget()
+        self.editor_stack.addWidget(self.text_edit)
+        self.editor_stack.addWidget(self.large_view)
+        
         # Syntax Highlighter
-        self.highlighter = SyntaxHighlighter(self.text_edit.document())
+        self.highlighter = SyntaxHighlighter(self.text_edit)
+        self.large_highlighter = SyntaxHighlighter(self.large_view.editor)
+        
+        # Çevrilecek metinler paneli; liste değişikliklerden kısa süre sonra yenilenir
+        self.segment_tracker = SegmentTracker(self.text_edit)
+        self.document_mirror = DocumentMirror(self.text_edit)
+        self.segment_model = SegmentListModel(self.segment_tracker)
+        self.segment_panel = QWidget()
+        segment_layout = QVBoxLayout(self.segment_panel)
+        segment_layout.setContentsMargins(0, 0, 0, 0)
+        self.segment_label = QLabel()
+        self.segment_list = QListView()
+        self.segment_list.setUniformItemSizes(True)
+        self.segment_list.setModel(self.segment_model)
+        self.segment_list.setStyleSheet("""
+            QListView {
+                background-color: #2c3e50;
+                color: white;
+                border-radius: 5px;
+                padding: 5px;
+            }
+        """)
+        segment_layout.addWidget(self.segment_label)
+        segment_layout.addWidget(self.segment_list)
+        self.segment_panel.hide()
+        self.segment_list.clicked.connect(self.open_segment)
+        self.segment_list.activated.connect(self.open_segment)
+        
+        self.segment_timer = QTimer(self)
+        self.segment_timer.setSingleShot(True)
+        self.segment_timer.setInterval(300)
+        self.segment_timer.timeout.connect(self.refresh_segment_panel)
+        self.segment_tracker.changed.connect(self.segment_timer.start)
+        
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.setInterval(AUTOSAVE_INTERVAL)
+        self.autosave_timer.timeout.connect(self.autosave)
         
         # Splitter'a widget'ları ekle
-        self.splitter.addWidget(self.file_list)
-        self.splitter.addWidget(self.text_edit)
-        self.splitter.setSizes([200, 800])
+        self.splitter.addWidget(self.side_splitter)
+        self.splitter.addWidget(self.editor_stack)
+        self.splitter.addWidget(self.segment_panel)
+        self.splitter.setSizes([200, 800, 300])
         
         # Kontrol Butonları
         self.controls_layout = QHBoxLayout()
@@ -199,10 +1059,61 @@ class TranslationTool(QMainWindow):
         self.translate_button.setEnabled(False)
         self.find_button.setEnabled(False)
         
+        # Bul çubuğu
+        self.find_bar = QWidget()
+        find_layout = QHBoxLayout(self.find_bar)
+        find_layout.setContentsMargins(0, 0, 0, 0)
+        self.find_entry = QLineEdit()
+        self.find_entry.setPlaceholderText("Bul")
+        self.find_regex_check = QCheckBox("Regex")
+        self.find_case_check = QCheckBox("Aa")
+        self.find_case_check.setToolTip("Büyük/küçük harf duyarlı")
+        self.find_count_label = QLabel()
+        self.find_count_label.setMinimumWidth(120)
+        find_previous_button = QPushButton("▲")
+        find_next_button = QPushButton("▼")
+        find_close_button = QPushButton("✕")
+        for widget in (self.find_entry, self.find_regex_check, self.find_case_check,
+                       self.find_count_label, find_previous_button, find_next_button,
+                       find_close_button):
+            find_layout.addWidget(widget)
+        self.find_bar.hide()
+        
+        self.find_entry.returnPressed.connect(self.find_next)
+        find_previous_button.clicked.connect(self.find_previous)
+        find_next_button.clicked.connect(self.find_next)
+        find_close_button.clicked.connect(self.close_find_bar)
+        close_shortcut = QShortcut(QKeySequence('Escape'), self.find_bar)
+        close_shortcut.setContext(Qt.WidgetWithChildrenShortcut)
+        close_shortcut.activated.connect(self.close_find_bar)
+        
+        # Yazarken ve belge değişince arama kısa bir beklemeden sonra yenilenir;
+        # belge değişikliğinde imleç yerinden oynatılmaz
+        self.find_timer = QTimer(self)
+        self.find_timer.setSingleShot(True)
+        self.find_timer.setInterval(200)
+        self.find_timer.timeout.connect(self.start_find)
+        self.refind_timer = QTimer(self)
+        self.refind_timer.setSingleShot(True)
+        self.refind_timer.setInterval(500)
+        self.refind_timer.timeout.connect(lambda: self.start_find(jump=False))
+        self.find_entry.textChanged.connect(self.find_timer.start)
+        self.find_regex_check.toggled.connect(self.find_timer.start)
+        self.find_case_check.toggled.connect(self.find_timer.start)
+        self.text_edit.textChanged.connect(self.document_changed_for_find)
+        self.text_edit.verticalScrollBar().valueChanged.connect(self.update_find_highlights)
+        self.text_edit.horizontalScrollBar().valueChanged.connect(self.update_find_highlights)
+        
+        self.match_format = QTextCharFormat()
+        self.match_format.setBackground(QColor("#7d6608"))
+        self.current_match_format = QTextCharFormat()
+        self.current_match_format.setBackground(QColor("#d35400"))
+        
         # Ana layout'a eklemeler
         self.main_layout.addWidget(self.header)
         self.main_layout.addWidget(self.progress_bar)
         self.main_layout.addWidget(self.splitter)
+        self.main_layout.addWidget(self.find_bar)
         self.main_layout.addLayout(self.controls_layout)
         
         # Status bar
@@ -212,7 +1123,7 @@ class TranslationTool(QMainWindow):
         # Bağlantılar
         self.load_folder_button.clicked.connect(self.load_folder)
         self.load_file_button.clicked.connect(self.load_file)
-        self.save_button.clicked.connect(self.save_file)
+        self.save_button.clicked.connect(lambda: self.save_file())
         self.translate_button.clicked.connect(self.translate_selection)
         self.find_button.clicked.connect(self.find_text)
         
@@ -220,7 +1131,31 @@ class TranslationTool(QMainWindow):
         self.folder_path = None
         self.current_file_path = None
         self.file_loader = None
+        self.large_document = None
+        self.line_indexer = None
+        self.folder_index = None
+        self.folder_indexer = None
+        self.file_items = {}
+        self.text_index = None
+        self.text_indexer = None
+        self.text_index_stale = False
+        self.folder_searcher = None
+        self.pending_location = None
         self.last_search = ""
+        self.search_worker = None
+        self.save_worker = None
+        self.save_revision = -1
+        self.save_requested = False
+        self.saved_hash = None
+        self.translator = None
+        self.translation_worker = None
+        self.translation_cursor = None
+        self.translation_source = ""
+        self.find_starts = []
+        self.find_lengths = []
+        self.find_current = -1
+        self.find_anchor = 0
+        self.find_jump = False
         
     def create_menu_bar(self):
         menubar = self.menuBar()
@@ -238,11 +1173,16 @@ class TranslationTool(QMainWindow):
         
         save_file = QAction('Kaydet', self)
         save_file.setShortcut('Ctrl+S')
-        save_file.triggered.connect(self.save_file)
+        save_file.triggered.connect(lambda: self.save_file())
+        
+        toggle_autosave = QAction('Otomatik Kaydet', self)
+        toggle_autosave.setCheckable(True)
+        toggle_autosave.triggered.connect(self.toggle_autosave)
         
         file_menu.addAction(new_file)
         file_menu.addAction(open_file)
         file_menu.addAction(save_file)
+        file_menu.addAction(toggle_autosave)
         
         # Düzen menüsü
         edit_menu = menubar.addMenu('Düzen')
@@ -250,7 +1190,33 @@ class TranslationTool(QMainWindow):
         change_font = QAction('Yazı Tipi...', self)
         change_font.triggered.connect(self.change_font)
         
+        find = QAction('Bul...', self)
+        find.setShortcut('Ctrl+F')
+        find.triggered.connect(self.find_text)
+        
+        find_next = QAction('Sonrakini Bul', self)
+        find_next.setShortcut('F3')
+        find_next.triggered.connect(self.find_next)
+        
+        find_previous = QAction('Öncekini Bul', self)
+        find_previous.setShortcut('Shift+F3')
+        find_previous.triggered.connect(self.find_previous)
+        
+        next_segment = QAction('Sonraki Segment', self)
+        next_segment.setShortcut('Alt+Down')
+        next_segment.triggered.connect(self.next_segment)
+        
+        previous_segment = QAction('Önceki Segment', self)
+        previous_segment.setShortcut('Alt+Up')
+        previous_segment.triggered.connect(self.previous_segment)
+        
         edit_menu.addAction(change_font)
+        edit_menu.addAction(find)
+        edit_menu.addAction(find_next)
+        edit_menu.addAction(find_previous)
+        edit_menu.addSeparator()
+        edit_menu.addAction(next_segment)
+        edit_menu.addAction(previous_segment)
         
         # Görünüm menüsü
         view_menu = menubar.addMenu('Görünüm')
@@ -259,10 +1225,23 @@ class TranslationTool(QMainWindow):
         toggle_wrap.setCheckable(True)
         toggle_wrap.triggered.connect(self.toggle_word_wrap)
         
+        self.toggle_segments = QAction('Yalnızca Çevrilecek Metinler', self)
+        self.toggle_segments.setCheckable(True)
+        self.toggle_segments.setShortcut('Ctrl+Shift+L')
+        self.toggle_segments.triggered.connect(self.toggle_segment_panel)
+        
         view_menu.addAction(toggle_wrap)
+        view_menu.addAction(self.toggle_segments)
     
     def new_file(self):
+        self.wait_for_save()
+        self.stop_file_loader()
+        self.close_large_file()
         self.text_edit.clear()
+        self.text_edit.document().setModified(False)
+        self.saved_hash = None
+        self.highlighter.set_file_type('.txt')
+        self.segment_tracker.set_enabled(True)
         self.text_edit.setReadOnly(False)
         self.current_file_path = None
         self.save_button.setEnabled(True)
@@ -274,62 +1253,484 @@ class TranslationTool(QMainWindow):
         font, ok = QFontDialog.getFont(self.text_edit.font(), self)
         if ok:
             self.text_edit.setFont(font)
+            self.large_view.editor.setFont(font)
     
     def toggle_word_wrap(self, checked):
         self.text_edit.setLineWrapMode(
             QPlainTextEdit.WidgetWidth if checked else QPlainTextEdit.NoWrap
         )
     
+    def active_editor(self):
+        return self.large_view.editor if self.large_document else self.text_edit
+    
+    def toggle_segment_panel(self, checked):
+        self.segment_panel.setVisible(checked)
+        self.refresh_segment_panel()
+    
+    def refresh_segment_panel(self):
+        self.segment_timer.stop()
+        if not self.segment_panel.isVisible():
+            return
+        # Liste sıfırlanırken kaydırma konumu korunur
+        position = self.segment_list.verticalScrollBar().value()
+        self.segment_model.refresh()
+        self.segment_list.verticalScrollBar().setValue(position)
+        if self.segment_tracker.pending:
+            self.segment_label.setText(f'Çevrilecek metinler: {len(self.segment_tracker.table)} (ayrıştırılıyor...)')
+        elif self.segment_tracker.enabled:
+            self.segment_label.setText(f'Çevrilecek metinler: {len(self.segment_tracker.table)}')
+        else:
+            self.segment_label.setText('Bu dosya türü ayrıştırılmıyor')
+    
+    def open_segment(self, index):
+        line, _, start, end = self.segment_model.rows[index.row()]
+        self.select_segment(line, start, end)
+    
+    def select_segment(self, line, start, end):
+        block = self.text_edit.document().findBlockByNumber(line)
+        if not block.isValid():
+            return
+        text = block.text()
+        cursor = QTextCursor(block)
+        cursor.setPosition(block.position() + utf16_column(text, start))
+        cursor.setPosition(block.position() + utf16_column(text, end), QTextCursor.KeepAnchor)
+        self.text_edit.setTextCursor(cursor)
+        self.text_edit.centerCursor()
+        self.text_edit.setFocus()
+    
+    def segment_cursor_position(self):
+        self.segment_tracker.flush()
+        cursor = self.text_edit.textCursor()
+        block = self.text_edit.document().findBlock(cursor.selectionStart())
+        return block.blockNumber(), python_column(block.text(), cursor.selectionStart() - block.position())
+    
+    def next_segment(self):
+        if self.large_document is not None or not self.segment_tracker.enabled:
+            return
+        segment = self.segment_tracker.table.next_segment(*self.segment_cursor_position())
+        if segment is None:
+            self.status_bar.showMessage('Sonrasında çevrilecek metin yok')
+            return
+        line, _, start, end = segment
+        self.select_segment(line, start, end)
+    
+    def previous_segment(self):
+        if self.large_document is not None or not self.segment_tracker.enabled:
+            return
+        segment = self.segment_tracker.table.previous_segment(*self.segment_cursor_position())
+        if segment is None:
+            self.status_bar.showMessage('Öncesinde çevrilecek metin yok')
+            return
+        line, _, start, end = segment
+        self.select_segment(line, start, end)
+    
     def find_text(self):
-        text, ok = QInputDialog.getText(self, 'Metin Bul',
-            'Aranacak metin:', text=self.last_search)
-        
-        if ok and text:
-            self.last_search = text
-            cursor = self.text_edit.document().find(text)
-            if not cursor.isNull():
-                self.text_edit.setTextCursor(cursor)
-            else:
-                QMessageBox.information(self, "Sonuç",
-                    f"'{text}' metni bulunamadı.")
+        if not self.find_button.isEnabled():
+            return
+        selected_text = self.text_edit.textCursor().selectedText()
+        text = selected_text if selected_text and '\u2029' not in selected_text else self.last_search
+        
+        self.find_bar.show()
+        self.find_entry.blockSignals(True)
+        self.find_entry.setText(text)
+        self.find_entry.blockSignals(False)
+        self.find_entry.setFocus()
+        self.find_entry.selectAll()
+        self.start_find()
+    
+    def close_find_bar(self):
+        self.stop_search_worker()
+        self.find_bar.hide()
+        self.find_starts = []
+        self.find_lengths = []
+        self.text_edit.setExtraSelections([])
+        self.text_edit.setFocus()
+    
+    def stop_search_worker(self):
+        if self.search_worker is not None and self.search_worker.isRunning():
+            self.search_worker.stop()
+            self.search_worker.wait()
+        self.search_worker = None
+    
+    def start_find(self, jump=True):
+        # Aramayı belgenin anlık görüntüsü üzerinde yeniden başlatır. jump seçiliyse
+        # imleçten sonraki ilk eşleşme geldiği anda seçilir.
+        self.find_timer.stop()
+        self.refind_timer.stop()
+        self.stop_search_worker()
+        self.find_starts = []
+        self.find_lengths = []
+        self.find_current = -1
+        
+        pattern = self.find_entry.text()
+        if not self.find_bar.isVisible() or not pattern or self.is_loading():
+            # Yükleme bitince arama file_loading_finished içinden yeniden başlar
+            self.update_find_status()
+            self.update_find_highlights()
+            return
+        
+        flags = re.MULTILINE if self.find_case_check.isChecked() else re.MULTILINE | re.IGNORECASE
+        try:
+            expression = re.compile(
+                pattern if self.find_regex_check.isChecked() else re.escape(pattern), flags
+            )
+        except re.error:
+            self.find_count_label.setText('Geçersiz ifade')
+            self.update_find_highlights()
+            return
+        
+        self.last_search = pattern
+        self.find_anchor = self.text_edit.textCursor().selectionStart()
+        self.find_jump = jump
+        self.search_worker = SearchWorker(self.text_edit.toPlainText(), expression)
+        self.search_worker.matches_found.connect(self.matches_found)
+        self.search_worker.finished.connect(self.find_finished)
+        self.search_worker.start()
+        self.update_find_status()
+    
+    def matches_found(self, matches):
+        # Durdurulan işçinin kuyrukta kalmış sinyalleri yok sayılır
+        if self.search_worker is None or self.sender() is not self.search_worker:
+            return
+        first = len(self.find_starts)
+        for start, length in matches:
+            self.find_starts.append(start)
+            self.find_lengths.append(length)
+        
+        if self.find_jump:
+            index = bisect.bisect_left(self.find_starts, self.find_anchor, first)
+            if index < len(self.find_starts):
+                self.find_jump = False
+                self.select_match(index)
+                return
+        self.update_find_status()
+        self.update_find_highlights()
+    
+    def find_finished(self, found):
+        if self.search_worker is None or self.sender() is not self.search_worker:
+            return
+        self.search_worker.wait()
+        if self.find_jump and self.find_starts:
+            # İmleçten sonra eşleşme yok, baştan devam edilir
+            self.find_jump = False
+            self.select_match(0)
+            return
+        self.update_find_status()
+    
+    def document_changed_for_find(self):
+        # Yükleme sürerken eklenen parçalar aramayı yeniden başlatmaz
+        if self.find_bar.isVisible() and not self.is_loading():
+            self.refind_timer.start()
+    
+    def select_match(self, index):
+        self.find_current = index
+        start = self.find_starts[index]
+        cursor = self.text_edit.textCursor()
+        cursor.setPosition(start)
+        cursor.setPosition(start + self.find_lengths[index], QTextCursor.KeepAnchor)
+        self.text_edit.setTextCursor(cursor)
+        self.text_edit.centerCursor()
+        self.update_find_status()
+        self.update_find_highlights()
+    
+    def find_next(self):
+        if not self.find_starts:
+            if not self.find_bar.isVisible():
+                self.find_text()
+            return
+        position = self.text_edit.textCursor().selectionEnd()
+        index = bisect.bisect_left(self.find_starts, position)
+        self.select_match(index if index < len(self.find_starts) else 0)
+    
+    def find_previous(self):
+        if not self.find_starts:
+            return
+        position = self.text_edit.textCursor().selectionStart()
+        index = bisect.bisect_left(self.find_starts, position) - 1
+        self.select_match(index if index >= 0 else len(self.find_starts) - 1)
+    
+    def update_find_status(self):
+        total = len(self.find_starts)
+        searching = self.search_worker is not None and self.search_worker.isRunning()
+        if self.find_current >= 0:
+            text = f'{self.find_current + 1} / {total}'
+        else:
+            text = f'{total} eşleşme'
+        self.find_count_label.setText(text + (' …' if searching else ''))
+    
+    def update_find_highlights(self):
+        # Yalnızca görünen alandaki eşleşmeler ek seçim olarak boyanır
+        if not self.find_bar.isVisible() or not self.find_starts:
+            self.text_edit.setExtraSelections([])
+            return
+        
+        editor = self.text_edit
+        viewport = editor.viewport()
+        first_block = editor.cursorForPosition(QPoint(0, 0)).block()
+        last_block = editor.cursorForPosition(QPoint(viewport.width(), viewport.height())).block()
+        visible_start = first_block.position()
+        visible_end = last_block.position() + last_block.length()
+        document_end = editor.document().characterCount() - 1
+        
+        first = bisect.bisect_left(self.find_starts, visible_start)
+        last = min(bisect.bisect_right(self.find_starts, visible_end), first + MAX_VISIBLE_MATCHES)
+        selections = []
+        for index in range(first, last):
+            start = self.find_starts[index]
+            end = start + self.find_lengths[index]
+            if end > document_end:
+                break
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(editor.document())
+            selection.cursor.setPosition(start)
+            selection.cursor.setPosition(end, QTextCursor.KeepAnchor)
+            selection.format = self.current_match_format if index == self.find_current else self.match_format
+            selections.append(selection)
+        editor.setExtraSelections(selections)
     
     def update_progress(self, value):
         self.progress_bar.setValue(value)
         self.status_bar.showMessage(f'Dosya yükleniyor... %{value}')
     
-    def file_loading_finished(self, content):
-        self.text_edit.setPlainText(content)
+    def append_loaded_text(self, text):
+        # Görünüm kaydırılmadan belgenin sonuna eklenir
+        cursor = QTextCursor(self.text_edit.document())
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText(text)
+    
+    def file_loading_finished(self, error):
+        self.text_edit.document().setUndoRedoEnabled(True)
+        self.progress_bar.hide()
+        if error:
+            self.status_bar.showMessage('Dosya yüklenemedi')
+            QMessageBox.critical(self, "Hata", f"Dosya yüklenirken hata oluştu: {error}")
+            return
+        
         self.text_edit.setReadOnly(False)
+        self.text_edit.document().setModified(False)
+        self.saved_hash = self.file_loader.content_hash
+        self.document_mirror.reset(self.file_loader.lines)
+        self.file_loader.lines = None
         self.save_button.setEnabled(True)
         self.translate_button.setEnabled(True)
         self.find_button.setEnabled(True)
-        self.progress_bar.hide()
         self.status_bar.showMessage('Dosya yüklendi')
         
         # Dosya bilgilerini göster
         if self.current_file_path:
             file_size = os.path.getsize(self.current_file_path) / 1024  # KB
-            line_count = len(content.splitlines())
+            line_count = self.text_edit.document().blockCount()
             self.status_bar.showMessage(
                 f'Dosya: {os.path.basename(self.current_file_path)} | '
                 f'Boyut: {file_size:.1f} KB | '
                 f'Satır: {line_count}'
             )
+        self.apply_pending_location()
+        if self.find_bar.isVisible():
+            self.start_find(jump=False)
     
     def load_folder(self):
         folder_path = QFileDialog.getExistingDirectory(self, "Klasör Seç")
         
         if folder_path:
+            self.stop_folder_indexer()
             self.folder_path = folder_path
             self.file_list.clear()
+            self.file_items = {}
+            if self.file_watcher.directories():
+                self.file_watcher.removePaths(self.file_watcher.directories())
             
-            for file_name in os.listdir(folder_path):
-                if file_name.endswith((".txt", ".csv", ".json")):
-                    self.file_list.addItem(file_name)
+            # Önceki oturumun kayıtları hemen listelenir, tarama arka planda
+            # değişenleri günceller
+            self.folder_index = FolderIndex(folder_path)
+            self.text_index = TextIndex(folder_path)
+            self.search_results.clear()
+            self.update_file_items(self.folder_index.cached_files())
+            self.status_bar.showMessage(f'{len(self.file_items)} dosya | Klasör taranıyor...')
             
-            self.status_bar.showMessage(
-                f'{len(os.listdir(folder_path))} dosya bulundu'
-            )
+            self.folder_indexer = FolderIndexer(self.folder_index)
+            self.folder_indexer.files_found.connect(self.update_file_items)
+            self.folder_indexer.finished.connect(self.folder_indexing_finished)
+            self.folder_indexer.start()
+    
+    def update_file_items(self, files):
+        # (dosya, kayıt) çiftleri listeye işlenir; kayıt None ise dosya silinmiştir
+        self.file_list.setUpdatesEnabled(False)
+        for file_name, entry in files:
+            item = self.file_items.get(file_name)
+            if entry is None:
+                if item is not None:
+                    self.file_list.takeItem(self.file_list.row(item))
+                    del self.file_items[file_name]
+                continue
+            
+            if item is None:
+                item = self.file_items[file_name] = QListWidgetItem()
+                item.setData(Qt.UserRole, file_name)
+                self.file_list.addItem(item)
+            relative_path = os.path.relpath(file_name, self.folder_path)
+            item.setText(f'{relative_path}  ({format_entry(entry)})')
+            item.setToolTip(file_name)
+        self.file_list.sortItems()
+        self.file_list.setUpdatesEnabled(True)
+    
+    def folder_indexing_finished(self, completed):
+        if self.sender() is not self.folder_indexer or not completed:
+            return
+        # Sinyal run() bitmeden gelir; iş parçacığı sonlanınca değişiklikler uygulanabilir
+        self.folder_indexer.wait()
+        self.file_watcher.addPaths(self.folder_index.folders)
+        self.status_bar.showMessage(f'{len(self.file_items)} dosya bulundu')
+        self.apply_folder_changes()
+    
+    def stop_folder_indexer(self):
+        for worker in (self.folder_indexer, self.text_indexer, self.folder_searcher):
+            if worker is not None and worker.isRunning():
+                worker.stop()
+                worker.wait()
+        self.folder_indexer = None
+        self.text_indexer = None
+        self.folder_searcher = None
+        self.text_index_stale = False
+        self.changed_folders.clear()
+    
+    def folder_changed(self, folder):
+        self.changed_folders.add(folder)
+        self.watch_timer.start()
+    
+    def apply_folder_changes(self):
+        # Tarama sürerken gelen değişiklikler tarama bitince uygulanır
+        if self.folder_indexer is not None and self.folder_indexer.isRunning():
+            return
+        
+        folders = list(self.changed_folders)
+        self.changed_folders.clear()
+        watched = set(self.file_watcher.directories())
+        while folders:
+            folder = folders.pop()
+            if not os.path.isdir(folder):
+                continue
+            files, subfolders = self.folder_index.refresh_folder(folder)
+            self.update_file_items(files)
+            
+            # Yeni alt klasörler izlemeye alınır ve içerikleri de okunur
+            for subfolder in subfolders:
+                if subfolder not in watched:
+                    self.file_watcher.addPath(subfolder)
+                    watched.add(subfolder)
+                    folders.append(subfolder)
+        
+        # Yalnızca geçici dosyalar ya da desteklenmeyen dosyalar değiştiyse (ör.
+        # kaydın geçici dosyası) kayıtlar aynı kalır; dizinler yeniden kurulmaz
+        changed = self.folder_index.changed or self.text_indexer is None
+        self.folder_index.save()
+        self.status_bar.showMessage(f'{len(self.file_items)} dosya bulundu')
+        if changed:
+            self.start_text_indexer()
+    
+    def start_text_indexer(self):
+        # Metin dizini klasör dizininin kayıtlarına göre artımlı güncellenir; o
+        # sırada çalışan bir güncelleme varsa bittiğinde yeniden başlatılır
+        if self.text_indexer is not None and self.text_indexer.isRunning():
+            self.text_index_stale = True
+            return
+        first_run = self.text_indexer is None
+        self.text_index_stale = False
+        self.text_indexer = TextIndexer(self.text_index, dict(self.folder_index.entries), first_run)
+        self.text_indexer.progress.connect(self.update_text_index_progress)
+        self.text_indexer.finished.connect(self.text_indexing_finished)
+        self.text_indexer.start()
+    
+    def update_text_index_progress(self, value):
+        self.status_bar.showMessage(f'Arama dizini güncelleniyor... %{value}')
+    
+    def text_indexing_finished(self, completed):
+        if self.sender() is not self.text_indexer or not completed:
+            return
+        self.text_indexer.wait()
+        if self.text_index_stale:
+            self.start_text_indexer()
+        else:
+            self.status_bar.showMessage(f'{len(self.file_items)} dosya bulundu | Arama dizini hazır')
+    
+    def start_folder_search(self):
+        # Dizin hazır değilse dizinlenmemiş dosyalar doğrudan taranır
+        pattern = self.search_entry.text()
+        if not pattern or self.text_index is None:
+            return
+        if self.regex_check.isChecked():
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                QMessageBox.warning(self, "Hata", f"Geçersiz düzenli ifade: {e}")
+                return
+        
+        if self.folder_searcher is not None and self.folder_searcher.isRunning():
+            self.folder_searcher.stop()
+            self.folder_searcher.wait()
+        self.search_results.clear()
+        self.search_started = time.perf_counter()
+        
+        self.folder_searcher = FolderSearcher(
+            self.text_index, pattern, self.regex_check.isChecked(),
+            self.case_check.isChecked(), list(self.folder_index.entries)
+        )
+        self.folder_searcher.results_found.connect(self.add_search_results)
+        self.folder_searcher.finished.connect(self.folder_search_finished)
+        self.folder_searcher.start()
+        self.status_bar.showMessage('Aranıyor...')
+    
+    def add_search_results(self, hits):
+        if self.sender() is not self.folder_searcher:
+            return
+        for file_name, line_number, column, line in hits:
+            relative_path = os.path.relpath(file_name, self.folder_path)
+            item = QListWidgetItem(f'{relative_path}:{line_number}: {line.strip()[:200]}')
+            item.setData(Qt.UserRole, (file_name, line_number, column))
+            self.search_results.addItem(item)
+    
+    def folder_search_finished(self, found):
+        if self.sender() is not self.folder_searcher:
+            return
+        elapsed = (time.perf_counter() - self.search_started) * 1000
+        self.status_bar.showMessage(f'{found} sonuç bulundu ({elapsed:.0f} ms)')
+    
+    def open_search_result(self, item):
+        file_name, line_number, column = item.data(Qt.UserRole)
+        if file_name == self.current_file_path and not self.is_loading():
+            self.go_to_location(line_number, column)
+            return
+        self.load_file(file_name)
+        self.pending_location = (line_number, column)
+    
+    def is_loading(self):
+        return any(
+            worker is not None and worker.isRunning()
+            for worker in (self.file_loader, self.line_indexer)
+        )
+    
+    def go_to_location(self, line_number, column):
+        if self.large_document is not None:
+            self.large_view.scroll_to(line_number - 1 - self.large_view.window_size() // 2)
+            block_number = line_number - 1 - self.large_view.first_line
+            editor = self.large_view.editor
+        else:
+            block_number = line_number - 1
+            editor = self.text_edit
+        
+        block = editor.document().findBlockByNumber(block_number)
+        if not block.isValid():
+            return
+        cursor = QTextCursor(block)
+        cursor.movePosition(QTextCursor.Right, QTextCursor.MoveAnchor, min(column, block.length() - 1))
+        editor.setTextCursor(cursor)
+        editor.centerCursor()
+        editor.setFocus()
+    
+    def apply_pending_location(self):
+        if self.pending_location is not None:
+            self.go_to_location(*self.pending_location)
+            self.pending_location = None
     
     def load_file(self, file_path=None):
         if not file_path:
@@ -339,57 +1740,324 @@ class TranslationTool(QMainWindow):
             )
         
         if file_path:
+            self.pending_location = None
+            # Bekleyen kaydın sonucu saved_hash'i önceki dosyanın özetine kurar;
+            # sıfırlama ondan sonra yapılır
+            self.wait_for_save()
+            self.saved_hash = None
+            self.stop_file_loader()
+            self.close_large_file()
             self.current_file_path = file_path
             self.text_edit.clear()
+            
+            file_type = os.path.splitext(file_path)[1]
+            self.highlighter.set_file_type(file_type)
+            self.large_highlighter.set_file_type(file_type)
+            self.segment_tracker.set_enabled(file_type.lower() in SEGMENT_FILE_TYPES)
+            
+            if os.path.getsize(file_path) >= LARGE_FILE_THRESHOLD:
+                self.open_large_file(file_path)
+                return
+            
+            self.editor_stack.setCurrentWidget(self.text_edit)
             self.progress_bar.show()
             self.progress_bar.setValue(0)
             
+            # Yükleme sırasında eklenen parçalar geri alma geçmişine yazılmaz
+            self.text_edit.setReadOnly(True)
+            self.text_edit.document().setUndoRedoEnabled(False)
+            
             self.file_loader = FileLoader(file_path)
             self.file_loader.progress.connect(self.update_progress)
+            self.file_loader.chunk_loaded.connect(self.append_loaded_text)
             self.file_loader.finished.connect(self.file_loading_finished)
             self.file_loader.start()
     
-    def load_selected_file(self, item):
-        if not self.folder_path:
+    def stop_file_loader(self):
+        if self.file_loader is not None and self.file_loader.isRunning():
+            self.file_loader.chunk_loaded.disconnect()
+            self.file_loader.finished.disconnect()
+            self.file_loader.requestInterruption()
+            self.file_loader.wait()
+        self.file_loader = None
+    
+    def open_large_file(self, file_path):
+        # Dosya belleğe eşlenir; ilk satırlar hemen gösterilir, dizin arka planda
+        # tamamlanınca düzenleme açılır
+        self.close_find_bar()
+        try:
+            self.large_document = LargeDocument(file_path)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Dosya açılırken hata oluştu: {str(e)}")
+            return
+        
+        self.large_view.set_document(self.large_document)
+        self.editor_stack.setCurrentWidget(self.large_view)
+        self.save_button.setEnabled(False)
+        self.translate_button.setEnabled(True)
+        self.find_button.setEnabled(False)
+        self.start_line_indexer()
+    
+    def start_line_indexer(self):
+        self.progress_bar.show()
+        self.progress_bar.setValue(0)
+        self.large_view.set_editable(False)
+        
+        self.line_indexer = LineIndexer(self.large_document)
+        self.line_indexer.progress.connect(self.update_index_progress)
+        self.line_indexer.finished.connect(self.line_indexing_finished)
+        self.line_indexer.start()
+    
+    def update_index_progress(self, value):
+        self.progress_bar.setValue(value)
+        self.status_bar.showMessage(f'Satırlar dizinleniyor... %{value}')
+        self.large_view.refresh()
+    
+    def line_indexing_finished(self, completed):
+        if self.sender() is not self.line_indexer:
+            return
+        self.progress_bar.hide()
+        if not completed:
             return
         
-        file_path = os.path.join(self.folder_path, item.text())
-        if os.path.exists(file_path):
+        self.large_view.refresh()
+        self.large_view.set_editable(True)
+        self.save_button.setEnabled(True)
+        
+        file_size = os.path.getsize(self.current_file_path) / (1024 * 1024)  # MB
+        self.status_bar.showMessage(
+            f'Dosya: {os.path.basename(self.current_file_path)} | '
+            f'Boyut: {file_size:.1f} MB | '
+            f'Satır: {self.large_document.line_count()} | '
+            f'Büyük dosya görünümü'
+        )
+        self.apply_pending_location()
+    
+    def close_large_file(self):
+        if self.line_indexer is not None:
+            self.line_indexer.stop()
+            self.line_indexer.wait()
+            self.line_indexer = None
+        if self.large_document is not None:
+            self.large_view.set_document(None)
+            self.large_document.close()
+            self.large_document = None
+        self.editor_stack.setCurrentWidget(self.text_edit)
+    
+    def load_selected_file(self, item):
+        file_path = item.data(Qt.UserRole)
+        if file_path and os.path.exists(file_path):
             self.load_file(file_path)
     
-    def save_file(self):
+    def save_file(self, autosave=False):
+        # Kayıt arka planda yapılır; sürerken gelen istek bittiğinde tekrarlanır
+        if self.save_worker is not None:
+            self.save_requested = self.save_requested or not autosave
+            return
+        if self.is_loading():
+            if not autosave:
+                self.status_bar.showMessage('Dosya yüklenirken kaydedilemez')
+            return
+        
         if not self.current_file_path:
+            if autosave:
+                return
             self.current_file_path, _ = QFileDialog.getSaveFileName(
                 self, 'Dosyayı Kaydet', '', 
                 'Metin Dosyası (*.txt);;Tüm Dosyalar (*)'
             )
         
-        if self.current_file_path:
+        if self.current_file_path and self.large_document is not None:
+            self.save_large_file(autosave)
+        elif self.current_file_path:
+            # Arayüzde yalnızca kirli bloklar okunur; birleştirme, kodlama, özet
+            # ve yazma işçidedir
+            self.save_revision = self.text_edit.document().revision()
+            self.save_worker = SaveWorker(
+                self.current_file_path, self.document_mirror.snapshot(), self.saved_hash, autosave
+            )
+            self.save_worker.finished.connect(self.file_saved)
+            self.save_worker.start()
+            self.status_bar.showMessage('Kaydediliyor...')
+    
+    def save_large_file(self, autosave=False):
+        # Değişmeyen satırlar eşlenmiş dosyadan kopyalanır. Yazma sürerken
+        # düzenleme kapalıdır; kayıttan sonra dosya yeniden eşlendiği için satır
+        # dizini de yeniden kurulur.
+        self.large_view.commit_window()
+        if not self.large_document.modified and self.current_file_path == self.large_document.file_path:
+            if not autosave:
+                self.status_bar.showMessage('Değişiklik yok, dosya yazılmadı')
+            return
+        
+        self.large_view.set_editable(False)
+        self.save_button.setEnabled(False)
+        self.save_worker = LargeSaveWorker(self.large_document, self.current_file_path, autosave)
+        self.save_worker.finished.connect(self.file_saved)
+        self.save_worker.start()
+        self.status_bar.showMessage('Kaydediliyor...')
+    
+    def file_saved(self):
+        if self.sender() is not self.save_worker:
+            return
+        self.save_worker.wait()
+        self.apply_save_result(self.save_worker)
+    
+    def wait_for_save(self):
+        # Kayıt yarıda bırakılmaz: dosya değiştirilmeden ya da pencere kapanmadan
+        # önce beklenir ve sonucu hemen uygulanır
+        while self.save_worker is not None:
+            worker = self.save_worker
+            worker.wait()
+            self.apply_save_result(worker)
+    
+    def apply_save_result(self, worker):
+        self.save_worker = None
+        prefix = 'Otomatik kayıt: ' if worker.autosave else ''
+        
+        if isinstance(worker, LargeSaveWorker) and not worker.error:
             try:
-                with open(self.current_file_path, "w", encoding="utf-8") as file:
-                    content = self.text_edit.toPlainText()
-                    file.write(content)
-                self.status_bar.showMessage('Dosya kaydedildi')
-                QMessageBox.information(self, "Başarılı", "Değişiklikler kaydedildi.")
+                self.large_document.replace(worker.temp_file, worker.file_path)
             except Exception as e:
-                self.status_bar.showMessage('Dosya kaydedilemedi')
-                QMessageBox.critical(self, "Hata", f"Dosya kaydedilirken hata oluştu: {str(e)}")
+                worker.error = str(e)
+            else:
+                self.large_view.load_window()
+                self.start_line_indexer()
+        
+        if worker.error:
+            self.status_bar.showMessage(prefix + 'Dosya kaydedilemedi')
+            if isinstance(worker, LargeSaveWorker):
+                self.large_view.set_editable(True)
+                self.save_button.setEnabled(True)
+            if not worker.autosave:
+                QMessageBox.critical(self, "Hata", f"Dosya kaydedilirken hata oluştu: {worker.error}")
+        elif isinstance(worker, SaveWorker):
+            if worker.file_path == self.current_file_path:
+                self.saved_hash = worker.content_hash
+                # Kayıt sürerken yapılan düzenlemeler kirli kalır
+                if self.text_edit.document().revision() == self.save_revision:
+                    self.text_edit.document().setModified(False)
+            if worker.written:
+                self.status_bar.showMessage(prefix + f'Dosya kaydedildi ({time.strftime("%H:%M:%S")})')
+            else:
+                self.status_bar.showMessage(prefix + 'Değişiklik yok, dosya yazılmadı')
+        else:
+            self.status_bar.showMessage(prefix + f'Dosya kaydedildi ({time.strftime("%H:%M:%S")})')
+        
+        if self.save_requested:
+            self.save_requested = False
+            self.save_file()
+    
+    def toggle_autosave(self, checked):
+        if checked:
+            self.autosave_timer.start()
+        else:
+            self.autosave_timer.stop()
+    
+    def autosave(self):
+        # Yalnızca kaydedilmiş bir dosyanın değişen içeriği yazılır
+        if not self.current_file_path or self.save_worker is not None:
+            return
+        if self.large_document is not None:
+            modified = self.large_document.editable and self.large_view.is_modified()
+        else:
+            # Kirli blok yoksa (ör. düzenlemeler geri alındı) yazılacak bir şey yoktur
+            modified = self.text_edit.document().isModified() and self.document_mirror.dirty_count() > 0
+        if modified:
+            self.save_file(autosave=True)
+    
+    def closeEvent(self, event):
+        self.save_requested = False
+        self.wait_for_save()
+        self.stop_search_worker()
+        self.stop_folder_indexer()
+        self.stop_file_loader()
+        self.stop_translation_worker()
+        self.close_large_file()
+        if self.translator is not None:
+            self.translator.backend.close()
+            self.translator.memory.close()
+        super().closeEvent(event)
+    
+    def translation_service(self):
+        # Servis ortam değişkenleriyle ayarlanmamışsa None döner (bkz.
+        # ceviri_bellegi.backend_from_environment); bellek ilk kullanımda açılır
+        if self.translator is None:
+            backend = backend_from_environment()
+            if backend is None:
+                return None
+            try:
+                memory = TranslationMemory()
+            except (OSError, sqlite3.Error) as e:
+                backend.close()
+                self.status_bar.showMessage(f'Çeviri belleği açılamadı: {e}')
+                return None
+            self.translator = Translator(backend, memory)
+        return self.translator
     
     def translate_selection(self):
-        cursor = self.text_edit.textCursor()
+        cursor = self.active_editor().textCursor()
         selected_text = cursor.selectedText()
         
-        if selected_text:
+        if not selected_text:
+            QMessageBox.warning(self, "Hata", "Çevrilecek metin seçilmedi.")
+            return
+        if self.translation_worker is not None and self.translation_worker.isRunning():
+            return
+        
+        translator = self.translation_service()
+        if translator is None:
+            # Servis yok: metin panoya kopyalanır ve DeepL'de hazır açılır
             pyperclip.copy(selected_text)
-            url = "https://www.deepl.com/translator#en/tr/"
-            webbrowser.open(url)
-            QTimer.singleShot(2000, self.auto_paste_deepl)
+            text = selected_text.replace('\u2029', '\n')
+            webbrowser.open("https://www.deepl.com/translator#en/tr/" + urllib.parse.quote(text, safe=''))
             self.status_bar.showMessage('Çeviri için DeepL açıldı')
-        else:
-            QMessageBox.warning(self, "Hata", "Çevrilecek metin seçilmedi.")
+            return
+        
+        # Seçimdeki her satır ayrı bir segmenttir; sonuç aynı seçimin yerine yazılır
+        self.translation_cursor = QTextCursor(cursor)
+        self.translation_source = selected_text
+        self.translation_worker = TranslationWorker(translator, selected_text.split('\u2029'))
+        self.translation_worker.progress.connect(self.update_translation_progress)
+        self.translation_worker.finished.connect(self.translation_finished)
+        self.translation_worker.start()
+        self.translate_button.setEnabled(False)
+        self.status_bar.showMessage('Çevriliyor...')
+    
+    def update_translation_progress(self, value):
+        self.status_bar.showMessage(f'Çevriliyor... %{value}')
+    
+    def translation_finished(self, results, error):
+        if self.sender() is not self.translation_worker:
+            return
+        self.translation_worker.wait()
+        self.translation_worker = None
+        self.translate_button.setEnabled(True)
+        cursor = self.translation_cursor
+        self.translation_cursor = None
+        
+        if error:
+            QMessageBox.critical(self, "Hata", f"Çeviri başarısız oldu: {error}")
+            return
+        if cursor.selectedText() != self.translation_source:
+            # Çeviri sürerken seçim düzenlendi ya da başka bir dosya açıldı
+            self.status_bar.showMessage('Seçim değiştiği için çeviri uygulanmadı')
+            return
+        
+        cursor.insertText('\n'.join(text for text, _, _ in results))
+        translated = sum(origin is not None for _, origin, _ in results)
+        memory = sum(origin == ORIGIN_MEMORY for _, origin, _ in results)
+        fuzzy = sum(origin == ORIGIN_FUZZY for _, origin, _ in results)
+        message = f'{translated} satır çevrildi | Bellekten: {memory}'
+        if fuzzy:
+            message += f' | Benzer eşleşme (kontrol edin): {fuzzy}'
+        self.status_bar.showMessage(message)
     
-    def auto_paste_deepl(self):
-        pyperclip.paste()
+    def stop_translation_worker(self):
+        if self.translation_worker is not None and self.translation_worker.isRunning():
+            self.translation_worker.stop()
+            self.translation_worker.wait()
+        self.translation_worker = None
 
 if __name__ == "__main__":
     app = QApplication([])
@@ -0,0 +1,251 @@
+import os
+import mmap
+import array
+import shutil
+import operator
+import tempfile
+import threading
+import itertools
+
+# Çok büyük metin dosyaları için tembel görüntüleme. Dosya belleğe eşlenir (mmap),
+# satır başlangıçları arka planda seyrek bir dizine yazılır ve yalnızca istenen
+# satırlar çözülür. Düzenlemeler satır düzeyinde bir parça tablosunda (piece table)
+# birikir; kaydedilirken değişmeyen kısımlar doğrudan dosyadan kopyalanır.
+
+# Bu boyuttan büyük dosyalar çeviri aracında pencereli görünümde açılır
+LARGE_FILE_THRESHOLD = 64 * 1024 * 1024
+
+INDEX_CHUNK_SIZE = 16 * 1024 * 1024
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Her bu kadar satırdan birinin bayt konumu dizinde tutulur
+LINE_INDEX_STRIDE = 64
+
+class LineIndex:
+    # Seyrek satır dizini: aradaki satırlara en yakın kontrol noktasından ileri
+    # taranarak ulaşılır. 2 GB'lık bir dosyada bile dizin birkaç MB'tır.
+    # build() ayrı bir iş parçacığında çalışırken dizinlenmiş satırlar okunabilir.
+    def __init__(self, data, stride=LINE_INDEX_STRIDE):
+        self.data = data
+        self.size = len(data)
+        self.stride = stride
+        self.checkpoints = array.array('q', [0])
+        self.newlines = 0
+        self.indexed_bytes = 0
+        self.finished = self.size == 0
+        self._lock = threading.Lock()
+
+    def build(self, progress=None, stop_event=None, chunk_size=INDEX_CHUNK_SIZE):
+        position = 0
+        while position < self.size:
+            if stop_event is not None and stop_event.is_set():
+                return False
+            chunk = self.data[position:position + chunk_size]
+            parts = chunk.split(b'\n')
+
+            # k. satır sonundan sonraki satır, önceki parçaların uzunlukları + k + 1
+            # konumunda başlar; hesap C seviyesinde, satır başına Python döngüsü yok
+            starts = map(
+                operator.add,
+                itertools.accumulate(map(len, parts[:-1])),
+                itertools.count(position + 1)
+            )
+            first = -(self.newlines + 1) % self.stride
+            with self._lock:
+                self.checkpoints.extend(itertools.islice(starts, first, None, self.stride))
+                self.newlines += len(parts) - 1
+                self.indexed_bytes = position + len(chunk)
+            position += len(chunk)
+            if progress is not None:
+                progress(self.indexed_bytes, self.size)
+
+        with self._lock:
+            self.finished = True
+        return True
+
+    def line_count(self):
+        # Dizinleme sürerken yalnızca sonu görülmüş satırlar sayılır
+        with self._lock:
+            return self.newlines + 1 if self.finished else self.newlines
+
+    def line_offset(self, line):
+        checkpoint, rest = divmod(line, self.stride)
+        offset = self.checkpoints[checkpoint]
+        for _ in range(rest):
+            offset = self.data.find(b'\n', offset) + 1
+        return offset
+
+    def line_range(self, first, count):
+        # [first, first + count) satırlarının satır sonları dahil bayt aralığı
+        start = self.line_offset(first)
+        end = start
+        for _ in range(count):
+            newline = self.data.find(b'\n', end)
+            if newline < 0:
+                return start, self.size
+            end = newline + 1
+        return start, end
+
+    def read_lines(self, first, count):
+        start, end = self.line_range(first, count)
+        # Aralık satır sonuyla bitiyorsa split fazladan boş bir öğe üretir
+        return self.data[start:end].split(b'\n')[:count]
+
+class LargeDocument:
+    # mmap + LineIndex üzerinde düzenlenebilir belge. Düzenleme dizin bitince
+    # başlar; parçalar [satırlar, başlangıç, uzunluk] biçimindedir ve satırlar None
+    # ise dosyadaki satırları, değilse eklenen satır listesini gösterir.
+    def __init__(self, file_path, encoding='utf-8'):
+        self.file_path = file_path
+        self.encoding = encoding
+        self._open()
+
+    def _open(self):
+        self.file = open(self.file_path, 'rb')
+        size = os.fstat(self.file.fileno()).st_size
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        self.index = LineIndex(self.data)
+        self.pieces = None
+        self._line_count = None
+        self.modified = False
+
+        # Eklenen satırlar dosyanın satır sonu biçimiyle yazılır
+        newline = self.data.find(b'\n', 0, 1024 * 1024)
+        self.newline = '\r\n' if newline > 0 and self.data[newline - 1:newline] == b'\r' else '\n'
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.file.close()
+
+    @property
+    def editable(self):
+        return self.index.finished
+
+    def line_count(self):
+        if self.pieces is None:
+            return self.index.line_count()
+        return self._line_count
+
+    def _decode(self, lines):
+        return [
+            (line[:-1] if line.endswith(b'\r') else line).decode(self.encoding, 'replace')
+            for line in lines
+        ]
+
+    def get_lines(self, first, count):
+        if self.pieces is None:
+            count = max(0, min(count, self.index.line_count() - first))
+            return self._decode(self.index.read_lines(first, count)) if count else []
+
+        result = []
+        position = 0
+        for lines, start, length in self.pieces:
+            if len(result) >= count:
+                break
+            if position + length <= first:
+                position += length
+                continue
+            offset = max(first - position, 0)
+            taken = min(length - offset, count - len(result))
+            if lines is None:
+                result.extend(self._decode(self.index.read_lines(start + offset, taken)))
+            else:
+                result.extend(lines[start + offset:start + offset + taken])
+            position += length
+        return result
+
+    def _split(self, line):
+        # line'da başlayan parçanın sırasını döndürür, gerekirse parçayı ikiye böler
+        position = 0
+        for number, (lines, start, length) in enumerate(self.pieces):
+            if position == line:
+                return number
+            if line < position + length:
+                offset = line - position
+                self.pieces[number:number + 1] = [
+                    [lines, start, offset],
+                    [lines, start + offset, length - offset],
+                ]
+                return number + 1
+            position += length
+        return len(self.pieces)
+
+    def replace_lines(self, first, count, new_lines):
+        if not self.editable:
+            raise RuntimeError("Dosya dizinlenirken düzenlenemez")
+        if self.pieces is None:
+            self._line_count = self.index.line_count()
+            self.pieces = [[None, 0, self._line_count]]
+
+        first_piece = self._split(first)
+        last_piece = self._split(first + count)
+        self.pieces[first_piece:last_piece] = (
+            [[list(new_lines), 0, len(new_lines)]] if new_lines else []
+        )
+        self._line_count += len(new_lines) - count
+        self.modified = True
+
+    def _write(self, target):
+        pieces = self.pieces if self.pieces is not None else [[None, 0, self.index.line_count()]]
+        newline = self.newline.encode(self.encoding)
+        file_lines = self.index.line_count()
+        for number, (lines, start, length) in enumerate(pieces):
+            last = number == len(pieces) - 1
+            if lines is not None:
+                target.write(newline.join(line.encode(self.encoding) for line in lines[start:start + length]))
+                if not last:
+                    target.write(newline)
+                continue
+
+            # Değişmemiş satırlar satır sonlarıyla birlikte olduğu gibi kopyalanır
+            begin, end = self.index.line_range(start, length)
+            reaches_end = start + length == file_lines
+            if last and not reaches_end:
+                # Belgenin son satırı: dosyada ardından gelen satır sonu yazılmaz
+                end -= len(newline) if self.data[end - len(newline):end] == newline else 1
+            for position in range(begin, end, COPY_CHUNK_SIZE):
+                target.write(self.data[position:min(end, position + COPY_CHUNK_SIZE)])
+            if not last and reaches_end:
+                target.write(newline)
+
+    def write_temp(self, file_path=None):
+        # Belge hedefin klasöründe geçici bir dosyaya yazılır ve adı döndürülür.
+        # Eşleme ve parçalar yalnızca okunur: düzenleme kapalıyken arka planda
+        # çalışabilir, bu sırada görünüm satır okumaya devam eder.
+        file_path = file_path or self.file_path
+        folder = os.path.dirname(os.path.abspath(file_path))
+        fd, temp_file = tempfile.mkstemp(dir=folder, prefix='.', suffix='.tmp')
+        try:
+            with open(fd, 'wb') as f:
+                self._write(f)
+                f.flush()
+                os.fsync(f.fileno())
+            shutil.copymode(self.file_path, temp_file)
+        except BaseException:
+            os.unlink(temp_file)
+            raise
+        return temp_file
+
+    def replace(self, temp_file, file_path=None):
+        # write_temp çıktısını yerine taşır; eşleme taşımadan önce kapatılır
+        # (Windows'ta açık eşlemenin üzerine yazılamaz), ardından yeniden açılır
+        file_path = file_path or self.file_path
+        try:
+            self.close()
+            os.replace(temp_file, file_path)
+        except BaseException:
+            if os.path.exists(temp_file):
+                os.unlink(temp_file)
+            if self.file.closed:
+                # Taşıma başarısız oldu, özgün dosya yerinde: düzenlemeler korunur
+                pieces, line_count = self.pieces, self._line_count
+                self._open()
+                self.index.build()
+                self.pieces, self._line_count, self.modified = pieces, line_count, True
+            raise
+        self.file_path = file_path
+        self._open()
+
+    def save(self, file_path=None):
+        self.replace(self.write_temp(file_path), file_path)
@@ -0,0 +1,411 @@
+import os
+import json
+import math
+import time
+import array
+import sqlite3
+import threading
+import http.client
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+# Çeviri servisi arka ucu ve yerel çeviri belleği. Segmentler önce SQLite
+# belleğinde tam ve benzer (karakter trigramı, Dice katsayısı) eşleşme olarak
+# aranır; kalanlar yinelenenlerden arındırılıp toplu isteklerle ve paralel,
+# yeniden kullanılan bağlantılarla servise gönderilir. Qt'ye bağımlı değildir.
+
+MEMORY_FOLDER = os.path.join(os.path.expanduser('~'), '.ceviri_araci')
+MEMORY_NAME = 'ceviri_bellegi.sqlite3'
+
+SOURCE_LANG = 'EN'
+TARGET_LANG = 'TR'
+
+# Bu oranın altındaki benzer eşleşmeler kullanılmaz
+FUZZY_THRESHOLD = 0.85
+
+# Tek istekteki segment sayısı ve toplam karakter sınırı (DeepL: 50 metin, 128 KB)
+MAX_BATCH_SIZE = 50
+MAX_BATCH_CHARS = 30000
+MAX_WORKERS = 4
+
+REQUEST_TIMEOUT = 30
+RETRY_COUNT = 3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# İlk yeniden denemeden önceki bekleme (saniye); her denemede iki katına çıkar
+RETRY_DELAY = 0.5
+
+ORIGIN_MEMORY = 'memory'
+ORIGIN_FUZZY = 'fuzzy'
+ORIGIN_SERVICE = 'service'
+
+def normalize(text):
+    return ' '.join(text.split())
+
+def ngrams(text):
+    # Karakter trigramları, her biri 3 x 21 bitlik tek bir tamsayı olarak (SQLite
+    # INTEGER anahtarları metinden hızlı karşılaştırılır). Büyük/küçük harf ve
+    # boşluk farkları benzerliği etkilemez; metin baştan ve sondan doldurulur.
+    codes = [ord(char) for char in f" {normalize(text).casefold()} "]
+    return {(a << 42) | (b << 21) | c for a, b, c in zip(codes, codes[1:], codes[2:])}
+
+def _chunks(items, size=500):
+    # SQLite'ın parametre sınırı aşılmasın diye IN listeleri parça parça sorgulanır
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+class TranslationMemory:
+    # Dil çifti başına kaynak -> hedef segmentleri. grams tablosu benzer arama
+    # için trigram -> segment ters dizinidir; segmentin trigram sayısı Dice
+    # katsayısında ve aday uzunluklarını sınırlamada kullanılır. gram_counts her
+    # trigramın kaç segmentte geçtiğini tutar: adaylar yalnızca sorgunun en
+    # seyrek trigramlarından toplanır, sık trigramların uzun listeleri okunmaz.
+    # Adayların benzerliği segmentte saklanan trigram kümesiyle hesaplanır.
+    def __init__(self, path=None, source_lang=SOURCE_LANG, target_lang=TARGET_LANG):
+        if path is None:
+            os.makedirs(MEMORY_FOLDER, exist_ok=True)
+            path = os.path.join(MEMORY_FOLDER, MEMORY_NAME)
+        self.path = path
+        self.source_lang = source_lang
+        self.target_lang = target_lang
+        self._lock = threading.Lock()
+        # Arayüzde oluşturulur, çeviri iş parçacığında kullanılır; erişim kilitlidir
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute('PRAGMA journal_mode=WAL')
+            self.connection.execute('''
+                CREATE TABLE IF NOT EXISTS segments (
+                    id INTEGER PRIMARY KEY,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    normalized TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    gram_count INTEGER NOT NULL,
+                    grams BLOB NOT NULL,
+                    UNIQUE (source_lang, target_lang, normalized)
+                )
+            ''')
+            self.connection.execute('''
+                CREATE TABLE IF NOT EXISTS grams (
+                    gram INTEGER NOT NULL,
+                    segment_id INTEGER NOT NULL,
+                    PRIMARY KEY (gram, segment_id)
+                ) WITHOUT ROWID
+            ''')
+            self.connection.execute('''
+                CREATE TABLE IF NOT EXISTS gram_counts (
+                    gram INTEGER PRIMARY KEY,
+                    count INTEGER NOT NULL
+                ) WITHOUT ROWID
+            ''')
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+    def __len__(self):
+        with self._lock:
+            return self.connection.execute(
+                'SELECT COUNT(*) FROM segments WHERE source_lang = ? AND target_lang = ?',
+                (self.source_lang, self.target_lang)
+            ).fetchone()[0]
+
+    def add_many(self, pairs):
+        # (kaynak, hedef) çiftleri tek işlemde yazılır; var olan kaynağın çevirisi güncellenir
+        with self._lock, self.connection:
+            for source, target in pairs:
+                normalized = normalize(source)
+                if not normalized:
+                    continue
+                grams = ngrams(source)
+                row = self.connection.execute(
+                    'SELECT id FROM segments WHERE source_lang = ? AND target_lang = ? AND normalized = ?',
+                    (self.source_lang, self.target_lang, normalized)
+                ).fetchone()
+                if row is not None:
+                    self.connection.execute(
+                        'UPDATE segments SET source = ?, target = ? WHERE id = ?',
+                        (source, target, row[0])
+                    )
+                    continue
+                segment_id = self.connection.execute(
+                    'INSERT INTO segments (source_lang, target_lang, normalized, source, target, gram_count, grams) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (self.source_lang, self.target_lang, normalized, source, target, len(grams),
+                     array.array('q', grams).tobytes())
+                ).lastrowid
+                self.connection.executemany(
+                    'INSERT INTO grams (gram, segment_id) VALUES (?, ?)',
+                    ((gram, segment_id) for gram in grams)
+                )
+                self.connection.executemany(
+                    'INSERT INTO gram_counts (gram, count) VALUES (?, 1) '
+                    'ON CONFLICT (gram) DO UPDATE SET count = count + 1',
+                    ((gram,) for gram in grams)
+                )
+
+    def add(self, source, target):
+        self.add_many([(source, target)])
+
+    def _fuzzy(self, text, threshold):
+        grams = ngrams(text)
+        count = len(grams)
+        # Dice >= t için adayın trigram sayısı [n·t/(2-t), n·(2-t)/t] aralığında ve
+        # ortak trigram sayısı en az t·(n + en küçük aday)/2'dir. Bu kadar ortak
+        # trigramı olan her aday, sorgunun herhangi n - ortak + 1 trigramından
+        # birini içermek zorundadır; bunlar en seyrek olanlardan seçilir. Sınırlar
+        # kayan nokta hatası tam eşikteki adayları (n=23, t=0.85 -> 17.000000000000004)
+        # elemesin diye genişletilir.
+        low = count * threshold / (2 - threshold) - 1e-9
+        high = count * (2 - threshold) / threshold + 1e-9
+        required = math.ceil(threshold * (count + low) / 2 - 1e-9)
+
+        frequencies = {}
+        for part in _chunks(list(grams)):
+            frequencies.update(self.connection.execute(
+                f'SELECT gram, count FROM gram_counts WHERE gram IN ({",".join("?" * len(part))})', part
+            ))
+        # Hiç görülmemiş trigramlar aday getirmez ama öneki boşa doldurur; atlanır
+        seen = sorted((gram for gram in grams if gram in frequencies), key=frequencies.get)
+        prefix_size = count - required + 1 - (count - len(seen))
+        if prefix_size <= 0:
+            return None
+        prefix = seen[:prefix_size]
+
+        # CROSS JOIN birleştirme sırasını sabitler: önce trigramın kısa listesi
+        # okunur, segmentler birincil anahtarla alınır
+        best = None
+        candidates = set()
+        for part in _chunks(prefix):
+            rows = self.connection.execute(
+                f'''SELECT s.id, s.target, s.gram_count, s.grams FROM grams g
+                    CROSS JOIN segments s ON s.id = g.segment_id
+                    WHERE g.gram IN ({",".join("?" * len(part))})
+                      AND s.source_lang = ? AND s.target_lang = ?
+                      AND s.gram_count BETWEEN ? AND ?''',
+                (*part, self.source_lang, self.target_lang, low, high)
+            )
+            for segment_id, target, gram_count, blob in rows:
+                if segment_id in candidates:
+                    continue
+                candidates.add(segment_id)
+                score = 2 * len(grams.intersection(array.array('q', blob))) / (count + gram_count)
+                if score >= threshold and (best is None or score > best[1]):
+                    best = (target, score)
+        return best
+
+    def lookup(self, text, threshold=FUZZY_THRESHOLD):
+        # (çeviri, benzerlik) ya da None; tam eşleşmenin benzerliği 1.0'dır
+        normalized = normalize(text)
+        if not normalized:
+            return None
+        with self._lock:
+            row = self.connection.execute(
+                'SELECT target FROM segments WHERE source_lang = ? AND target_lang = ? AND normalized = ?',
+                (self.source_lang, self.target_lang, normalized)
+            ).fetchone()
+            if row is not None:
+                return row[0], 1.0
+            if threshold >= 1:
+                return None
+            return self._fuzzy(text, threshold)
+
+class TranslationBackend:
+    # Arka uçlar translate_batch() yazar; toplu isteklere bölme ve paralel
+    # çalıştırma burada yapılır. İşçi iş parçacıkları çağrılar arasında korunur,
+    # böylece arka ucun iş parçacığına bağlı bağlantıları yeniden kullanılır.
+    max_batch_size = MAX_BATCH_SIZE
+    max_batch_chars = MAX_BATCH_CHARS
+
+    def __init__(self, max_workers=MAX_WORKERS):
+        self.max_workers = max_workers
+        self._executor = None
+
+    def translate_batch(self, texts, source_lang, target_lang):
+        raise NotImplementedError
+
+    def batches(self, texts):
+        batch = []
+        length = 0
+        for text in texts:
+            if batch and (len(batch) >= self.max_batch_size or length + len(text) > self.max_batch_chars):
+                yield batch
+                batch = []
+                length = 0
+            batch.append(text)
+            length += len(text)
+        if batch:
+            yield batch
+
+    def translate(self, texts, source_lang=SOURCE_LANG, target_lang=TARGET_LANG, stop_event=None):
+        # (toplu istekteki metinler, çeviriler) çiftlerini tamamlandıkça döndürür
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='ceviri')
+
+        def run(batch):
+            if stop_event is not None and stop_event.is_set():
+                return batch, None
+            return batch, self.translate_batch(batch, source_lang, target_lang)
+
+        futures = [self._executor.submit(run, batch) for batch in self.batches(texts)]
+        try:
+            for future in futures:
+                batch, translations = future.result()
+                if translations is None:
+                    return
+                yield batch, translations
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+class HTTPTranslationBackend(TranslationBackend):
+    # DeepL v2 JSON biçimi: {"text": [...], "source_lang", "target_lang"} ->
+    # {"translations": [{"text": ...}]}. Her işçi iş parçacığı kendi kalıcı
+    # (keep-alive) bağlantısını kullanır.
+    retry_delay = RETRY_DELAY
+
+    def __init__(self, url, auth_key=None, max_workers=MAX_WORKERS, timeout=REQUEST_TIMEOUT):
+        super().__init__(max_workers)
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https') or not parts.hostname:
+            raise ValueError(f"Geçersiz servis adresi: {url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path or '/'
+        if parts.query:
+            self.path += '?' + parts.query
+        self.auth_key = auth_key
+        self.timeout = timeout
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection_class = (
+                http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+            )
+            connection = self._local.connection = connection_class(
+                self.host, self.port, timeout=self.timeout
+            )
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    def _request(self, body):
+        headers = {'Content-Type': 'application/json'}
+        if self.auth_key:
+            headers['Authorization'] = f'DeepL-Auth-Key {self.auth_key}'
+
+        for attempt in range(RETRY_COUNT + 1):
+            connection = self._connection()
+            try:
+                connection.request('POST', self.path, body, headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError):
+                # Sunucu boşta kalan bağlantıyı kapatmış olabilir: yeniden bağlanılır
+                connection.close()
+                if attempt == RETRY_COUNT:
+                    raise
+                continue
+
+            if response.status == 200:
+                return data
+            if response.status in RETRY_STATUSES and attempt < RETRY_COUNT:
+                time.sleep(self.retry_delay * 2 ** attempt)
+                continue
+            raise RuntimeError(f"Çeviri servisi hata döndürdü: {response.status} {response.reason}")
+
+    def translate_batch(self, texts, source_lang, target_lang):
+        body = json.dumps({
+            'text': texts,
+            'source_lang': source_lang,
+            'target_lang': target_lang,
+        }, ensure_ascii=False).encode('utf-8')
+        try:
+            translations = [item['text'] for item in json.loads(self._request(body))['translations']]
+        except (ValueError, KeyError, TypeError):
+            raise RuntimeError("Çeviri servisinin yanıtı çözümlenemedi")
+        if len(translations) != len(texts):
+            raise RuntimeError("Çeviri servisi eksik yanıt döndürdü")
+        return translations
+
+    def close(self):
+        super().close()
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections = []
+        self._local = threading.local()
+
+def backend_from_environment():
+    # CEVIRI_SERVIS_URL verilmişse o adres, yoksa DEEPL_AUTH_KEY ile DeepL API'si
+    # kullanılır. İkisi de yoksa None döner ve çeviri tarayıcıda yapılır.
+    url = os.environ.get('CEVIRI_SERVIS_URL')
+    auth_key = os.environ.get('DEEPL_AUTH_KEY')
+    if not url and auth_key:
+        # Ücretsiz anahtarlar ":fx" ile biter ve ayrı bir adres kullanır
+        url = ('https://api-free.deepl.com/v2/translate' if auth_key.endswith(':fx')
+               else 'https://api.deepl.com/v2/translate')
+    if not url:
+        return None
+    return HTTPTranslationBackend(url, auth_key)
+
+class Translator:
+    # Bellek + arka uç. translate() girdiyle aynı sırada (çeviri, kaynak, benzerlik)
+    # üçlüleri döndürür; kaynak ORIGIN_* değerlerinden biridir, boş segmentlerde
+    # None'dır. Baştaki ve sondaki boşluklar korunur, aynı metin servise bir kez
+    # gönderilir. İptal edilirse çevrilemeyen segmentlerin yerinde None kalır.
+    def __init__(self, backend, memory, fuzzy_threshold=FUZZY_THRESHOLD):
+        self.backend = backend
+        self.memory = memory
+        self.fuzzy_threshold = fuzzy_threshold
+
+    def translate(self, texts, stop_event=None, progress=None):
+        results = [None] * len(texts)
+        pending = {}
+        for number, text in enumerate(texts):
+            core = text.strip()
+            if not core:
+                results[number] = (text, None, 1.0)
+                continue
+            pending.setdefault(core, []).append(number)
+
+        def store(core, translation, origin, score):
+            for number in pending[core]:
+                text = texts[number]
+                prefix = text[:len(text) - len(text.lstrip())]
+                suffix = text[len(text.rstrip()):]
+                results[number] = (prefix + translation + suffix, origin, score)
+
+        misses = []
+        for core in pending:
+            found = self.memory.lookup(core, self.fuzzy_threshold)
+            if found is None:
+                misses.append(core)
+            else:
+                store(core, found[0], ORIGIN_MEMORY if found[1] >= 1 else ORIGIN_FUZZY, found[1])
+
+        done = len(pending) - len(misses)
+        if progress is not None:
+            progress(done, len(pending))
+        if misses:
+            for batch, translations in self.backend.translate(
+                misses, self.memory.source_lang, self.memory.target_lang, stop_event
+            ):
+                # Her toplu yanıt hemen belleğe yazılır; iptal edilse de kaybolmaz
+                self.memory.add_many(zip(batch, translations))
+                for core, translation in zip(batch, translations):
+                    store(core, translation, ORIGIN_SERVICE, 1.0)
+                done += len(batch)
+                if progress is not None:
+                    progress(done, len(pending))
+        return results
@@ -0,0 +1,115 @@
+import sys
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Çeviri servisinin yerel taklidi. HTTPTranslationBackend ile aynı DeepL v2 JSON
+# biçimini konuşur ve metni "[TR] metin" biçiminde geri döndürür; gerçek servise
+# istek atmadan toplu istekleri, bağlantı yeniden kullanımını ve gecikmeyi
+# denemek için kullanılır:
+#
+#     python ceviri_sunucusu.py --port 8765 --delay 0.2
+#     CEVIRI_SERVIS_URL=http://127.0.0.1:8765/v2/translate python asdas.py
+
+class StubTranslationHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1: bağlantılar istekler arasında açık kalır
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        server = self.server
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            data = json.loads(self.rfile.read(length))
+            texts = data['text']
+            target_lang = data.get('target_lang', 'TR')
+        except (ValueError, KeyError, TypeError):
+            self._reply(400, {'message': 'Geçersiz istek'})
+            return
+
+        if server.auth_key and self.headers.get('Authorization') != f'DeepL-Auth-Key {server.auth_key}':
+            self._reply(403, {'message': 'Yetkisiz'})
+            return
+
+        with server.lock:
+            status = server.failures.pop(0) if server.failures else None
+            if status is not None:
+                server.failure_count += 1
+        if status is not None:
+            self._reply(status, {'message': 'Geçici hata'})
+            return
+
+        with server.lock:
+            server.request_count += 1
+            server.text_count += len(texts)
+            server.connections.add(self.client_address)
+        if server.delay:
+            time.sleep(server.delay)
+        self._reply(200, {'translations': [
+            {'detected_source_language': data.get('source_lang', 'EN'), 'text': f'[{target_lang}] {text}'}
+            for text in texts
+        ]})
+
+    def _reply(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+class StubTranslationServer(ThreadingHTTPServer):
+    # request_count, text_count ve connections (istemci adresleri) sayaçları
+    # toplu istek ve bağlantı yeniden kullanımının ölçülmesi içindir. failures
+    # listesine eklenen durum kodları (ör. 429, 503) sıradaki isteklere sırayla
+    # döndürülür; yeniden denemeler failure_count ile sayılır.
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), delay=0, auth_key=None, verbose=False):
+        super().__init__(address, StubTranslationHandler)
+        self.delay = delay
+        self.auth_key = auth_key
+        self.verbose = verbose
+        self.lock = threading.Lock()
+        self.request_count = 0
+        self.text_count = 0
+        self.connections = set()
+        self.failures = []
+        self.failure_count = 0
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}/v2/translate'
+
+    def start(self):
+        # Arka planda çalıştırır; shutdown() ile durdurulur
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yerel taklit çeviri servisi")
+    parser.add_argument('--host', default='127.0.0.1', help="Dinlenecek adres")
+    parser.add_argument('--port', type=int, default=8765, help="Dinlenecek port")
+    parser.add_argument('--delay', type=float, default=0, help="İstek başına yapay gecikme (saniye)")
+    parser.add_argument('--auth-key', help="Beklenen DeepL-Auth-Key değeri")
+    args = parser.parse_args(argv)
+
+    server = StubTranslationServer((args.host, args.port), args.delay, args.auth_key, verbose=True)
+    print(f"Taklit çeviri servisi: {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
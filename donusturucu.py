@@ -0,0 +1,1503 @@
+import os
+import re
+import sys
+import csv
+import array
+import bisect
+import json
+import time
+import mmap
+import queue
+import pickle
+import threading
+import codecs
+import contextlib
+import hashlib
+import heapq
+import shutil
+import fnmatch
+import tempfile
+import argparse
+import itertools
+import collections
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+# Qt gerektirmeyen dönüştürme çekirdeği; arayüz ve komut satırı bunu kullanır
+
+# Bu boyuttan büyük dosyalar parça parça okunur, bellek kullanımı sabit kalır
+STREAM_THRESHOLD = 64 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Desteklenen kodlamalar; tek baytlı olanlarda bytes.translate hızlı yolu kullanılabilir
+ENCODINGS = ('utf-8', 'latin-1', 'cp1252', 'cp1254')
+SINGLE_BYTE_ENCODINGS = ('latin-1', 'cp1252', 'cp1254')
+
+# Artımlı dönüştürmede çıktı klasörüne yazılan kayıt dosyası
+MANIFEST_NAME = '.donusturucu_manifest.json'
+
+# Adlandırılmış eşleştirme profilleri ve derlenmiş motor önbelleğinin klasörü
+PROFILE_FOLDER = os.path.join(os.path.expanduser('~'), '.karakter_donusturucu')
+
+# Önbellek anahtarına katılır; ConversionEngine'in alanları değiştiğinde artırılır,
+# böylece eski sürümlerin pickle dosyaları yüklenmez
+ENGINE_CACHE_VERSION = 1
+
+# Varsayılan karakter eşleştirmeleri
+DEFAULT_MAPPINGS = {
+    'Ğ': 'ß', 'ş': 'é', 'İ': 'Î',
+    'Ş': 'É', 'ğ': 'ê', 'Ç': 'Á',
+    'ı': 'ì'
+}
+
+# Eşleştirme düzenleyicisinde 'U+011E' veya 'U+0049 U+0307' biçimindeki girdiler
+CODE_POINT_PATTERN = re.compile(r'\s*(?:[Uu]\+[0-9A-Fa-f]{1,6}\s*)+')
+
+def parse_code_points(text):
+    # 'U+XXXX' dizisini karaktere çevirir; başka her metin olduğu gibi döner
+    if not CODE_POINT_PATTERN.fullmatch(text):
+        return text
+    code_points = [int(code, 16) for code in re.findall(r'[Uu]\+([0-9A-Fa-f]+)', text)]
+    if any(code > sys.maxunicode or 0xD800 <= code <= 0xDFFF for code in code_points):
+        raise ValueError(f"Geçersiz kod noktası: {text}")
+    return ''.join(map(chr, code_points))
+
+def format_code_points(text):
+    return ' '.join(f"U+{ord(char):04X}" for char in text)
+
+def find_mapping_problems(rows):
+    # rows: (kaynak, hedef) satırları. Satır numarası -> [(tür, açıklama)] döner:
+    #  - 'duplicate': aynı kaynak birden fazla satırda (son satır geçerli olur)
+    #  - 'conflict': aynı hedefe birden fazla kaynak gidiyor, ters dönüştürülemez
+    #  - 'cycle': kaynak -> hedef zinciri başa dönüyor (ör. a→b, b→a takası). Yalnızca
+    #    bilgi içindir: dönüştürme tek geçişli olduğundan takaslar doğru uygulanır.
+    problems = {}
+    rows_by_source = {}
+    rows_by_target = {}
+    for row, (source, target) in enumerate(rows):
+        if source and target:
+            rows_by_source.setdefault(source, []).append(row)
+            rows_by_target.setdefault(target, []).append(row)
+            
+    for source, source_rows in rows_by_source.items():
+        if len(source_rows) > 1:
+            for row in source_rows:
+                problems.setdefault(row, []).append(
+                    ('duplicate', f"{source!r} {len(source_rows)} satırda tanımlı")
+                )
+                
+    for target, target_rows in rows_by_target.items():
+        sources = {rows[row][0] for row in target_rows}
+        if len(sources) > 1:
+            message = f"{target!r} hedefine {len(sources)} kaynak gidiyor, ters dönüştürülemez"
+            for row in target_rows:
+                problems.setdefault(row, []).append(('conflict', message))
+                
+    # Her kaynağın tek hedefi olduğu için her düğümden bir kez yürümek yeterlidir.
+    # Kendisine giden (a→a) satırlar hiçbir şeyi değiştirmez, döngü sayılmaz.
+    mappings = {source: rows[source_rows[-1]][1] for source, source_rows in rows_by_source.items()}
+    mappings = {source: target for source, target in mappings.items() if source != target}
+    visited = {}
+    for start in mappings:
+        path = []
+        node = start
+        while node in mappings and node not in visited:
+            visited[node] = start
+            path.append(node)
+            node = mappings[node]
+        if node in mappings and visited[node] == start:
+            cycle = path[path.index(node):]
+            message = "takas/döngü (tek geçişte doğru dönüştürülür): " + \
+                ' → '.join(repr(char) for char in cycle + [node])
+            for char in cycle:
+                for row in rows_by_source[char]:
+                    problems.setdefault(row, []).append(('cycle', message))
+    return problems
+
+def invert_mappings(mappings):
+    # Hedef -> kaynak tablosu kurar. Aynı hedefe giden birden fazla kaynak ya da
+    # boş hedef tersine çevrilemez; bunlar tabloya alınmaz, ayrıca döndürülür.
+    sources_by_target = {}
+    for source, target in mappings.items():
+        if source:
+            sources_by_target.setdefault(target, []).append(source)
+            
+    inverse = {}
+    conflicts = {}
+    for target, sources in sources_by_target.items():
+        if len(sources) == 1 and target:
+            inverse[target] = sources[0]
+        else:
+            conflicts[target] = sources
+    return inverse, conflicts
+
+class ConversionEngine:
+    # Eşleştirme tablosu bir kez derlenir ve eşzamanlı uygulanır: değiştirilen metin
+    # tekrar taranmadığı için a→b, b→c zincirlenmez. Yöntem tabloya göre seçilir
+    # (ölçümler için donusturucu_benchmark.py):
+    #  - Anahtarlar birbirini etkileyemiyorsa (bkz. _is_independent) sıralı str.replace;
+    #    sonuç tek geçişle aynıdır ve CPython'da az anahtarda en hızlı yoldur.
+    #  - Tüm anahtarlar tek karakterse str.translate tablosu.
+    #  - Diğer durumlarda anahtarların önek ağacından (trie) üretilen ve en uzun
+    #    eşleşmeyi seçen regex ile tek geçiş.
+    
+    # Bu sayıdan fazla anahtarda str.translate sıralı str.replace'ten hızlıdır
+    replace_limit = 64
+    
+    def __init__(self, mappings):
+        self.mappings = {source: target for source, target in mappings.items() if source}
+        self.max_key_length = max((len(source) for source in self.mappings), default=0)
+        self.replacements = None
+        self.table = None
+        self.pattern_source = None
+        self._pattern = None
+        self._byte_tables = {}
+        
+        if self.mappings:
+            self.pattern_source = '(' + self._build_trie_pattern(self.mappings) + ')'
+            
+        if len(self.mappings) <= self.replace_limit and self._is_independent(self.mappings):
+            self.strategy = 'replace'
+            self.replacements = sorted(self.mappings.items(), key=lambda item: -len(item[0]))
+        elif self.max_key_length <= 1:
+            self.strategy = 'translate'
+            self.table = str.maketrans(self.mappings)
+        else:
+            self.strategy = 'pattern'
+            
+    @property
+    def pattern(self):
+        # Regex yalnızca gerektiğinde derlenir; replace/translate yolunda hiç derlenmeyebilir
+        if self._pattern is None and self.pattern_source is not None:
+            self._pattern = re.compile(self.pattern_source)
+        return self._pattern
+        
+    def __getstate__(self):
+        # Profil önbelleği ve süreç havuzu için: derlenmiş regex saklanmaz, kaynağı saklanır
+        state = self.__dict__.copy()
+        state['_pattern'] = None
+        return state
+        
+    @staticmethod
+    def _is_independent(mappings):
+        # Sıralı değiştirme ancak hiçbir değiştirme yeni bir eşleşme oluşturamıyor ve
+        # anahtarların geçtiği yerler çakışamıyorsa tek geçişle aynı sonucu verir
+        key_chars = set(''.join(mappings))
+        if any(char in key_chars for target in mappings.values() for char in target):
+            return False
+        
+        multi_char_keys = [key for key in mappings if len(key) > 1]
+        if not multi_char_keys:
+            return True
+        # Silinen metin iki yanını birleştirip yeni bir anahtar oluşturabilir
+        if not all(mappings.values()):
+            return False
+        for key in multi_char_keys:
+            for other in mappings:
+                if other == key:
+                    continue
+                if other in key:
+                    return False
+                # Bir anahtarın sonu diğerinin başıyla örtüşmemeli
+                if any(other.startswith(key[i:]) for i in range(1, len(key))):
+                    return False
+                if any(key.startswith(other[i:]) for i in range(1, len(other))):
+                    return False
+        return True
+            
+    def byte_table(self, input_encoding, encoding):
+        # İki kodlama da tek baytlıysa ve her anahtar/hedef tek bayta karşılık geliyorsa
+        # 256 baytlık bytes.translate tablosu döner, değilse None. Çıktı kodlamasında
+        # yazılamayan karakterlerin baytları da döner; bunlar dosyada varsa hata verilir.
+        key = (input_encoding, encoding)
+        if key not in self._byte_tables:
+            self._byte_tables[key] = self._build_byte_table(input_encoding, encoding)
+        return self._byte_tables[key]
+        
+    def _build_byte_table(self, input_encoding, encoding):
+        if input_encoding not in SINGLE_BYTE_ENCODINGS or encoding not in SINGLE_BYTE_ENCODINGS:
+            return None
+        if self.max_key_length > 1:
+            return None
+            
+        table = bytearray(range(256))
+        invalid = bytearray()
+        for byte in range(256):
+            try:
+                char = bytes([byte]).decode(input_encoding)
+            except UnicodeDecodeError:
+                # Kodlamada tanımsız bayt: metin yolunda da okunamaz
+                invalid.append(byte)
+                continue
+            target = self.mappings.get(char, char)
+            try:
+                encoded = target.encode(encoding)
+            except UnicodeEncodeError:
+                if char in self.mappings:
+                    return None
+                invalid.append(byte)
+                continue
+            if len(encoded) != 1:
+                return None
+            table[byte] = encoded[0]
+        return bytes(table), bytes(invalid)
+        
+    def unencodable_targets(self, encoding):
+        # Çıktı kodlamasıyla yazılamayan hedefler (çalıştırmadan önce doğrulama için)
+        unencodable = []
+        for source, target in self.mappings.items():
+            try:
+                target.encode(encoding)
+            except UnicodeEncodeError:
+                unencodable.append((source, target))
+        return unencodable
+        
+    def inverse(self):
+        # Çözme (geri dönüştürme) motoru ve tersine çevrilemeyen eşleştirmeler
+        inverse, conflicts = invert_mappings(self.mappings)
+        return ConversionEngine(inverse), conflicts
+            
+    @staticmethod
+    def _build_trie_pattern(keys):
+        trie = {}
+        for key in keys:
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[''] = True
+            
+        def build(node):
+            terminal = '' in node
+            branches = []
+            chars = []
+            for char, child in sorted(node.items()):
+                if char == '':
+                    continue
+                if len(child) == 1 and '' in child:
+                    chars.append(char)
+                else:
+                    branches.append(re.escape(char) + build(child))
+                    
+            if chars:
+                if len(chars) == 1:
+                    branches.append(re.escape(chars[0]))
+                else:
+                    branches.append('[' + ''.join(re.escape(c) for c in chars) + ']')
+                    
+            if not branches:
+                return ''
+            if len(branches) == 1 and not terminal:
+                return branches[0]
+            pattern = '(?:' + '|'.join(branches) + ')'
+            # Anahtar burada bitebiliyorsa devamı isteğe bağlıdır; açgözlü '?' en uzun eşleşmeyi seçer
+            return pattern + '?' if terminal else pattern
+            
+        return build(trie)
+        
+    def convert(self, content):
+        if self.replacements is not None:
+            for source, target in self.replacements:
+                content = content.replace(source, target)
+            return content
+        if self.table is not None:
+            return content.translate(self.table)
+        if self.pattern_source is None:
+            return content
+        # split eşleşmeleri tek sıralı listede verir; hedefler C seviyesinde eşlenir
+        parts = self.pattern.split(content)
+        parts[1::2] = map(self.mappings.__getitem__, parts[1::2])
+        return ''.join(parts)
+        
+    def count(self, content):
+        # convert'in yapacağı değiştirmeleri anahtar başına sayar. Bağımsız ya da tek
+        # karakterli az sayıda anahtarda str.count doğrudan doğru sonucu verir.
+        if self.pattern_source is None:
+            return {}
+        if self.replacements is not None or (
+                self.max_key_length <= 1 and len(self.mappings) <= self.replace_limit):
+            counts = ((source, content.count(source)) for source in self.mappings)
+            return {source: count for source, count in counts if count}
+        return collections.Counter(self.pattern.findall(content))
+        
+    def count_bytes(self, data, input_encoding):
+        # Bayt yolundaki (bkz. byte_table) değiştirme sayıları: anahtar olmayan
+        # baytlar silinir, geriye kalan az sayıda bayt sayılır
+        sources = {}
+        for source in self.mappings:
+            try:
+                sources[source.encode(input_encoding)[0]] = source
+            except UnicodeEncodeError:
+                continue
+        others = bytes(byte for byte in range(256) if byte not in sources)
+        counts = collections.Counter(data.translate(None, others))
+        return {sources[byte]: count for byte, count in counts.items()}
+        
+    def convert_partial(self, content, final=False, counts=None):
+        # Akış modunda bir parçayı dönüştürür; sonraki parçayla birleşebilecek
+        # kuyruk (en fazla max_key_length - 1 karakter) dönüştürülmeden geri verilir.
+        # counts (Counter) verilirse dönüştürülen kısımdaki değiştirmeler eklenir.
+        if final or self.max_key_length <= 1:
+            if counts is not None:
+                counts.update(self.count(content))
+            return self.convert(content), ''
+            
+        limit = len(content) - self.max_key_length + 1
+        if limit <= 0:
+            return '', content
+            
+        # limit'ten önce başlayan her eşleşmenin en uzun hali bu parçanın içinde kalır
+        mappings = self.mappings
+        parts = []
+        position = 0
+        for match in self.pattern.finditer(content):
+            start = match.start()
+            if start >= limit:
+                break
+            parts.append(content[position:start])
+            parts.append(mappings[match.group()])
+            position = match.end()
+            if counts is not None:
+                counts[match.group()] += 1
+            
+        consumed = max(position, limit)
+        parts.append(content[position:consumed])
+        return ''.join(parts), content[consumed:]
+
+class FileStats:
+    # Tek dosyanın ölçümleri: bayt sayıları, aşama süreleri (saniye), anahtar başına
+    # değiştirme sayıları ve hata türü. Akış modunda süreler parça parça toplanır;
+    # değiştirmelerin sayılması dönüştürme süresine dahildir.
+    def __init__(self, input_file):
+        self.file = input_file
+        self.output = None
+        self.error = None
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.times = {'read': 0.0, 'convert': 0.0, 'write': 0.0}
+        self.counts = collections.Counter()
+        
+    @contextlib.contextmanager
+    def timing(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[stage] += time.perf_counter() - start
+            
+    def total_time(self):
+        return sum(self.times.values())
+        
+    def to_dict(self):
+        return {
+            'file': self.file,
+            'output': self.output,
+            'error': self.error,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'times': dict(self.times),
+            'counts': dict(self.counts),
+        }
+
+def _timing(stats, stage):
+    return stats.timing(stage) if stats is not None else contextlib.nullcontext()
+
+def _failure(input_file, error, stats=None):
+    if stats is not None:
+        stats.error = type(error).__name__
+    return input_file, False, str(error), stats
+
+def _read_umask():
+    # os.umask yalnızca değiştirerek okunabilir; iş parçacıkları arasında yarış
+    # olmasın diye modül yüklenirken bir kez okunur
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+_UMASK = _read_umask()
+
+@contextlib.contextmanager
+def atomic_output(output_file, mode='w', template_file=None, **kwargs):
+    # Çıktı önce aynı klasörde geçici dosyaya yazılır, diske işlenir ve bitince
+    # yerine taşınır; böylece yerinde dönüştürme de mümkündür ve çökmede bile
+    # yarım dosya kalmaz
+    output_folder = os.path.dirname(os.path.abspath(output_file))
+    fd, temp_file = tempfile.mkstemp(dir=output_folder, prefix='.', suffix='.tmp')
+    try:
+        with open(fd, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if template_file:
+            shutil.copymode(template_file, temp_file)
+        else:
+            # mkstemp dosyayı yalnızca sahibine açık (0600) oluşturur; yeni
+            # dosyalar open() ile oluşturulmuş gibi varsayılan izinleri alır
+            os.chmod(temp_file, 0o666 & ~_UMASK)
+        os.replace(temp_file, output_file)
+    except BaseException:
+        os.unlink(temp_file)
+        raise
+
+def convert_stream(input_file, output_file, engine, chunk_size=STREAM_CHUNK_SIZE,
+                   input_encoding='utf-8', encoding='utf-8', stats=None):
+    # Dosyayı sabit boyutlu parçalarla okur; çok baytlı karakterler artımlı
+    # çözücüde, parça sınırındaki çok karakterli anahtarlar kuyrukta bekletilir.
+    decoder = codecs.getincrementaldecoder(input_encoding)()
+    counts = stats.counts if stats is not None else None
+    with open(input_file, 'rb') as source, \
+            atomic_output(output_file, 'w', input_file, encoding=encoding, newline='') as target:
+        rest = ''
+        while True:
+            with _timing(stats, 'read'):
+                data = source.read(chunk_size)
+            final = not data
+            with _timing(stats, 'convert'):
+                converted, rest = engine.convert_partial(
+                    rest + decoder.decode(data, final), final, counts
+                )
+            with _timing(stats, 'write'):
+                target.write(converted)
+            if final:
+                break
+
+def convert_bytes(input_file, output_file, byte_table, chunk_size=STREAM_CHUNK_SIZE,
+                  stats=None, count=None):
+    # Tek baytlı kodlamalar arası hızlı yol: dosya belleğe eşlenir ve parçalar
+    # hiç str'ye çözülmeden bytes.translate ile dönüştürülür.
+    # count verilirse her parçanın değiştirme sayıları stats'a eklenir.
+    table, invalid = byte_table
+    with open(input_file, 'rb') as source, \
+            atomic_output(output_file, 'wb', input_file) as target:
+        size = os.fstat(source.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for start in range(0, size, chunk_size):
+                with _timing(stats, 'read'):
+                    chunk = data[start:start + chunk_size]
+                with _timing(stats, 'convert'):
+                    if invalid and len(chunk.translate(None, invalid)) != len(chunk):
+                        offset = start + next(i for i, byte in enumerate(chunk) if byte in invalid)
+                        raise UnicodeError(
+                            f"{offset}. bayttaki karakter seçilen kodlamalarla dönüştürülemiyor"
+                        )
+                    if count is not None:
+                        stats.counts.update(count(chunk))
+                    chunk = chunk.translate(table)
+                with _timing(stats, 'write'):
+                    target.write(chunk)
+
+def get_output_file(input_file, save_folder=None, root=None):
+    # root verilirse klasör yapısı kaydedilecek klasörde aynen oluşturulur
+    if save_folder and root:
+        return os.path.join(save_folder, os.path.relpath(input_file, root))
+    file_name = os.path.basename(input_file)
+    if save_folder:
+        return os.path.join(save_folder, file_name)
+    file_path = os.path.dirname(input_file)
+    return os.path.join(file_path, file_name)
+
+def convert_single_file(input_file, engine, save_folder=None, stream=None, root=None,
+                        input_encoding='utf-8', encoding='utf-8', stats=None):
+    # stats (FileStats) verilirse ölçümler dönüştürme sırasında doldurulur
+    output_file = get_output_file(input_file, save_folder, root)
+    if save_folder:
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    if stats is not None:
+        stats.bytes_in = os.path.getsize(input_file)
+        
+    byte_table = engine.byte_table(input_encoding, encoding)
+    if byte_table is not None:
+        count = None
+        if stats is not None:
+            count = lambda chunk: engine.count_bytes(chunk, input_encoding)
+        convert_bytes(input_file, output_file, byte_table, stats=stats, count=count)
+        
+    else:
+        # stream belirtilmezse büyük dosyalar otomatik olarak akış modunda işlenir
+        if stream is None:
+            stream = os.path.getsize(input_file) >= STREAM_THRESHOLD
+        if stream:
+            convert_stream(input_file, output_file, engine,
+                           input_encoding=input_encoding, encoding=encoding, stats=stats)
+        else:
+            # Satır sonları akış modundaki gibi olduğu gibi korunur
+            with _timing(stats, 'read'):
+                with open(input_file, 'r', encoding=input_encoding, newline='') as file:
+                    content = file.read()
+                    
+            with _timing(stats, 'convert'):
+                if stats is not None:
+                    stats.counts.update(engine.count(content))
+                content = engine.convert(content)
+                
+            with _timing(stats, 'write'):
+                with atomic_output(output_file, 'w', input_file, encoding=encoding, newline='') as file:
+                    file.write(content)
+                    
+    if stats is not None:
+        stats.output = output_file
+        stats.bytes_out = os.path.getsize(output_file)
+    return output_file
+
+def mapping_fingerprint(mappings, *settings):
+    # Çıktıyı etkileyen ayarlar (ör. kodlamalar) da parmak izine katılır
+    data = json.dumps([mappings, settings], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+def file_hash(file_name):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_name, 'rb') as f:
+        for data in iter(lambda: f.read(STREAM_CHUNK_SIZE), b''):
+            digest.update(data)
+    return digest.hexdigest()
+
+class ConversionManifest:
+    # Çıktı klasöründe her kaynak dosyanın boyutunu, mtime değerini ve içerik özetini
+    # tutar. Eşleştirme tablosu değişirse kayıtlar geçersiz sayılır ve tüm dosyalar
+    # yeniden dönüştürülür.
+    def __init__(self, folder, mappings, input_encoding='utf-8', encoding='utf-8'):
+        self.folder = folder
+        self.path = os.path.join(folder, MANIFEST_NAME)
+        self.fingerprint = mapping_fingerprint(mappings, input_encoding, encoding)
+        self.entries = {}
+        self.skipped = 0
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('mapping') == self.fingerprint:
+                self.entries = data.get('files', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+            
+    def _key(self, input_file):
+        try:
+            return os.path.relpath(os.path.abspath(input_file), os.path.abspath(self.folder))
+        except ValueError:
+            # Windows'ta farklı sürücülerdeki dosyalar
+            return os.path.abspath(input_file)
+            
+    def needs_conversion(self, input_file, output_file):
+        entry = self.entries.get(self._key(input_file))
+        if entry is None or not os.path.exists(output_file):
+            return True
+            
+        stat = os.stat(input_file)
+        if stat.st_size != entry['size']:
+            return True
+        if stat.st_mtime_ns == entry['mtime']:
+            return False
+            
+        # Yalnızca mtime değişmişse içerik özetine bak
+        if file_hash(input_file) != entry['hash']:
+            return True
+        entry['mtime'] = stat.st_mtime_ns
+        return False
+        
+    def pending_files(self, files, save_folder=None, root=None):
+        # Dosya listesini tembel süzer; atlanan dosyalar self.skipped'da sayılır
+        for input_file in files:
+            if self.needs_conversion(input_file, get_output_file(input_file, save_folder, root)):
+                yield input_file
+            else:
+                self.skipped += 1
+        
+    def record(self, input_file):
+        # Yerinde dönüştürmede kaynak artık dönüştürülmüş içeriktir, bu yüzden
+        # kayıt dönüştürmeden sonra alınır
+        stat = os.stat(input_file)
+        self.entries[self._key(input_file)] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'hash': file_hash(input_file),
+        }
+        
+    def save(self):
+        with atomic_output(self.path, 'w', encoding='utf-8') as f:
+            json.dump({'mapping': self.fingerprint, 'files': self.entries}, f, ensure_ascii=False)
+
+def _mismatch_offsets(original, decoded, limit=10, block_size=4096):
+    # Farklı karakterlerin konumlarını bloklar halinde karşılaştırarak bulur
+    # Uzunluk farklıysa ilk farktan sonrası kaymıştır, yalnızca ilk konum anlamlıdır
+    same_length = len(original) == len(decoded)
+    offsets = []
+    length = min(len(original), len(decoded))
+    for start in range(0, length, block_size):
+        end = min(start + block_size, length)
+        if original[start:end] == decoded[start:end]:
+            continue
+        for offset in range(start, end):
+            if original[offset] != decoded[offset]:
+                offsets.append(offset)
+                if len(offsets) >= limit or not same_length:
+                    return offsets
+    if not same_length:
+        offsets.append(length)
+    return offsets
+
+def verify_single_file(input_file, engine, inverse_engine, input_encoding='utf-8'):
+    # Dosyayı bellekte kodlayıp geri çözer; hiçbir şey yazılmaz.
+    # Uyuşmazlık varsa (satır, sütun, karakter) konumlarının listesi döner.
+    with open(input_file, 'r', encoding=input_encoding, newline='') as file:
+        original = file.read()
+        
+    decoded = inverse_engine.convert(engine.convert(original))
+    if decoded == original:
+        return []
+        
+    positions = []
+    for offset in _mismatch_offsets(original, decoded):
+        line = original.count('\n', 0, offset) + 1
+        column = offset - original.rfind('\n', 0, offset)
+        positions.append((line, column, offset))
+    return positions
+
+def scan_matches(content, engine, base=0):
+    # Kuru çalıştırma dizini: convert ile aynı tek geçişli regex bölmesiyle her
+    # anahtarın eşleşme konumları (karakter) çıkarılır: {anahtar: array('q')}.
+    # Eşleşmelerin başlangıçları parça uzunluklarının birikimli toplamıdır; base
+    # içeriğin dosyadaki konumudur.
+    if engine.pattern_source is None:
+        return {}
+    parts = engine.pattern.split(content)
+    starts = itertools.islice(itertools.accumulate(map(len, parts), initial=base), 1, None, 2)
+    positions = collections.defaultdict(list)
+    for key, start in zip(parts[1::2], starts):
+        positions[key].append(start)
+    return {key: array.array('q', offsets) for key, offsets in positions.items()}
+
+def count_file(input_file, engine, input_encoding='utf-8'):
+    # Klasör önizlemesi için yalnızca sayılar; konum dizini dosya açılınca çıkarılır
+    with open(input_file, 'r', encoding=input_encoding, newline='') as file:
+        return dict(engine.count(file.read()))
+
+class FilePreview:
+    # Tek dosyanın kuru çalıştırma görünümü: eşleşme konumları bir kez çıkarılır,
+    # değişen satırlar sayfa sayfa (satır no, önce, sonra) olarak okunur. Dosya
+    # satır sınırında bloklarla okunup taranır; her C çağrısı tek blokla sınırlı
+    # kaldığından arka planda kurulurken arayüz iş parçacığını bekletmez.
+    block_size = STREAM_CHUNK_SIZE
+    
+    def __init__(self, input_file, engine, input_encoding='utf-8'):
+        self.engine = engine
+        self.positions = {}
+        self.lines = []
+        self.changed_lines = []
+        # Satır sonu içeren bir anahtar blok sınırını aşabilir; dosya tek blokta taranır
+        block_size = -1 if any('\n' in key for key in engine.mappings) else self.block_size
+        offset = 0
+        rest = ''
+        with open(input_file, 'r', encoding=input_encoding, newline='') as file:
+            while True:
+                data = file.read(block_size)
+                content = rest + data
+                rest = ''
+                if not content:
+                    break
+                # Son blok ve tek blokta okunan dosya olduğu gibi taranır; diğer
+                # bloklar son satır sonunda kesilir, kalan sonraki bloğa eklenir
+                partial = bool(data) and block_size > 0
+                if partial:
+                    cut = content.rfind('\n') + 1
+                    if not cut:
+                        rest = content
+                        continue
+                    content, rest = content[:cut], content[cut:]
+                    
+                block = content.split('\n')
+                if partial:
+                    # Satır sonuyla biten bloğun sondaki boş parçası satır değildir
+                    block.pop()
+                first_line = len(self.lines)
+                self.lines.extend(block)
+                if engine.pattern_source is None:
+                    continue
+                for key, offsets in scan_matches(content, engine, offset).items():
+                    self.positions.setdefault(key, array.array('q')).extend(offsets)
+                offset += len(content)
+                if block_size < 0:
+                    self._add_changed_lines(content, block, first_line)
+                else:
+                    search = engine.pattern.search
+                    self.changed_lines.extend(
+                        first_line + number for number, line in enumerate(block) if search(line)
+                    )
+                    
+    def _add_changed_lines(self, content, block, first_line):
+        # Eşleşme satır sonunu aşabiliyorsa satırlar eşleşmelerin başladığı yerden bulunur
+        line_starts = list(itertools.accumulate((len(line) + 1 for line in block), initial=0))
+        self.changed_lines.extend(sorted({
+            first_line + bisect.bisect_right(line_starts, match.start()) - 1
+            for match in self.engine.pattern.finditer(content)
+        }))
+        
+    def counts(self):
+        return {key: len(offsets) for key, offsets in self.positions.items()}
+        
+    def page(self, start=0, count=50):
+        return [
+            (line + 1, self.lines[line].rstrip('\r'), self.engine.convert(self.lines[line]).rstrip('\r'))
+            for line in self.changed_lines[start:start + count]
+        ]
+
+def format_counts(counts):
+    return ', '.join(f"{key!r}: {count}" for key, count in counts.items())
+
+def format_mismatches(positions):
+    return ', '.join(
+        f"satır {line}, sütun {column} (karakter {offset})" for line, column, offset in positions
+    )
+
+class RunStatistics:
+    # Bir çalıştırmadaki FileStats kayıtlarını toplar; özet arayüzde ve komut
+    # satırında gösterilir, JSON (özet + dosyalar) veya CSV (dosya başına satır)
+    # olarak dışa aktarılabilir
+    def __init__(self, mappings=()):
+        self.keys = list(mappings)
+        self.files = []
+        self.failed = 0
+        self.errors = collections.Counter()
+        self.counts = collections.Counter()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.times = {'read': 0.0, 'convert': 0.0, 'write': 0.0}
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        
+    def add(self, stats):
+        self.files.append(stats)
+        if stats.error is not None:
+            self.failed += 1
+            self.errors[stats.error] += 1
+        self.counts.update(stats.counts)
+        self.bytes_in += stats.bytes_in
+        self.bytes_out += stats.bytes_out
+        for stage, seconds in stats.times.items():
+            self.times[stage] += seconds
+            
+    def finish(self):
+        self.elapsed = time.perf_counter() - self.started
+        
+    def summary(self, slowest=5):
+        elapsed = self.elapsed or time.perf_counter() - self.started
+        # Aşama süreleri işçiler arasında toplanır; oranları darboğazı gösterir
+        io_time = self.times['read'] + self.times['write']
+        return {
+            'files': len(self.files),
+            'failed': self.failed,
+            'errors': dict(self.errors),
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+            'seconds': elapsed,
+            'files_per_second': len(self.files) / elapsed if elapsed else 0.0,
+            'mb_per_second': self.bytes_in / elapsed / (1024 * 1024) if elapsed else 0.0,
+            'times': dict(self.times),
+            'bound': 'io' if io_time > self.times['convert'] else 'cpu',
+            'slowest': [
+                {'file': stats.file, 'seconds': stats.total_time()}
+                for stats in heapq.nlargest(slowest, self.files, key=FileStats.total_time)
+            ],
+            'counts': {key: self.counts[key] for key in self.keys or self.counts},
+            'unused_keys': [key for key in self.keys if not self.counts[key]],
+        }
+        
+    def format_summary(self, slowest=5):
+        summary = self.summary(slowest)
+        megabyte = 1024 * 1024
+        lines = [
+            f"📊 {summary['files']} dosya ({summary['failed']} hatalı), "
+            f"{summary['bytes_in'] / megabyte:.2f} MB okundu, "
+            f"{summary['bytes_out'] / megabyte:.2f} MB yazıldı, {summary['seconds']:.2f} s",
+            f"Hız: {summary['files_per_second']:.1f} dosya/s, {summary['mb_per_second']:.2f} MB/s",
+        ]
+        total_time = sum(summary['times'].values())
+        if total_time:
+            read, convert, write = (
+                summary['times'][stage] / total_time * 100 for stage in ('read', 'convert', 'write')
+            )
+            bound = "G/Ç ağırlıklı" if summary['bound'] == 'io' else "İşlemci ağırlıklı"
+            lines.append(
+                f"Süre dağılımı: okuma %{read:.0f}, dönüştürme %{convert:.0f}, yazma %{write:.0f} ({bound})"
+            )
+        if summary['slowest']:
+            lines.append("En yavaş dosyalar: " + ', '.join(
+                f"{os.path.basename(item['file'])} ({item['seconds']:.3f} s)"
+                for item in summary['slowest']
+            ))
+        if summary['counts']:
+            lines.append("Değiştirmeler: " + ', '.join(
+                f"{key!r}: {count}" for key, count in summary['counts'].items()
+            ))
+        if summary['unused_keys']:
+            lines.append("Hiç kullanılmayan anahtarlar: " + ', '.join(
+                repr(key) for key in summary['unused_keys']
+            ))
+        if summary['errors']:
+            lines.append("Hatalar: " + ', '.join(
+                f"{error}: {count}" for error, count in summary['errors'].items()
+            ))
+        return lines
+        
+    def export(self, file_name):
+        # Uzantı .csv ise dosya başına satır, değilse JSON yazılır
+        if file_name.lower().endswith('.csv'):
+            with atomic_output(file_name, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow([
+                    'file', 'output', 'error', 'bytes_in', 'bytes_out',
+                    'read', 'convert', 'write', 'replacements',
+                ])
+                for stats in self.files:
+                    writer.writerow([
+                        stats.file, stats.output or '', stats.error or '',
+                        stats.bytes_in, stats.bytes_out,
+                        f"{stats.times['read']:.6f}", f"{stats.times['convert']:.6f}",
+                        f"{stats.times['write']:.6f}", sum(stats.counts.values()),
+                    ])
+            return
+            
+        data = {
+            'summary': self.summary(),
+            'files': [stats.to_dict() for stats in self.files],
+        }
+        with atomic_output(file_name, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+
+class ProfileStore:
+    # Oyun/yazı tipi başına adlandırılmış eşleştirme tabloları. Her tablo
+    # save_mappings ile aynı JSON biçiminde profiles/<ad>.json olarak saklanır;
+    # derlenmiş motoru tablonun özetiyle birlikte cache/<ad>.pickle dosyasında
+    # tutulur. Aynı profil ikinci kez açıldığında motor yeniden kurulmaz. Diske
+    # yalnızca kayıtlı profillerin motorları yazılır; profil silinince ya da
+    # üzerine yazılınca önbellek kaydı da silinir ya da yenilenir.
+    def __init__(self, folder=PROFILE_FOLDER):
+        self.profile_folder = os.path.join(folder, 'profiles')
+        self.cache_folder = os.path.join(folder, 'cache')
+        self._mappings = {}
+        self._engines = {}
+        
+    def _profile_file(self, name):
+        name = name.strip()
+        if not name or name != os.path.basename(name) or name.startswith('.') \
+                or any(char in name for char in '\\/:*?"<>|'):
+            raise ValueError(f"Geçersiz profil adı: {name!r}")
+        return os.path.join(self.profile_folder, name + '.json')
+        
+    def _cache_file(self, name):
+        return os.path.join(self.cache_folder, name.strip() + '.pickle')
+        
+    def names(self):
+        try:
+            return sorted(
+                f[:-len('.json')] for f in os.listdir(self.profile_folder) if f.endswith('.json')
+            )
+        except OSError:
+            return []
+            
+    def load(self, name):
+        if name not in self._mappings:
+            self._mappings[name] = load_mappings(self._profile_file(name))
+        return dict(self._mappings[name])
+        
+    def save(self, name, mappings):
+        profile_file = self._profile_file(name)
+        os.makedirs(self.profile_folder, exist_ok=True)
+        with atomic_output(profile_file, 'w', encoding='utf-8') as f:
+            json.dump(mappings, f, ensure_ascii=False, indent=4)
+        name = name.strip()
+        self._mappings[name] = dict(mappings)
+        self._engines.pop(name, None)
+        # Motoru hemen derleyip önbelleğe al, profil ilk açılışta da hızlı yüklensin
+        self._write_cache(name, mapping_fingerprint(mappings, ENGINE_CACHE_VERSION),
+                          ConversionEngine(mappings))
+        
+    def delete(self, name):
+        os.remove(self._profile_file(name))
+        name = name.strip()
+        self._mappings.pop(name, None)
+        self._engines.pop(name, None)
+        try:
+            os.remove(self._cache_file(name))
+        except OSError:
+            pass
+            
+    def _write_cache(self, name, key, engine):
+        self._engines[name] = (key, engine)
+        try:
+            os.makedirs(self.cache_folder, exist_ok=True)
+            with atomic_output(self._cache_file(name), 'wb') as f:
+                pickle.dump((key, engine), f, pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+            
+    def profile_engine(self, name):
+        # Önce bellekteki, sonra diskteki önbelleğe bakılır; ikisinde de yoksa
+        # derlenip önbelleğe yazılır. Kayıt, özeti profilin tablosuyla ve önbellek
+        # sürümüyle eşleşmiyorsa (eski sürümün ya da eski tablonun motoru) kullanılmaz.
+        mappings = self.load(name)
+        name = name.strip()
+        key = mapping_fingerprint(mappings, ENGINE_CACHE_VERSION)
+        cached = self._engines.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+            
+        try:
+            with open(self._cache_file(name), 'rb') as f:
+                cached_key, engine = pickle.load(f)
+            if cached_key == key and isinstance(engine, ConversionEngine):
+                self._engines[name] = (key, engine)
+                return engine
+        except Exception:
+            pass
+            
+        engine = ConversionEngine(mappings)
+        self._write_cache(name, key, engine)
+        return engine
+        
+    def engine(self, mappings):
+        # Kayıtlı bir profilin tablosuysa onun motoru döner; kaydedilmemiş tablolar
+        # yalnızca bellekte derlenir, diske yazılmaz
+        key = mapping_fingerprint(mappings, ENGINE_CACHE_VERSION)
+        for cached_key, engine in self._engines.values():
+            if cached_key == key:
+                return engine
+        return ConversionEngine(mappings)
+
+# Süreç havuzundaki her işçinin kendi motoru; eşleştirmeler işçi başına bir kez aktarılır
+_process_engine = None
+_process_inverse_engine = None
+_process_input_encoding = 'utf-8'
+_process_save_folder = None
+_process_instrument = False
+_process_options = {}
+
+def _init_conversion_process(mappings, save_folder, instrument, options):
+    global _process_engine, _process_save_folder, _process_instrument, _process_options
+    _process_engine = ConversionEngine(mappings)
+    _process_save_folder = save_folder
+    _process_instrument = instrument
+    _process_options = options
+
+def _init_verify_process(mappings, input_encoding):
+    global _process_engine, _process_inverse_engine, _process_input_encoding
+    _process_engine = ConversionEngine(mappings)
+    _process_inverse_engine, _ = _process_engine.inverse()
+    _process_input_encoding = input_encoding
+
+def _init_preview_process(mappings, input_encoding):
+    global _process_engine, _process_input_encoding
+    _process_engine = ConversionEngine(mappings)
+    _process_input_encoding = input_encoding
+
+def _convert_file(input_file, engine, save_folder, instrument, options):
+    # Sonuç: (dosya, başarılı, çıktı dosyası veya hata, FileStats veya None)
+    stats = FileStats(input_file) if instrument else None
+    try:
+        output_file = convert_single_file(input_file, engine, save_folder, stats=stats, **options)
+        return input_file, True, output_file, stats
+    except Exception as e:
+        return _failure(input_file, e, stats)
+
+def _convert_chunk(files):
+    return [
+        _convert_file(
+            input_file, _process_engine, _process_save_folder, _process_instrument, _process_options
+        )
+        for input_file in files
+    ]
+
+def _verify_chunk(files):
+    results = []
+    for input_file in files:
+        try:
+            positions = verify_single_file(
+                input_file, _process_engine, _process_inverse_engine, _process_input_encoding
+            )
+            results.append((input_file, not positions, format_mismatches(positions), None))
+        except Exception as e:
+            results.append(_failure(input_file, e))
+    return results
+
+def _preview_chunk(files):
+    results = []
+    for input_file in files:
+        try:
+            counts = count_file(input_file, _process_engine, _process_input_encoding)
+            results.append((input_file, True, '', counts))
+        except Exception as e:
+            results.append(_failure(input_file, e))
+    return results
+
+def convert_files_parallel(files, mappings, save_folder=None, workers=None, chunk_size=8,
+                           instrument=False, **options):
+    # Dosyaları parçalar halinde süreç havuzuna gönderir, sonuçları bittikçe döndürür.
+    # files bir üreteç olabilir; klasör taranırken dönüştürme başlar.
+    return _run_in_pool(
+        files, _convert_chunk, _init_conversion_process,
+        (mappings, save_folder, instrument, options), workers, chunk_size
+    )
+
+def _run_in_pool(files, chunk_function, initializer, initargs, workers=None, chunk_size=8):
+    workers = workers or os.cpu_count() or 1
+    files = iter(files)
+    chunks = iter(lambda: list(itertools.islice(files, chunk_size)), [])
+    
+    # Arayüzde Qt iş parçacıkları varken fork güvenli değil, işçiler spawn ile başlatılır
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=initializer,
+        initargs=initargs
+    )
+    try:
+        # Bellekte bekleyen iş sayısını sınırlı tut
+        pending = set()
+        for chunk in chunks:
+            pending.add(executor.submit(chunk_function, chunk))
+            if len(pending) < workers * 2:
+                continue
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+                
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def _put(target_queue, item, stop_event):
+    # Kuyruk doluyken iptal edilirse iş parçacığı takılı kalmasın
+    while not stop_event.is_set():
+        try:
+            target_queue.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def convert_files_pipelined(files, engine, save_folder=None, threads=2, queue_size=16,
+                            stream=None, root=None, input_encoding='utf-8', encoding='utf-8',
+                            instrument=False):
+    # Okuma, dönüştürme ve yazma aşamaları sınırlı kuyruklarla bağlanır; disk
+    # beklenirken işlemci, dönüştürme sürerken disk boş kalmaz. Okuma ve yazma
+    # için ayrı 'threads' iş parçacığı, dönüştürme için tek iş parçacığı çalışır.
+    # Büyük dosyalar okuma aşamasında akış modunda doğrudan dönüştürülür.
+    files = iter(files)
+    files_lock = threading.Lock()
+    read_queue = queue.Queue(queue_size)
+    write_queue = queue.Queue(queue_size)
+    result_queue = queue.Queue()
+    stop_event = threading.Event()
+    byte_table = engine.byte_table(input_encoding, encoding)
+    done = object()
+    
+    def read_stage():
+        try:
+            while not stop_event.is_set():
+                with files_lock:
+                    input_file = next(files, None)
+                if input_file is None:
+                    break
+                stats = FileStats(input_file) if instrument else None
+                try:
+                    large_file = (stream if stream is not None
+                                  else os.path.getsize(input_file) >= STREAM_THRESHOLD)
+                    if large_file:
+                        output_file = convert_single_file(
+                            input_file, engine, save_folder, True, root, input_encoding, encoding,
+                            stats
+                        )
+                        result_queue.put((input_file, True, output_file, stats))
+                        continue
+                    with _timing(stats, 'read'):
+                        with open(input_file, 'rb') as f:
+                            data = f.read()
+                except Exception as e:
+                    result_queue.put(_failure(input_file, e, stats))
+                    continue
+                if stats is not None:
+                    stats.bytes_in = len(data)
+                if not _put(read_queue, (input_file, data, stats), stop_event):
+                    break
+        finally:
+            _put(read_queue, done, stop_event)
+            
+    def convert_stage():
+        finished_readers = 0
+        while finished_readers < threads and not stop_event.is_set():
+            item = read_queue.get()
+            if item is done:
+                finished_readers += 1
+                continue
+            input_file, data, stats = item
+            try:
+                with _timing(stats, 'convert'):
+                    if byte_table is not None:
+                        table, invalid = byte_table
+                        if invalid and len(data.translate(None, invalid)) != len(data):
+                            raise UnicodeError("Dosyada seçilen kodlamalarla dönüştürülemeyen bayt var")
+                        if stats is not None:
+                            stats.counts.update(engine.count_bytes(data, input_encoding))
+                        data = data.translate(table)
+                    else:
+                        content = data.decode(input_encoding)
+                        if stats is not None:
+                            stats.counts.update(engine.count(content))
+                        data = engine.convert(content).encode(encoding)
+            except Exception as e:
+                result_queue.put(_failure(input_file, e, stats))
+                continue
+            if not _put(write_queue, (input_file, data, stats), stop_event):
+                break
+        for _ in range(threads):
+            _put(write_queue, done, stop_event)
+            
+    def write_stage():
+        try:
+            while not stop_event.is_set():
+                item = write_queue.get()
+                if item is done:
+                    break
+                input_file, data, stats = item
+                try:
+                    output_file = get_output_file(input_file, save_folder, root)
+                    if save_folder:
+                        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                    with _timing(stats, 'write'):
+                        with atomic_output(output_file, 'wb', input_file) as f:
+                            f.write(data)
+                    if stats is not None:
+                        stats.output = output_file
+                        stats.bytes_out = len(data)
+                    result_queue.put((input_file, True, output_file, stats))
+                except Exception as e:
+                    result_queue.put(_failure(input_file, e, stats))
+        finally:
+            result_queue.put(done)
+            
+    workers = (
+        [threading.Thread(target=read_stage, daemon=True) for _ in range(threads)]
+        + [threading.Thread(target=convert_stage, daemon=True)]
+        + [threading.Thread(target=write_stage, daemon=True) for _ in range(threads)]
+    )
+    for worker in workers:
+        worker.start()
+        
+    try:
+        finished_writers = 0
+        while finished_writers < threads:
+            result = result_queue.get()
+            if result is done:
+                finished_writers += 1
+            else:
+                yield result
+    finally:
+        # Erken kapatılırsa aşamalar durdurulur; yarım kalan yazımlar geçici dosyada kalıp silinir
+        stop_event.set()
+        for stage_queue in (read_queue, write_queue):
+            for _ in range(threads + 1):
+                try:
+                    stage_queue.put_nowait(done)
+                except queue.Full:
+                    break
+        for worker in workers:
+            worker.join()
+
+def load_mappings(file_name):
+    # CharacterMapEditor.save_mappings ile aynı biçim: {"kaynak": "hedef", ...}
+    with open(file_name, 'r', encoding='utf-8') as f:
+        mappings = json.load(f)
+    if not isinstance(mappings, dict) or not all(
+        isinstance(source, str) and isinstance(target, str)
+        for source, target in mappings.items()
+    ):
+        raise ValueError(f"Geçersiz eşleştirme dosyası: {file_name}")
+    return mappings
+
+def _matches(name, relative_path, patterns):
+    return any(
+        fnmatch.fnmatch(name, pattern) or fnmatch.fnmatch(relative_path, pattern)
+        for pattern in patterns
+    )
+
+def iter_files(root, include=('*.txt',), exclude=(), recursive=True, skip_folders=()):
+    # os.scandir ile klasörü gezer ve dosyaları bulundukça döndürür.
+    # Desenler hem dosya adına hem de köke göre göreli yola ('/' ayraçlı) uygulanır;
+    # hariç tutulan klasörlere ve skip_folders'a (ör. kaydedilecek klasör) hiç girilmez.
+    # Klasör bağlantıları izlenir ama her klasöre (aygıt, inode) bir kez girilir;
+    # atasını gösteren bir bağlantı sonsuz döngüye sokmaz.
+    skip_folders = {os.path.normcase(os.path.abspath(folder)) for folder in skip_folders if folder}
+    visited = set()
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        try:
+            stat = os.stat(folder)
+            if (stat.st_dev, stat.st_ino) in visited:
+                continue
+            visited.add((stat.st_dev, stat.st_ino))
+            with os.scandir(folder) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            continue
+            
+        subfolders = []
+        for entry in entries:
+            relative_path = os.path.relpath(entry.path, root).replace(os.sep, '/')
+            if exclude and _matches(entry.name, relative_path, exclude):
+                continue
+            try:
+                if entry.is_dir():
+                    if recursive and os.path.normcase(os.path.abspath(entry.path)) not in skip_folders:
+                        subfolders.append(entry.path)
+                elif entry.is_file() and _matches(entry.name, relative_path, include):
+                    yield entry.path
+            except OSError:
+                continue
+                
+        # Alt klasörler alfabetik sırayla gezilsin diye ters sırada yığına eklenir
+        stack.extend(reversed(subfolders))
+
+def iter_conversions(files, engine, save_folder=None, workers=1, manifest=None, pipeline=False,
+                     instrument=False, **options):
+    # (dosya, başarılı, çıktı dosyası veya hata, FileStats) döndürür; ölçümler yalnızca
+    # instrument seçilirse toplanır, değilse None'dır.
+    # manifest verilirse başarılı dosyalar kaydedilir; iptal edilse bile kayıt saklanır.
+    # pipeline seçilirse workers okuma/yazma aşamalarındaki iş parçacığı sayısıdır.
+    if pipeline:
+        results = convert_files_pipelined(
+            files, engine, save_folder, workers, instrument=instrument, **options
+        )
+    else:
+        results = _iter_conversions(files, engine, save_folder, workers, instrument, **options)
+    try:
+        for input_file, success, message, stats in results:
+            if success and manifest is not None:
+                manifest.record(input_file)
+            yield input_file, success, message, stats
+    finally:
+        results.close()
+        if manifest is not None:
+            manifest.save()
+
+def _iter_conversions(files, engine, save_folder, workers, instrument=False, **options):
+    if workers > 1:
+        yield from convert_files_parallel(
+            files, engine.mappings, save_folder, workers, instrument=instrument, **options
+        )
+        return
+        
+    for input_file in files:
+        yield _convert_file(input_file, engine, save_folder, instrument, options)
+
+def iter_verifications(files, engine, workers=1, input_encoding='utf-8'):
+    # Kodla -> çöz gidiş-dönüşünü doğrular; (dosya, başarılı, uyuşmazlık konumları, None)
+    # döndürür, böylece sonuçlar dönüştürmeyle aynı biçimdedir
+    if workers > 1:
+        yield from _run_in_pool(
+            files, _verify_chunk, _init_verify_process, (engine.mappings, input_encoding), workers
+        )
+        return
+        
+    inverse_engine, _ = engine.inverse()
+    for input_file in files:
+        try:
+            positions = verify_single_file(input_file, engine, inverse_engine, input_encoding)
+            yield input_file, not positions, format_mismatches(positions), None
+        except Exception as e:
+            yield _failure(input_file, e)
+
+def iter_previews(files, engine, workers=1, input_encoding='utf-8'):
+    # Kuru çalıştırma: hiçbir şey yazmadan (dosya, başarılı, hata, {anahtar: sayı}) döndürür
+    if workers > 1:
+        yield from _run_in_pool(
+            files, _preview_chunk, _init_preview_process, (engine.mappings, input_encoding), workers
+        )
+        return
+        
+    for input_file in files:
+        try:
+            yield input_file, True, '', count_file(input_file, engine, input_encoding)
+        except Exception as e:
+            yield _failure(input_file, e)
+
+def format_mappings(mappings):
+    return ', '.join(f"{source!r} → {target!r}" for source, target in mappings)
+
+def format_conflicts(conflicts):
+    return '; '.join(
+        f"{', '.join(repr(source) for source in sources)} → {target!r}"
+        for target, sources in conflicts.items()
+    )
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Metin dosyalarındaki karakterleri eşleştirme tablosuna göre dönüştürür."
+    )
+    parser.add_argument('input', help="Dönüştürülecek dosya veya klasör")
+    parser.add_argument('-m', '--mappings', help="Eşleştirme JSON dosyası (varsayılan: yerleşik tablo)")
+    parser.add_argument('-P', '--profile', help="Kayıtlı eşleştirme profilinin adı (-m yerine)")
+    parser.add_argument('-o', '--output', help="Kaydedilecek klasör (varsayılan: dosyaların üzerine yazılır)")
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1,
+                        help="İşçi süreç sayısı")
+    parser.add_argument('-g', '--glob', action='append', dest='patterns',
+                        help="Klasör modunda dosya deseni, birden fazla verilebilir (varsayılan: *.txt)")
+    parser.add_argument('-x', '--exclude', action='append', default=[],
+                        help="Hariç tutulacak dosya veya klasör deseni, birden fazla verilebilir")
+    parser.add_argument('--no-recursive', dest='recursive', action='store_false',
+                        help="Alt klasörlere inme")
+    parser.add_argument('--stream', action='store_true', default=None,
+                        help="Tüm dosyaları parça parça oku (varsayılan: yalnızca büyük dosyalar)")
+    parser.add_argument('-p', '--pipeline', action='store_true',
+                        help="Okuma/dönüştürme/yazma aşamalarını örtüştür; -j aşama başına iş parçacığı sayısıdır")
+    parser.add_argument('-e', '--encoding', choices=ENCODINGS, default='utf-8',
+                        help="Çıktı kodlaması (varsayılan: utf-8)")
+    parser.add_argument('--input-encoding', choices=ENCODINGS, default='utf-8',
+                        help="Girdi kodlaması (varsayılan: utf-8)")
+    parser.add_argument('-d', '--decode', action='store_true',
+                        help="Ters yönde dönüştür (hedef karakterleri kaynağa geri çevir)")
+    parser.add_argument('--verify', action='store_true',
+                        help="Dosyaları yazmadan kodla -> çöz gidiş-dönüşünü doğrula")
+    parser.add_argument('-n', '--dry-run', action='store_true',
+                        help="Dosyaları yazmadan dosya başına değiştirme sayılarını göster")
+    parser.add_argument('--show-lines', type=int, default=0, metavar='N',
+                        help="Kuru çalıştırmada dosya başına gösterilecek önce/sonra satır sayısı")
+    parser.add_argument('-i', '--incremental', action='store_true',
+                        help="Yalnızca yeni veya değişmiş dosyaları dönüştür")
+    parser.add_argument('-s', '--stats', action='store_true',
+                        help="Dosya başına ölçüm topla ve çalıştırma sonunda özet yazdır")
+    parser.add_argument('--report', help="Ölçüm raporunu JSON veya CSV (.csv) olarak kaydet (--stats içerir)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="Başarılı dosyaları yazdırma")
+    args = parser.parse_args(argv)
+    
+    profile_store = ProfileStore()
+    try:
+        if args.profile:
+            mappings = profile_store.load(args.profile)
+        elif args.mappings:
+            mappings = load_mappings(args.mappings)
+        else:
+            mappings = DEFAULT_MAPPINGS
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+        
+    workers = args.workers
+    if os.path.isdir(args.input):
+        root = args.input
+        files = iter_files(
+            root, args.patterns or ('*.txt',), args.exclude, args.recursive, [args.output]
+        )
+    elif os.path.isfile(args.input):
+        root = None
+        files = [args.input]
+        workers = 1
+    else:
+        parser.error(f"Dosya veya klasör bulunamadı: {args.input}")
+        
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        
+    # Önbellek yalnızca profil seçildiyse kullanılır; diğer tablolar bellekte derlenir
+    engine = profile_store.profile_engine(args.profile) if args.profile else ConversionEngine(mappings)
+    if args.decode or args.verify:
+        inverse_engine, conflicts = engine.inverse()
+        if conflicts:
+            print(f"⚠ Tersine çevrilemeyen eşleştirmeler: {format_conflicts(conflicts)}",
+                  file=sys.stderr)
+        if args.verify:
+            return verify_main(files, engine, workers, args.input_encoding, args.quiet)
+        engine = inverse_engine
+        
+    if args.dry_run:
+        return preview_main(files, engine, workers, args.input_encoding, args.show_lines)
+        
+    unencodable = engine.unencodable_targets(args.encoding)
+    if unencodable:
+        parser.error(f"{args.encoding} ile yazılamayan hedefler: {format_mappings(unencodable)}")
+    
+    manifest = None
+    if args.incremental:
+        manifest_folder = args.output or root or os.path.dirname(os.path.abspath(args.input))
+        manifest = ConversionManifest(
+            manifest_folder, engine.mappings, args.input_encoding, args.encoding
+        )
+        files = manifest.pending_files(files, args.output, root)
+        
+    total_files = 0
+    success_count = 0
+    statistics = RunStatistics(engine.mappings) if args.stats or args.report else None
+    results = iter_conversions(
+        files, engine, args.output, workers, manifest, args.pipeline, statistics is not None,
+        stream=args.stream, root=root, input_encoding=args.input_encoding, encoding=args.encoding
+    )
+    for input_file, success, message, stats in results:
+        total_files += 1
+        if statistics is not None:
+            statistics.add(stats)
+        if success:
+            success_count += 1
+            if not args.quiet:
+                print(f"✅ Başarılı: {message}")
+        else:
+            print(f"❌ Hata: {input_file}: {message}", file=sys.stderr)
+            
+    if manifest is not None:
+        print(f"{manifest.skipped} dosya değişmemiş, atlandı.")
+    elif total_files == 0:
+        print("Klasörde dönüştürülecek dosya bulunamadı!", file=sys.stderr)
+        return 1
+        
+    if statistics is not None:
+        statistics.finish()
+        print('\n'.join(statistics.format_summary()))
+        if args.report:
+            statistics.export(args.report)
+            print(f"Rapor kaydedildi: {args.report}")
+            
+    print(f"{success_count}/{total_files} dosya başarıyla dönüştürüldü.")
+    return 0 if success_count == total_files else 1
+
+def preview_main(files, engine, workers, input_encoding='utf-8', show_lines=0):
+    total_files = 0
+    changed_files = 0
+    total_replacements = 0
+    failed = False
+    for input_file, success, message, counts in iter_previews(files, engine, workers, input_encoding):
+        total_files += 1
+        if not success:
+            failed = True
+            print(f"❌ Hata: {input_file}: {message}", file=sys.stderr)
+            continue
+        if not counts:
+            continue
+        changed_files += 1
+        total_replacements += sum(counts.values())
+        print(f"🔍 {input_file}: {sum(counts.values())} değişiklik ({format_counts(counts)})")
+        if show_lines > 0:
+            rows = FilePreview(input_file, engine, input_encoding).page(0, show_lines)
+            for line, before, after in rows:
+                print(f"    {line}: {before}\n    {' ' * len(str(line))}→ {after}")
+                
+    print(f"{changed_files}/{total_files} dosyada {total_replacements} değişiklik yapılacak (dosyalar yazılmadı).")
+    return 1 if failed else 0
+
+def verify_main(files, engine, workers, input_encoding='utf-8', quiet=False):
+    total_files = 0
+    mismatch_count = 0
+    for input_file, success, message, _ in iter_verifications(files, engine, workers, input_encoding):
+        total_files += 1
+        if success:
+            if not quiet:
+                print(f"✅ Uyumlu: {input_file}")
+        else:
+            mismatch_count += 1
+            print(f"❌ Uyuşmazlık: {input_file}: {message}")
+            
+    print(f"{total_files - mismatch_count}/{total_files} dosya gidiş-dönüşte aynı kaldı.")
+    return 0 if mismatch_count == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
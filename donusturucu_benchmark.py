@@ -0,0 +1,224 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import platform
+import argparse
+import tempfile
+import tracemalloc
+
+from donusturucu import DEFAULT_MAPPINGS, ConversionEngine, iter_conversions
+
+# Dönüştürme çekirdeği için tekrarlanabilir performans ölçümleri.
+# Sentetik Türkçe metin üretir; eski str.replace döngüsünü derlenmiş motorla karşılaştırır.
+
+TURKISH_WORDS = [
+    'ağaç', 'çiçek', 'değişim', 'gözlük', 'ışık', 'İstanbul', 'şehir', 'Şubat',
+    'öğrenci', 'Ğ', 'güneş', 'çalışmak', 'kılıç', 'İzmir', 'Çanakkale', 'yağmur',
+    'düşünce', 'sıcaklık', 'kuş', 'göğüs', 'ılık', 'iş', 'şarkı', 'Ömer', 'ülke',
+    'savaşçı', 'büyücü', 'kalkan', 'zırh', 'görev', 'köy', 'dağ', 'değirmen',
+]
+
+# Tablo büyütülürken kullanılan ek hedef karakterler (Latin-1 glifleri)
+EXTRA_TARGETS = 'àáâãäåæèëíïðñòóôõøùúûýþÿ'
+
+def legacy_convert(content, mappings):
+    # Eski convert_single_file döngüsü: her eşleştirme için tüm metin yeniden taranır
+    for old_char, new_char in mappings.items():
+        content = content.replace(old_char, new_char)
+    return content
+
+def build_mapping_table(size, multi_char=False, seed=0):
+    # Varsayılan tabloyu istenen boyuta kadar genişletir
+    rng = random.Random(seed)
+    mappings = dict(DEFAULT_MAPPINGS)
+    letters = sorted(set(''.join(TURKISH_WORDS)) - set(mappings))
+    candidates = [f'{a}{b}' for a in letters for b in letters] if multi_char else letters
+    rng.shuffle(candidates)
+    for source in candidates:
+        if len(mappings) >= size:
+            break
+        mappings.setdefault(source, rng.choice(EXTRA_TARGETS))
+    return mappings
+
+def generate_text(size, rng):
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(TURKISH_WORDS)
+        words.append(word)
+        length += len(word) + 1
+        if rng.random() < 0.08:
+            words.append('\n')
+    return ' '.join(words)[:size]
+
+def generate_corpus(folder, file_count, file_size, seed=0):
+    rng = random.Random(seed)
+    files = []
+    for index in range(file_count):
+        file_name = os.path.join(folder, f'metin_{index:05d}.txt')
+        with open(file_name, 'w', encoding='utf-8', newline='') as f:
+            f.write(generate_text(file_size, rng))
+        files.append(file_name)
+    return files
+
+def _timed(function, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {'min': timings[0], 'median': timings[len(timings) // 2]}
+
+def _peak_memory(function):
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def bench_single_file(input_file, mappings, repeat):
+    with open(input_file, 'r', encoding='utf-8', newline='') as f:
+        content = f.read()
+    size = len(content.encode('utf-8'))
+
+    engine = ConversionEngine(mappings)
+    results = {'bytes': size, 'strategy': engine.strategy}
+    results['compile'] = _timed(lambda: ConversionEngine(mappings), repeat)
+    results['replace'] = _timed(lambda: legacy_convert(content, mappings), repeat)
+    results['engine'] = _timed(lambda: engine.convert(content), repeat)
+    results['speedup'] = results['replace']['min'] / max(results['engine']['min'], 1e-9)
+    results['peak_memory'] = {
+        'replace': _peak_memory(lambda: legacy_convert(content, mappings)),
+        'engine': _peak_memory(lambda: engine.convert(content)),
+    }
+    return results
+
+def bench_folder(files, mappings, output_folder, workers, stream=None):
+    engine = ConversionEngine(mappings)
+    total_bytes = sum(os.path.getsize(f) for f in files)
+    start = time.perf_counter()
+    failed = sum(
+        not success
+        for _, success, _, _ in iter_conversions(files, engine, output_folder, workers, stream=stream)
+    )
+    elapsed = time.perf_counter() - start
+    return {
+        'workers': workers,
+        'files': len(files),
+        'failed': failed,
+        'seconds': elapsed,
+        'files_per_second': len(files) / elapsed,
+        'mb_per_second': total_bytes / elapsed / (1024 * 1024),
+    }
+
+def bench_folder_legacy(files, mappings, output_folder):
+    # Eski sıralı akış: oku, str.replace döngüsü, yaz
+    total_bytes = sum(os.path.getsize(f) for f in files)
+    start = time.perf_counter()
+    for input_file in files:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+        content = legacy_convert(content, mappings)
+        with open(os.path.join(output_folder, os.path.basename(input_file)), 'w', encoding='utf-8') as f:
+            f.write(content)
+    elapsed = time.perf_counter() - start
+    return {
+        'workers': 1,
+        'files': len(files),
+        'seconds': elapsed,
+        'files_per_second': len(files) / elapsed,
+        'mb_per_second': total_bytes / elapsed / (1024 * 1024),
+    }
+
+def run_benchmarks(args):
+    results = {
+        'environment': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'parameters': vars(args).copy(),
+        'single_file': [],
+        'folder': [],
+    }
+
+    work_folder = tempfile.mkdtemp(prefix='donusturucu_bench_')
+    try:
+        corpus_folder = os.path.join(work_folder, 'corpus')
+        output_folder = os.path.join(work_folder, 'output')
+        os.makedirs(corpus_folder)
+        os.makedirs(output_folder)
+
+        print(f"Korpus üretiliyor: {args.files} dosya x {args.file_size} KB")
+        files = generate_corpus(corpus_folder, args.files, args.file_size * 1024, args.seed)
+        large_file = generate_corpus(work_folder, 1, args.large_file_size * 1024, args.seed + 1)[0]
+
+        for table_size in args.table_sizes:
+            for multi_char in (False, True) if args.multi_char else (False,):
+                mappings = build_mapping_table(table_size, multi_char, args.seed)
+                label = f"{len(mappings)} eşleştirme{' (çok karakterli)' if multi_char else ''}"
+
+                single = bench_single_file(large_file, mappings, args.repeat)
+                single.update({'mappings': len(mappings), 'multi_char': multi_char})
+                results['single_file'].append(single)
+                print(f"[tek dosya] {label}: replace {single['replace']['min'] * 1000:.1f} ms, "
+                      f"motor ({single['strategy']}) {single['engine']['min'] * 1000:.1f} ms, "
+                      f"x{single['speedup']:.1f}")
+
+                legacy = bench_folder_legacy(files, mappings, output_folder)
+                legacy.update({'engine': 'replace', 'mappings': len(mappings), 'multi_char': multi_char})
+                results['folder'].append(legacy)
+                print(f"[klasör] {label}, replace: {legacy['files_per_second']:.0f} dosya/s, "
+                      f"{legacy['mb_per_second']:.1f} MB/s")
+
+                for workers in args.workers:
+                    folder = bench_folder(files, mappings, output_folder, workers)
+                    folder.update({'engine': 'engine', 'mappings': len(mappings), 'multi_char': multi_char})
+                    results['folder'].append(folder)
+                    print(f"[klasör] {label}, {workers} işçi: {folder['files_per_second']:.0f} dosya/s, "
+                          f"{folder['mb_per_second']:.1f} MB/s")
+
+        # Akış modunun bellek kazancı: tüm dosyayı okuma ile parça parça okuma
+        engine = ConversionEngine(build_mapping_table(args.table_sizes[0], True, args.seed))
+        results['stream_peak_memory'] = {
+            stream_label: _peak_memory(lambda: list(
+                iter_conversions([large_file], engine, output_folder, 1, stream=stream)
+            ))
+            for stream_label, stream in (('whole_file', False), ('stream', True))
+        }
+    finally:
+        shutil.rmtree(work_folder, ignore_errors=True)
+
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Karakter dönüştürme motoru performans ölçümleri")
+    parser.add_argument('--files', type=int, default=200, help="Klasör ölçümündeki dosya sayısı")
+    parser.add_argument('--file-size', type=int, default=64, help="Klasördeki dosya boyutu (KB)")
+    parser.add_argument('--large-file-size', type=int, default=8192,
+                        help="Tek dosya gecikmesi için dosya boyutu (KB)")
+    parser.add_argument('--table-sizes', type=int, nargs='+', default=[7, 25, 100],
+                        help="Ölçülecek eşleştirme tablosu boyutları")
+    parser.add_argument('--multi-char', action='store_true',
+                        help="Çok karakterli anahtarlı tabloları da ölç")
+    parser.add_argument('--workers', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+                        help="Ölçeklenme için denenecek işçi sayıları")
+    parser.add_argument('--repeat', type=int, default=5, help="Tek dosya ölçümlerinin tekrar sayısı")
+    parser.add_argument('--seed', type=int, default=0, help="Korpus üretimi için rastgelelik tohumu")
+    parser.add_argument('-o', '--output', default='bench_results.json', help="Sonuç JSON dosyası")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=4)
+    print(f"Sonuçlar kaydedildi: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
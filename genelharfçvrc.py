@@ -1,34 +1,447 @@
 import sys
 import os
 import json
+import time
+import shutil
+import tempfile
+import threading
+import collections
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QRadioButton, QLineEdit, QPushButton, 
-                            QLabel, QFileDialog, QTextEdit, QProgressBar, 
-                            QButtonGroup, QMessageBox, QTabWidget, QTableWidget,
-                            QTableWidgetItem, QHeaderView)
-from PyQt6.QtCore import Qt
+                            QLabel, QFileDialog, QListView, QProgressBar, 
+                            QButtonGroup, QMessageBox, QTabWidget, QTableView,
+                            QTableWidget, QTableWidgetItem, QHeaderView, QSpinBox, QCheckBox,
+                            QComboBox, QInputDialog, QAbstractItemView, QListWidget,
+                            QListWidgetItem, QSplitter)
+from PyQt6.QtCore import (Qt, QThread, QTimer, QAbstractListModel, QAbstractTableModel,
+                          QModelIndex, QSortFilterProxyModel, pyqtSignal)
+from PyQt6.QtGui import QColor
 
-class CharacterMapEditor(QWidget):
+from donusturucu import (DEFAULT_MAPPINGS, ENCODINGS, ConversionManifest, ProfileStore,
+                         RunStatistics, iter_files, iter_conversions, iter_verifications,
+                         iter_previews, format_conflicts, format_mappings, format_counts,
+                         load_mappings, parse_code_points, format_code_points,
+                         find_mapping_problems, FilePreview)
+
+class ConversionWorker(QThread):
+    progress = pyqtSignal(int, int)
+    file_converted = pyqtSignal(str, bool, str)
+    file_previewed = pyqtSignal(str, object)
+    files_skipped = pyqtSignal(int)
+    finished = pyqtSignal(int, int, bool)
+    
+    # İlerleme sinyalleri en fazla bu aralıkla gönderilir (saniye)
+    progress_interval = 0.1
+    
+    def __init__(self, files, engine, save_folder=None, workers=1, manifest=None, root=None,
+                 verify=False, input_encoding='utf-8', encoding='utf-8', pipeline=False,
+                 instrument=False, preview=False):
+        super().__init__()
+        # files bir üreteç olabilir; toplam sayı tarama bitince belli olur
+        self.files = files
+        self.engine = engine
+        self.save_folder = save_folder
+        self.workers = workers
+        self.manifest = manifest
+        self.root = root
+        self.verify = verify
+        self.preview = preview
+        self.input_encoding = input_encoding
+        self.encoding = encoding
+        self.pipeline = pipeline
+        # Ölçümler toplanıyorsa çalıştırma bitince özet buradan okunur
+        self.statistics = (
+            RunStatistics(engine.mappings) if instrument and not verify and not preview else None
+        )
+        self.discovered = 0
+        self.discovery_finished = False
+        self._cancelled = False
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        
+    def cancel(self):
+        self._cancelled = True
+        self._resume_event.set()
+        
+    def pause(self):
+        self._resume_event.clear()
+        
+    def resume(self):
+        self._resume_event.set()
+        
+    def is_paused(self):
+        return not self._resume_event.is_set()
+        
+    def count_files(self, files):
+        for input_file in files:
+            self.discovered += 1
+            yield input_file
+        self.discovery_finished = True
+        
+    def total_files(self):
+        # Tarama sürerken toplam bilinmez, 0 gönderilir
+        return self.discovered if self.discovery_finished else 0
+        
+    def run(self):
+        files = self.files
+        if self.manifest is not None:
+            # Değişmemiş dosyalar kayıttan bulunur ve atlanır
+            files = self.manifest.pending_files(files, self.save_folder, self.root)
+        files = self.count_files(files)
+            
+        success_count = 0
+        processed = 0
+        last_progress = 0.0
+        
+        if self.verify:
+            # Doğrulama modunda hiçbir dosya yazılmaz
+            results = iter_verifications(files, self.engine, self.workers, self.input_encoding)
+        elif self.preview:
+            # Kuru çalıştırma: yalnızca anahtar başına değiştirme sayıları
+            results = iter_previews(files, self.engine, self.workers, self.input_encoding)
+        else:
+            results = iter_conversions(
+                files, self.engine, self.save_folder, self.workers, self.manifest, self.pipeline,
+                self.statistics is not None, root=self.root, input_encoding=self.input_encoding,
+                encoding=self.encoding
+            )
+        try:
+            for input_file, success, message, stats in results:
+                if self.statistics is not None:
+                    self.statistics.add(stats)
+                if success:
+                    success_count += 1
+                if self.preview and success:
+                    # Önizlemede dördüncü alan {anahtar: sayı} sözlüğüdür
+                    self.file_previewed.emit(input_file, stats)
+                else:
+                    self.file_converted.emit(input_file, success, message)
+                processed += 1
+                
+                now = time.monotonic()
+                if now - last_progress >= self.progress_interval:
+                    last_progress = now
+                    self.progress.emit(processed, self.total_files())
+                    
+                # Duraklatılınca havuza yeni iş gönderilmez
+                self._resume_event.wait()
+                if self._cancelled:
+                    break
+        finally:
+            results.close()
+            
+        if self.statistics is not None:
+            self.statistics.finish()
+        if self.manifest is not None:
+            self.files_skipped.emit(self.manifest.skipped)
+        self.finished.emit(success_count, processed, self._cancelled)
+
+class FilePreviewWorker(QThread):
+    # Seçilen dosyanın önizlemesi (okuma, eşleşme taraması, değişen satırlar)
+    # arka planda kurulur; büyük dosyalarda arayüz donmaz
+    finished = pyqtSignal()
+    
+    def __init__(self, input_file, engine, input_encoding='utf-8'):
+        super().__init__()
+        self.input_file = input_file
+        self.engine = engine
+        self.input_encoding = input_encoding
+        self.preview = None
+        self.error = ""
+        
+    def run(self):
+        try:
+            self.preview = FilePreview(self.input_file, self.engine, self.input_encoding)
+        except Exception as e:
+            self.error = str(e)
+        self.finished.emit()
+
+class LogModel(QAbstractListModel):
+    # Log satırlarını sınırlı bir halka tamponda tutar; QListView yalnızca görünen
+    # satırları çizer. Mesajlar biriktirilir ve zamanlayıcıyla toplu eklenir, böylece
+    # dosya sayısı ne olursa olsun arayüz maliyeti sabit kalır. Tamponun dışına
+    # düşen satırlar dahil tüm log geçici dosyada tutulur ve kaydedilebilir.
+    LevelRole = Qt.ItemDataRole.UserRole + 1
+    
+    level_colors = {
+        'success': QColor('#81C784'),
+        'warning': QColor('#FFB74D'),
+        'error': QColor('#E57373'),
+    }
+    
+    def __init__(self, capacity=10000, flush_interval=100, parent=None):
+        super().__init__(parent)
+        self.lines = collections.deque(maxlen=capacity)
+        self.pending = []
+        self.full_log = tempfile.TemporaryFile('w+', encoding='utf-8')
+        
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(flush_interval)
+        self.flush_timer.timeout.connect(self.flush)
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.lines)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        level, message = self.lines[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return message
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.level_colors.get(level)
+        if role == self.LevelRole:
+            return level
+        return None
+        
+    def append(self, message, level='info'):
+        self.pending.append((level, message))
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+            
+    def flush(self):
+        self.flush_timer.stop()
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        self.full_log.writelines(f"{message}\n" for _, message in pending)
+        
+        # Tampon taşarsa en eski satırlar tek seferde çıkarılır
+        capacity = self.lines.maxlen
+        pending = pending[-capacity:]
+        overflow = len(self.lines) + len(pending) - capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self.lines.popleft()
+            self.endRemoveRows()
+            
+        first = len(self.lines)
+        self.beginInsertRows(QModelIndex(), first, first + len(pending) - 1)
+        self.lines.extend(pending)
+        self.endInsertRows()
+        
+    def clear(self):
+        self.flush_timer.stop()
+        self.beginResetModel()
+        self.lines.clear()
+        self.pending = []
+        self.full_log.seek(0)
+        self.full_log.truncate()
+        self.endResetModel()
+        
+    def save(self, file_name):
+        self.flush()
+        self.full_log.seek(0)
+        try:
+            with open(file_name, 'w', encoding='utf-8') as f:
+                shutil.copyfileobj(self.full_log, f)
+        finally:
+            self.full_log.seek(0, os.SEEK_END)
+
+class LogFilterModel(QSortFilterProxyModel):
+    # Seviye (ör. yalnızca hatalar) ve metin süzgeci
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.levels = None
+        self.text = ''
+        
+    def set_levels(self, levels):
+        self.levels = levels
+        self.invalidateFilter()
+        
+    def set_text(self, text):
+        self.text = text.casefold()
+        self.invalidateFilter()
+        
+    def filterAcceptsRow(self, source_row, source_parent):
+        level, message = self.sourceModel().lines[source_row]
+        if self.levels is not None and level not in self.levels:
+            return False
+        return not self.text or self.text in message.casefold()
+
+class MappingTableModel(QAbstractTableModel):
+    # Eşleştirmeler iki düz listede (kaynaklar, hedefler) tutulur; görünüm yalnızca
+    # ekrandaki hücreleri sorar. Motor için sözlük görüntüsü ve sorun listesi bir
+    # değişiklik olana kadar önbellekte kalır.
+    mappings_changed = pyqtSignal()
+    
+    headers = ("Değiştirilecek Karakter", "Yeni Karakter", "Kod Noktaları")
+    # Yalnızca hatalar boyanır; 'cycle' bilgi amaçlıdır ve ipucunda görünür
+    problem_colors = {
+        'duplicate': QColor('#6D4C41'),
+        'conflict': QColor('#5D4037'),
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.sources = []
+        self.targets = []
+        self._snapshot = None
+        self._problems = None
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.sources)
+        
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+        
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() < 2:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        source, target = self.sources[row], self.targets[row]
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            if column == 0:
+                return source
+            if column == 1:
+                return target
+            return f"{format_code_points(source)} → {format_code_points(target)}"
+        if role == Qt.ItemDataRole.BackgroundRole:
+            colors = [self.problem_colors[kind] for kind, _ in self.problems().get(row, ())
+                      if kind in self.problem_colors]
+            return colors[0] if colors else None
+        if role == Qt.ItemDataRole.ToolTipRole:
+            problems = self.problems().get(row)
+            return '\n'.join(message for _, message in problems) if problems else None
+        return None
+        
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if role != Qt.ItemDataRole.EditRole or not index.isValid() or index.column() > 1:
+            return False
+        try:
+            value = parse_code_points(value)
+        except ValueError:
+            return False
+        column = self.sources if index.column() == 0 else self.targets
+        if column[index.row()] == value:
+            return False
+        column[index.row()] = value
+        self.dataChanged.emit(index, self.index(index.row(), 2))
+        self._changed(problems_may_move=True)
+        return True
+        
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        self.sources[row:row] = [''] * count
+        self.targets[row:row] = [''] * count
+        self.endInsertRows()
+        self._changed()
+        return True
+        
+    def removeRows(self, row, count, parent=QModelIndex()):
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self.sources[row:row + count]
+        del self.targets[row:row + count]
+        self.endRemoveRows()
+        self._changed(problems_may_move=True)
+        return True
+        
+    def set_mappings(self, mappings):
+        # Toplu yükleme: satır satır ekleme yerine tek model sıfırlaması
+        self.beginResetModel()
+        self.sources = list(mappings.keys())
+        self.targets = list(mappings.values())
+        self.endResetModel()
+        self._changed()
+        
+    def _changed(self, problems_may_move=False):
+        self._snapshot = None
+        self._problems = None
+        if problems_may_move and self.sources:
+            # Bir satırdaki değişiklik başka satırların sorun durumunu da etkileyebilir
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self.sources) - 1, len(self.headers) - 1),
+                [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole]
+            )
+        self.mappings_changed.emit()
+        
+    def snapshot(self):
+        # Boş satırlar atlanır, aynı kaynak birden fazlaysa son satır geçerlidir.
+        # Dönen sözlük önbellekle paylaşılır, değiştirilmemelidir.
+        if self._snapshot is None:
+            self._snapshot = {
+                source: target for source, target in zip(self.sources, self.targets)
+                if source and target
+            }
+        return self._snapshot
+        
+    def problems(self):
+        if self._problems is None:
+            self._problems = find_mapping_problems(list(zip(self.sources, self.targets)))
+        return self._problems
+
+class CharacterMapEditor(QWidget):
+    def __init__(self, parent=None, profile_store=None):
+        super().__init__(parent)
+        self.profile_store = profile_store or ProfileStore()
+        # Tablo değişmedikçe derlenmiş motor yeniden kullanılır
+        self._engine = None
         self.init_ui()
         
     def init_ui(self):
         layout = QVBoxLayout(self)
         
+        # Profil seçimi
+        profile_layout = QHBoxLayout()
+        self.profile_combo = QComboBox()
+        self.profile_combo.setMinimumWidth(200)
+        self.profile_combo.activated.connect(self.switch_profile)
+        
+        save_profile_button = QPushButton("Profil Olarak Kaydet")
+        save_profile_button.clicked.connect(self.save_profile)
+        save_profile_button.setObjectName("saveButton")
+        
+        delete_profile_button = QPushButton("Profili Sil")
+        delete_profile_button.clicked.connect(self.delete_profile)
+        delete_profile_button.setObjectName("actionButton")
+        
+        profile_layout.addWidget(QLabel("Profil:"))
+        profile_layout.addWidget(self.profile_combo)
+        profile_layout.addWidget(save_profile_button)
+        profile_layout.addWidget(delete_profile_button)
+        profile_layout.addStretch()
+        layout.addLayout(profile_layout)
+        
         # Tablo başlığı
         table_label = QLabel("Karakter Eşleştirme Tablosu")
         table_label.setObjectName("logLabel")
         layout.addWidget(table_label)
         
-        # Tablo
-        self.table = QTableWidget(0, 2)
-        self.table.setHorizontalHeaderLabels(["Değiştirilecek Karakter", "Yeni Karakter"])
+        # Tablo; hücrelere karakter ya da 'U+011E' biçiminde kod noktası girilebilir
+        self.model = MappingTableModel(self)
+        self.model.mappings_changed.connect(self.invalidate_engine)
+        self.model.mappings_changed.connect(self.update_problems)
+        
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        # Sabit satır yüksekliği: binlerce satırda boyutlar tek tek hesaplanmaz
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(28)
         layout.addWidget(self.table)
         
+        # Yinelenen / çakışan / döngüsel eşleştirme özeti
+        self.problem_label = QLabel("")
+        self.problem_label.setObjectName("statusLabel")
+        layout.addWidget(self.problem_label)
+        
         # Butonlar
         button_layout = QHBoxLayout()
         
@@ -55,31 +468,103 @@ class CharacterMapEditor(QWidget):
         
         layout.addLayout(button_layout)
         
+        self.refresh_profiles()
+        
+    def refresh_profiles(self, current=None):
+        self.profile_combo.clear()
+        self.profile_combo.addItem("(Kayıtsız tablo)")
+        self.profile_combo.addItems(self.profile_store.names())
+        if current:
+            self.profile_combo.setCurrentText(current)
+            
+    def switch_profile(self, index):
+        if index <= 0:
+            return
+        name = self.profile_combo.itemText(index)
+        try:
+            # Derlenmiş motor profil önbelleğinden gelir
+            engine = self.profile_store.profile_engine(name)
+            self.set_mappings(self.profile_store.load(name))
+            self._engine = engine
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Profil yüklenirken hata: {str(e)}")
+            
+    def save_profile(self):
+        mappings = self.get_mappings()
+        if not mappings:
+            QMessageBox.warning(self, "Uyarı", "Kaydedilecek eşleştirme bulunamadı!")
+            return
+            
+        current = self.profile_combo.currentText() if self.profile_combo.currentIndex() > 0 else ""
+        name, ok = QInputDialog.getText(self, "Profil Olarak Kaydet", "Profil adı:", text=current)
+        if not ok or not name.strip():
+            return
+            
+        try:
+            self.profile_store.save(name.strip(), mappings)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Profil kaydedilirken hata: {str(e)}")
+            return
+        self.refresh_profiles(name.strip())
+        
+    def delete_profile(self):
+        if self.profile_combo.currentIndex() <= 0:
+            return
+        name = self.profile_combo.currentText()
+        reply = QMessageBox.question(self, "Profili Sil", f"'{name}' profili silinsin mi?")
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        try:
+            self.profile_store.delete(name)
+        except Exception as e:
+            QMessageBox.critical(self, "Hata", f"Profil silinirken hata: {str(e)}")
+        self.refresh_profiles()
+        
+    def invalidate_engine(self, *args):
+        self._engine = None
+        
+    def get_engine(self):
+        if self._engine is None:
+            self._engine = self.profile_store.engine(self.model.snapshot())
+        return self._engine
+        
+    def update_problems(self):
+        counts = collections.Counter()
+        for problems in self.model.problems().values():
+            counts.update({kind for kind, _ in problems})
+        names = {'duplicate': "yinelenen", 'conflict': "çakışan"}
+        parts = []
+        if any(counts[kind] for kind in names):
+            parts.append("⚠ " + ', '.join(
+                f"{counts[kind]} {name} satır" for kind, name in names.items() if counts[kind]
+            ))
+        if counts['cycle']:
+            parts.append(f"ℹ {counts['cycle']} satır takas/döngü içeriyor (tek geçişte doğru dönüştürülür)")
+        if not parts:
+            self.problem_label.setText("")
+            return
+        self.problem_label.setText('; '.join(parts) + " (ayrıntılar için satırın üzerine gelin)")
+        
     def add_row(self):
-        row_position = self.table.rowCount()
-        self.table.insertRow(row_position)
+        row_position = self.model.rowCount()
+        self.model.insertRows(row_position, 1)
+        self.table.scrollToBottom()
+        self.table.edit(self.model.index(row_position, 0))
         
     def remove_selected_row(self):
-        selected_rows = set(item.row() for item in self.table.selectedItems())
-        for row in sorted(selected_rows, reverse=True):
-            self.table.removeRow(row)
+        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()}, reverse=True)
+        # Ardışık satırlar tek seferde silinir
+        while rows:
+            last = first = rows.pop(0)
+            while rows and rows[0] == first - 1:
+                first = rows.pop(0)
+            self.model.removeRows(first, last - first + 1)
             
     def get_mappings(self):
-        mappings = {}
-        for row in range(self.table.rowCount()):
-            source = self.table.item(row, 0)
-            target = self.table.item(row, 1)
-            if source and target and source.text() and target.text():
-                mappings[source.text()] = target.text()
-        return mappings
+        return dict(self.model.snapshot())
         
     def set_mappings(self, mappings):
-        self.table.setRowCount(0)
-        for source, target in mappings.items():
-            row_position = self.table.rowCount()
-            self.table.insertRow(row_position)
-            self.table.setItem(row_position, 0, QTableWidgetItem(source))
-            self.table.setItem(row_position, 1, QTableWidgetItem(target))
+        self.model.set_mappings(mappings)
             
     def save_mappings(self):
         mappings = self.get_mappings()
@@ -109,9 +594,7 @@ class CharacterMapEditor(QWidget):
         
         if file_name:
             try:
-                with open(file_name, 'r', encoding='utf-8') as f:
-                    mappings = json.load(f)
-                self.set_mappings(mappings)
+                self.set_mappings(load_mappings(file_name))
                 QMessageBox.information(self, "Başarılı", "Eşleştirmeler yüklendi!")
             except Exception as e:
                 QMessageBox.critical(self, "Hata", f"Dosya yüklenirken hata: {str(e)}")
@@ -123,11 +606,7 @@ class ModernCharacterConverter(QMainWindow):
         self.setMinimumSize(900, 600)
         
         # Varsayılan karakter eşleştirmeleri
-        self.default_mappings = {
-            'Ğ': 'ß', 'ş': 'é', 'İ': 'Î',
-            'Ş': 'É', 'ğ': 'ê', 'Ç': 'Á',
-            'ı': 'ì'
-        }
+        self.default_mappings = dict(DEFAULT_MAPPINGS)
         
         self.init_ui()
         self.apply_styles()
@@ -193,22 +672,203 @@ class ModernCharacterConverter(QMainWindow):
         converter_layout.addWidget(self.save_folder_entry)
         converter_layout.addWidget(save_folder_button)
         
+        # Paralel dönüştürme için işçi süreç sayısı
+        workers_layout = QHBoxLayout()
+        workers_label = QLabel("İşlemci Sayısı:")
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, os.cpu_count() or 1)
+        self.workers_spin.setValue(os.cpu_count() or 1)
+        
+        # Boru hattı: okuma/dönüştürme/yazma örtüşür, sayı aşama başına iş parçacığıdır
+        self.pipeline_checkbox = QCheckBox("G/Ç Boru Hattı")
+        self.pipeline_checkbox.setToolTip(
+            "Ağ sürücüleri ve yavaş diskler için: okuma, dönüştürme ve yazma aynı anda yapılır"
+        )
+        
+        # Artımlı dönüştürme: kayıt dosyasına göre değişmemiş dosyaları atla
+        self.incremental_checkbox = QCheckBox("Yalnızca Değişen Dosyaları Dönüştür")
+        
+        # Dosya başına süre/bayt/değiştirme ölçümleri; özet işlem sonunda loga yazılır
+        self.stats_checkbox = QCheckBox("İstatistik Topla")
+        self.stats_checkbox.setChecked(True)
+        
+        workers_layout.addWidget(workers_label)
+        workers_layout.addWidget(self.workers_spin)
+        workers_layout.addWidget(self.pipeline_checkbox)
+        workers_layout.addWidget(self.incremental_checkbox)
+        workers_layout.addWidget(self.stats_checkbox)
+        workers_layout.addStretch()
+        
+        converter_layout.addLayout(workers_layout)
+        
+        # Klasör modunda dosya süzgeçleri (desenler ';' ile ayrılır)
+        filter_layout = QHBoxLayout()
+        self.include_entry = QLineEdit("*.txt")
+        self.include_entry.setPlaceholderText("Dahil edilecek desenler (ör. *.txt; dialog/*.txt)")
+        self.exclude_entry = QLineEdit()
+        self.exclude_entry.setPlaceholderText("Hariç tutulacak desenler (ör. yedek; *_eski.txt)")
+        self.recursive_checkbox = QCheckBox("Alt Klasörler")
+        self.recursive_checkbox.setChecked(True)
+        
+        filter_layout.addWidget(self.include_entry)
+        filter_layout.addWidget(self.exclude_entry)
+        filter_layout.addWidget(self.recursive_checkbox)
+        
+        converter_layout.addLayout(filter_layout)
+        
+        # Girdi / çıktı kodlaması; ikisi de tek baytlıysa hızlı bayt yolu kullanılır
+        encoding_layout = QHBoxLayout()
+        self.input_encoding_combo = QComboBox()
+        self.input_encoding_combo.addItems(ENCODINGS)
+        self.encoding_combo = QComboBox()
+        self.encoding_combo.addItems(ENCODINGS)
+        
+        encoding_layout.addWidget(QLabel("Girdi Kodlaması:"))
+        encoding_layout.addWidget(self.input_encoding_combo)
+        encoding_layout.addWidget(QLabel("Çıktı Kodlaması:"))
+        encoding_layout.addWidget(self.encoding_combo)
+        encoding_layout.addStretch()
+        
+        converter_layout.addLayout(encoding_layout)
+        
         # Dönüştür butonu
-        convert_button = QPushButton("Dönüştür")
-        convert_button.clicked.connect(self.convert)
-        convert_button.setObjectName("convertButton")
-        convert_button.setMinimumHeight(50)
-        converter_layout.addWidget(convert_button)
+        self.convert_button = QPushButton("Dönüştür")
+        self.convert_button.clicked.connect(self.convert)
+        self.convert_button.setObjectName("convertButton")
+        self.convert_button.setMinimumHeight(50)
+        converter_layout.addWidget(self.convert_button)
+        
+        # Duraklat / İptal / Doğrula butonları
+        control_layout = QHBoxLayout()
+        
+        self.decode_checkbox = QCheckBox("Ters Dönüştür (Çöz)")
+        
+        self.verify_button = QPushButton("Gidiş-Dönüş Doğrula")
+        self.verify_button.clicked.connect(self.verify)
+        self.verify_button.setObjectName("actionButton")
+        
+        self.preview_button = QPushButton("Önizle")
+        self.preview_button.setToolTip("Dosyaları yazmadan nelerin değişeceğini göster")
+        self.preview_button.clicked.connect(self.preview)
+        self.preview_button.setObjectName("actionButton")
+        
+        self.pause_button = QPushButton("Duraklat")
+        self.pause_button.clicked.connect(self.toggle_pause)
+        self.pause_button.setObjectName("actionButton")
+        self.pause_button.setEnabled(False)
+        
+        self.cancel_button = QPushButton("İptal")
+        self.cancel_button.clicked.connect(self.cancel_conversion)
+        self.cancel_button.setObjectName("actionButton")
+        self.cancel_button.setEnabled(False)
+        
+        self.export_report_button = QPushButton("Raporu Dışa Aktar")
+        self.export_report_button.clicked.connect(self.export_report)
+        self.export_report_button.setObjectName("actionButton")
+        self.export_report_button.setEnabled(False)
+        
+        control_layout.addWidget(self.decode_checkbox)
+        control_layout.addWidget(self.verify_button)
+        control_layout.addWidget(self.preview_button)
+        control_layout.addWidget(self.pause_button)
+        control_layout.addWidget(self.cancel_button)
+        control_layout.addWidget(self.export_report_button)
+        converter_layout.addLayout(control_layout)
         
         # Log alanı
         log_label = QLabel("İşlem Logları")
         log_label.setObjectName("logLabel")
         converter_layout.addWidget(log_label)
         
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
-        self.log_text.setMinimumHeight(200)
-        converter_layout.addWidget(self.log_text)
+        self.log_model = LogModel(parent=self)
+        self.log_filter = LogFilterModel(self)
+        self.log_filter.setSourceModel(self.log_model)
+        
+        # Satır yükseklikleri eşit: görünüm yalnızca ekrandaki satırları ölçer
+        self.log_view = QListView()
+        self.log_view.setModel(self.log_filter)
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.log_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.log_view.setMinimumHeight(200)
+        self.log_filter.rowsAboutToBeInserted.connect(self.log_rows_about_to_be_inserted)
+        self.log_filter.rowsInserted.connect(self.log_rows_inserted)
+        self.follow_log = True
+        
+        log_filter_layout = QHBoxLayout()
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.addItem("Tüm Kayıtlar", None)
+        self.log_level_combo.addItem("Uyarılar ve Hatalar", ('warning', 'error'))
+        self.log_level_combo.addItem("Yalnızca Hatalar", ('error',))
+        self.log_level_combo.currentIndexChanged.connect(
+            lambda: self.log_filter.set_levels(self.log_level_combo.currentData())
+        )
+        
+        self.log_search_entry = QLineEdit()
+        self.log_search_entry.setPlaceholderText("Logda ara...")
+        self.log_search_entry.textChanged.connect(self.log_filter.set_text)
+        
+        save_log_button = QPushButton("Logu Kaydet")
+        save_log_button.clicked.connect(self.save_log)
+        save_log_button.setObjectName("actionButton")
+        
+        log_filter_layout.addWidget(self.log_level_combo)
+        log_filter_layout.addWidget(self.log_search_entry)
+        log_filter_layout.addWidget(save_log_button)
+        
+        converter_layout.addLayout(log_filter_layout)
+        converter_layout.addWidget(self.log_view)
+        
+        # Kuru çalıştırma önizlemesi: solda değişecek dosyalar, sağda seçili dosyanın
+        # değişen satırları sayfa sayfa
+        self.preview_panel = QSplitter(Qt.Orientation.Horizontal)
+        self.preview_file_list = QListWidget()
+        self.preview_file_list.currentItemChanged.connect(self.show_file_preview)
+        
+        preview_lines_widget = QWidget()
+        preview_lines_layout = QVBoxLayout(preview_lines_widget)
+        preview_lines_layout.setContentsMargins(0, 0, 0, 0)
+        self.preview_table = QTableWidget(0, 3)
+        self.preview_table.setHorizontalHeaderLabels(["Satır", "Önce", "Sonra"])
+        self.preview_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.preview_table.verticalHeader().setVisible(False)
+        preview_header = self.preview_table.horizontalHeader()
+        preview_header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
+        preview_header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        preview_header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
+        
+        page_layout = QHBoxLayout()
+        self.previous_page_button = QPushButton("◀ Önceki")
+        self.previous_page_button.clicked.connect(self.show_previous_page)
+        self.previous_page_button.setObjectName("actionButton")
+        self.next_page_button = QPushButton("Sonraki ▶")
+        self.next_page_button.clicked.connect(self.show_next_page)
+        self.next_page_button.setObjectName("actionButton")
+        self.preview_page_label = QLabel("")
+        self.preview_page_label.setObjectName("statusLabel")
+        page_layout.addWidget(self.previous_page_button)
+        page_layout.addWidget(self.preview_page_label)
+        page_layout.addStretch()
+        page_layout.addWidget(self.next_page_button)
+        
+        preview_lines_layout.addWidget(self.preview_table)
+        preview_lines_layout.addLayout(page_layout)
+        self.preview_panel.addWidget(self.preview_file_list)
+        self.preview_panel.addWidget(preview_lines_widget)
+        self.preview_panel.setStretchFactor(1, 3)
+        self.preview_panel.setMinimumHeight(250)
+        self.preview_panel.setVisible(False)
+        converter_layout.addWidget(self.preview_panel)
+        
+        self.preview_engine = None
+        self.preview_input_encoding = 'utf-8'
+        self.preview_replacements = 0
+        self.current_preview = None
+        self.preview_start = 0
+        self.preview_page_size = 50
+        # Yarıda bırakılamayan eski önizleme işçileri bitene kadar burada tutulur
+        self.file_preview_worker = None
+        self.file_preview_workers = set()
         
         # Progress bar
         self.progress_bar = QProgressBar()
@@ -221,6 +881,9 @@ class ModernCharacterConverter(QMainWindow):
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         converter_layout.addWidget(self.status_label)
         
+        self.conversion_worker = None
+        self.statistics = None
+        
         # Karakter eşleştirme sekmesi
         self.char_map_editor = CharacterMapEditor()
         self.char_map_editor.set_mappings(self.default_mappings)
@@ -257,12 +920,12 @@ class ModernCharacterConverter(QMainWindow):
                 background-color: #2196F3;
                 font-weight: bold;
             }
-            QTableWidget {
+            QTableView {
                 background-color: #2b2b2b;
                 border: 1px solid #333333;
                 gridline-color: #333333;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
             QHeaderView::section {
@@ -315,7 +978,7 @@ class ModernCharacterConverter(QMainWindow):
             #saveButton:hover {
                 background-color: #388E3C;
             }
-            QTextEdit {
+            QListView {
                 background-color: #2b2b2b;
                 border: 2px solid #333333;
                 border-radius: 5px;
@@ -367,37 +1030,47 @@ class ModernCharacterConverter(QMainWindow):
         if folder:
             self.save_folder_entry.setText(folder)
             
-    def log_message(self, message):
-        self.log_text.append(message)
+    def log_message(self, message, level='info'):
+        self.log_model.append(message, level)
         
-    def convert_single_file(self, input_file, save_folder=None):
-        try:
-            file_name = os.path.basename(input_file)
-            if save_folder:
-                output_file = os.path.join(save_folder, file_name)
-            else:
-                file_path = os.path.dirname(input_file)
-                output_file = os.path.join(file_path, file_name)
-            
-            with open(input_file, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            # Güncel karakter eşleştirmelerini kullan
-            char_map = self.char_map_editor.get_mappings()
-            for old_char, new_char in char_map.items():
-                content = content.replace(old_char, new_char)
+    def log_rows_about_to_be_inserted(self):
+        # Kullanıcı yukarı kaydırmışsa log kendiliğinden aşağı inmez
+        scroll_bar = self.log_view.verticalScrollBar()
+        self.follow_log = scroll_bar.value() == scroll_bar.maximum()
+        
+    def log_rows_inserted(self):
+        if self.follow_log:
+            self.log_view.scrollToBottom()
             
-            with open(output_file, 'w', encoding='utf-8') as file:
-                file.write(content)
+    def save_log(self):
+        file_name, _ = QFileDialog.getSaveFileName(
+            self,
+            "Logu Kaydet",
+            "",
+            "Text files (*.txt)"
+        )
+        
+        if file_name:
+            try:
+                self.log_model.save(file_name)
+                QMessageBox.information(self, "Başarılı", "Log kaydedildi!")
+            except Exception as e:
+                QMessageBox.critical(self, "Hata", f"Kaydetme hatası: {str(e)}")
                 
-            self.log_message(f"✅ Başarılı: {output_file}")
-            return True
-            
-        except Exception as e:
-            self.log_message(f"❌ Hata: {str(e)}")
-            return False
-            
+
     def convert(self):
+        self.start_worker(verify=False)
+        
+    def verify(self):
+        self.start_worker(verify=True)
+        
+    def preview(self):
+        self.start_worker(verify=False, preview=True)
+        
+    def start_worker(self, verify, preview=False):
+        if self.conversion_worker is not None:
+            return
+            
         path = self.path_entry.text()
         if not path:
             QMessageBox.critical(self, "Hata", "Lütfen bir dosya veya klasör seçin!")
@@ -405,33 +1078,275 @@ class ModernCharacterConverter(QMainWindow):
             
         save_folder = self.save_folder_entry.text() if self.save_folder_entry.text() else None
         
-        self.log_text.clear()
+        workers = self.workers_spin.value()
+        if self.file_radio.isChecked():
+            root = None
+            files = [path]
+            workers = 1
+        else:
+            if not os.path.isdir(path):
+                QMessageBox.critical(self, "Hata", "Klasör bulunamadı!")
+                return
+            # Klasör taranırken dönüştürme başlar, alt klasör yapısı korunur
+            root = path
+            files = iter_files(
+                root,
+                self.split_patterns(self.include_entry.text()) or ('*.txt',),
+                self.split_patterns(self.exclude_entry.text()),
+                self.recursive_checkbox.isChecked(),
+                [save_folder]
+            )
+        
+        self.log_model.clear()
         self.progress_bar.setValue(0)
         self.status_label.setText("İşlem başlatılıyor...")
+        self.skipped_count = 0
         
-        if self.file_radio.isChecked():
-            self.convert_single_file(path, save_folder)
-            self.status_label.setText("İşlem tamamlandı!")
-            self.progress_bar.setValue(100)
+        # Derlenmiş motor tablo değişmedikçe önbellekten gelir
+        engine = self.char_map_editor.get_engine()
+        if verify or self.decode_checkbox.isChecked():
+            inverse_engine, conflicts = engine.inverse()
+            if conflicts:
+                self.log_message(
+                    f"⚠ Tersine çevrilemeyen eşleştirmeler: {format_conflicts(conflicts)}", 'warning'
+                )
+            if not verify:
+                engine = inverse_engine
+                
+        input_encoding = self.input_encoding_combo.currentText()
+        encoding = self.encoding_combo.currentText()
+        unencodable = engine.unencodable_targets(encoding)
+        if unencodable and not verify and not preview:
+            self.status_label.setText("")
+            QMessageBox.critical(
+                self, "Hata", f"{encoding} ile yazılamayan hedefler: {format_mappings(unencodable)}"
+            )
+            return
+        
+        manifest = None
+        if self.incremental_checkbox.isChecked() and not verify and not preview:
+            manifest_folder = save_folder or root or os.path.dirname(os.path.abspath(path))
+            manifest = ConversionManifest(manifest_folder, engine.mappings, input_encoding, encoding)
+        
+        # Dönüştürme arka planda çalışır, arayüz donmaz
+        self.conversion_worker = ConversionWorker(
+            files, engine, save_folder, workers, manifest, root, verify, input_encoding, encoding,
+            self.pipeline_checkbox.isChecked(), self.stats_checkbox.isChecked(), preview
+        )
+        self.conversion_worker.progress.connect(self.update_progress)
+        self.conversion_worker.file_converted.connect(self.file_converted)
+        self.conversion_worker.file_previewed.connect(self.file_previewed)
+        self.conversion_worker.files_skipped.connect(self.files_skipped)
+        self.conversion_worker.finished.connect(self.conversion_finished)
+        
+        self.preview_file_list.clear()
+        self.preview_table.setRowCount(0)
+        self.preview_page_label.setText("")
+        self.preview_panel.setVisible(preview)
+        self.preview_engine = engine
+        self.preview_input_encoding = input_encoding
+        self.preview_replacements = 0
+        self.current_preview = None
+        self.file_preview_worker = None
+        
+        self.convert_button.setEnabled(False)
+        self.verify_button.setEnabled(False)
+        self.preview_button.setEnabled(False)
+        self.pause_button.setEnabled(True)
+        self.pause_button.setText("Duraklat")
+        self.cancel_button.setEnabled(True)
+        self.export_report_button.setEnabled(False)
+        self.statistics = None
+        
+        self.conversion_worker.start()
+        
+    def toggle_pause(self):
+        if self.conversion_worker is None:
+            return
+            
+        if self.conversion_worker.is_paused():
+            self.conversion_worker.resume()
+            self.pause_button.setText("Duraklat")
+            self.status_label.setText("Devam ediliyor...")
         else:
-            # Klasör içindeki tüm dosyaları dönüştür
-            files = [os.path.join(path, f) for f in os.listdir(path) if f.endswith('.txt')]
-            total_files = len(files)
-            if total_files == 0:
-                QMessageBox.critical(self, "Hata", "Klasörde dönüştürülecek .txt dosyası bulunamadı!")
-                return
+            self.conversion_worker.pause()
+            self.pause_button.setText("Devam Et")
+            self.status_label.setText("Duraklatıldı")
             
-            self.status_label.setText(f"{total_files} dosya bulundu, dönüştürme başlatılıyor...")
-            success_count = 0
+    def cancel_conversion(self):
+        if self.conversion_worker is not None:
+            self.conversion_worker.cancel()
+            self.status_label.setText("İptal ediliyor...")
             
-            for i, file in enumerate(files):
-                if self.convert_single_file(file, save_folder):
-                    success_count += 1
-                self.progress_bar.setValue(int((i + 1) / total_files * 100))
-                self.status_label.setText(f"{i + 1}/{total_files} dosya işlendi...")
+    def export_report(self):
+        if self.statistics is None:
+            return
             
+        file_name, _ = QFileDialog.getSaveFileName(
+            self,
+            "Raporu Kaydet",
+            "",
+            "JSON files (*.json);;CSV files (*.csv)"
+        )
+        
+        if file_name:
+            try:
+                self.statistics.export(file_name)
+                QMessageBox.information(self, "Başarılı", "Rapor kaydedildi!")
+            except Exception as e:
+                QMessageBox.critical(self, "Hata", f"Kaydetme hatası: {str(e)}")
+                
+    @staticmethod
+    def split_patterns(text):
+        return [pattern.strip() for pattern in text.split(';') if pattern.strip()]
+        
+    def update_progress(self, processed, total_files):
+        if total_files == 0:
+            # Klasör hâlâ taranıyor
+            self.progress_bar.setRange(0, 0)
+            self.status_label.setText(f"{processed} dosya işlendi, klasör taranıyor...")
+            return
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(int(processed / total_files * 100))
+        self.status_label.setText(f"{processed}/{total_files} dosya işlendi...")
+        
+    def files_skipped(self, count):
+        self.skipped_count = count
+        if count:
+            self.log_message(f"⏭ {count} dosya değişmemiş, atlandı")
+            
+    def file_converted(self, input_file, success, message):
+        if self.conversion_worker.verify:
+            if success:
+                self.log_message(f"✅ Uyumlu: {input_file}", 'success')
+            else:
+                self.log_message(f"❌ Uyuşmazlık: {input_file}: {message}", 'error')
+        elif success:
+            self.log_message(f"✅ Başarılı: {message}", 'success')
+        else:
+            self.log_message(f"❌ Hata: {input_file}: {message}", 'error')
+            
+    def file_previewed(self, input_file, counts):
+        if not counts:
+            return
+        total = sum(counts.values())
+        self.preview_replacements += total
+        self.log_message(f"🔍 {input_file}: {total} değişiklik ({format_counts(counts)})")
+        item = QListWidgetItem(f"{os.path.basename(input_file)} ({total})")
+        item.setData(Qt.ItemDataRole.UserRole, input_file)
+        item.setToolTip(input_file)
+        self.preview_file_list.addItem(item)
+        
+    def show_file_preview(self, item, previous=None):
+        if item is None:
+            return
+        input_file = item.data(Qt.ItemDataRole.UserRole)
+        self.current_preview = None
+        self.preview_table.setRowCount(0)
+        self.previous_page_button.setEnabled(False)
+        self.next_page_button.setEnabled(False)
+        self.preview_page_label.setText("Önizleme hazırlanıyor...")
+        
+        # Konum dizini yalnızca seçilen dosya için, arka planda çıkarılır
+        worker = FilePreviewWorker(input_file, self.preview_engine, self.preview_input_encoding)
+        worker.finished.connect(self.file_preview_ready)
+        self.file_preview_worker = worker
+        self.file_preview_workers.add(worker)
+        worker.start()
+        
+    def file_preview_ready(self):
+        worker = self.sender()
+        worker.wait()
+        self.file_preview_workers.discard(worker)
+        # Bu arada başka bir dosya seçildiyse sonuç kullanılmaz
+        if worker is not self.file_preview_worker:
+            return
+        self.file_preview_worker = None
+        if worker.error:
+            self.preview_page_label.setText(f"Önizleme hatası: {worker.error}")
+            return
+        self.current_preview = worker.preview
+        self.show_preview_page(0)
+        
+    def show_preview_page(self, start):
+        preview = self.current_preview
+        if preview is None:
+            return
+        total = len(preview.changed_lines)
+        start = max(0, min(start, (total - 1) // self.preview_page_size * self.preview_page_size))
+        self.preview_start = start
+        
+        rows = preview.page(start, self.preview_page_size)
+        self.preview_table.setRowCount(len(rows))
+        for row, (line, before, after) in enumerate(rows):
+            self.preview_table.setItem(row, 0, QTableWidgetItem(str(line)))
+            self.preview_table.setItem(row, 1, QTableWidgetItem(before))
+            self.preview_table.setItem(row, 2, QTableWidgetItem(after))
+            
+        self.previous_page_button.setEnabled(start > 0)
+        self.next_page_button.setEnabled(start + self.preview_page_size < total)
+        self.preview_page_label.setText(
+            f"{start + 1}-{start + len(rows)} / {total} değişen satır, "
+            f"{format_counts(preview.counts())}"
+        )
+        
+    def show_previous_page(self):
+        self.show_preview_page(self.preview_start - self.preview_page_size)
+        
+    def show_next_page(self):
+        self.show_preview_page(self.preview_start + self.preview_page_size)
+        
+    def conversion_finished(self, success_count, total_files, cancelled):
+        verify = self.conversion_worker.verify
+        preview = self.conversion_worker.preview
+        statistics = self.conversion_worker.statistics
+        self.conversion_worker.wait()
+        self.conversion_worker = None
+        
+        if statistics is not None and statistics.files:
+            self.statistics = statistics
+            for line in statistics.format_summary():
+                self.log_message(line)
+            self.export_report_button.setEnabled(True)
+            
+        self.convert_button.setEnabled(True)
+        self.verify_button.setEnabled(True)
+        self.preview_button.setEnabled(True)
+        self.pause_button.setEnabled(False)
+        self.pause_button.setText("Duraklat")
+        self.cancel_button.setEnabled(False)
+        self.progress_bar.setRange(0, 100)
+        
+        if cancelled:
+            self.status_label.setText(f"İşlem iptal edildi. {success_count}/{total_files} dosya dönüştürüldü.")
+        elif total_files == 0 and self.skipped_count == 0:
+            self.status_label.setText("")
+            QMessageBox.critical(self, "Hata", "Klasörde dönüştürülecek dosya bulunamadı!")
+        elif verify:
+            self.status_label.setText(f"Doğrulama tamamlandı! {success_count}/{total_files} dosya gidiş-dönüşte aynı kaldı.")
+            self.progress_bar.setValue(100)
+        elif preview:
+            self.status_label.setText(
+                f"Önizleme tamamlandı! {self.preview_file_list.count()}/{total_files} dosyada "
+                f"{self.preview_replacements} değişiklik yapılacak (dosyalar yazılmadı)."
+            )
+            self.progress_bar.setValue(100)
+            if self.preview_file_list.count():
+                self.preview_file_list.setCurrentRow(0)
+        elif total_files == 1 and self.file_radio.isChecked():
+            self.status_label.setText("İşlem tamamlandı!")
+            self.progress_bar.setValue(100)
+        else:
             self.status_label.setText(f"İşlem tamamlandı! {success_count}/{total_files} dosya başarıyla dönüştürüldü.")
             self.progress_bar.setValue(100)
+            
+    def closeEvent(self, event):
+        if self.conversion_worker is not None:
+            self.conversion_worker.cancel()
+            self.conversion_worker.wait()
+        for worker in list(self.file_preview_workers):
+            worker.wait()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
@@ -0,0 +1,233 @@
+import os
+import json
+import codecs
+import hashlib
+
+from donusturucu import STREAM_CHUNK_SIZE, atomic_output
+
+# Çeviri aracının klasör dizini. Her dosyanın boyutu, mtime değeri, kodlaması ve
+# satır sayısı kullanıcının önbellek klasöründeki bir JSON dosyasında saklanır;
+# boyutu ve mtime değeri değişmeyen dosyalar yeniden okunmaz. Qt'ye bağımlı değildir.
+
+# Dizinler çevrilen (ve dağıtılan) klasöre yazılmaz; klasör yolunun özetiyle
+# adlandırılan bir alt klasörde tutulur
+INDEX_CACHE_FOLDER = os.path.join(os.path.expanduser('~'), '.ceviri_araci', 'dizinler')
+INDEX_NAME = 'klasor_indeksi.json'
+INDEX_VERSION = 1
+
+# Eski sürümlerin klasöre yazdığı dizin dosyaları listelenmez
+LEGACY_INDEX_NAMES = ('.ceviri_indeksi.json', '.ceviri_metin_indeksi.pickle')
+
+SUPPORTED_EXTENSIONS = ('.txt', '.csv', '.json')
+
+# UTF-8 olarak çözülemeyen dosyalar Türkçe Windows kod sayfasıyla açılır
+FALLBACK_ENCODING = 'cp1254'
+
+BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+def is_supported(file_name):
+    name = os.path.basename(file_name)
+    return name not in LEGACY_INDEX_NAMES and name.lower().endswith(SUPPORTED_EXTENSIONS)
+
+def index_path(folder, name):
+    # Klasörün dizin dosyalarının önbellekteki yeri
+    key = hashlib.sha256(os.path.normcase(os.path.abspath(folder)).encode('utf-8')).hexdigest()[:32]
+    return os.path.join(INDEX_CACHE_FOLDER, key, name)
+
+def inspect_file(file_name):
+    # Kodlama ve satır sayısı tek geçişte bulunur: UTF-8 artımlı çözücüsü ilk
+    # hataya kadar denenir, satır sonları ham baytlarda sayılır
+    with open(file_name, 'rb') as f:
+        data = f.read(STREAM_CHUNK_SIZE)
+        for bom, encoding in BOM_ENCODINGS:
+            if data.startswith(bom):
+                break
+        else:
+            encoding = 'utf-8'
+
+        if encoding == 'utf-16':
+            decoder = codecs.getincrementaldecoder(encoding)('replace')
+            newlines = 0
+            last = ''
+            while data:
+                text = decoder.decode(data)
+                newlines += text.count('\n')
+                last = text[-1:] or last
+                data = f.read(STREAM_CHUNK_SIZE)
+            return encoding, newlines + (last not in ('', '\n'))
+
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        newlines = 0
+        last = b''
+        while data:
+            newlines += data.count(b'\n')
+            last = data[-1:]
+            if decoder is not None:
+                try:
+                    decoder.decode(data)
+                except UnicodeDecodeError:
+                    decoder = None
+            data = f.read(STREAM_CHUNK_SIZE)
+
+        if decoder is not None:
+            try:
+                decoder.decode(b'', final=True)
+            except UnicodeDecodeError:
+                decoder = None
+        if decoder is None:
+            encoding = FALLBACK_ENCODING
+        return encoding, newlines + (last not in (b'', b'\n'))
+
+def read_text(file_name):
+    # inspect_file ile aynı kurallar: BOM, sonra UTF-8, olmazsa yedek kod sayfası
+    with open(file_name, 'rb') as f:
+        data = f.read()
+    for bom, encoding in BOM_ENCODINGS:
+        if data.startswith(bom):
+            return data.decode(encoding, 'replace')
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.decode(FALLBACK_ENCODING, 'replace')
+
+def format_size(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+        size /= 1024
+    return f'{size:.1f} GB'
+
+def format_entry(entry):
+    return f"{format_size(entry['size'])} | {entry['encoding']} | {entry['lines']} satır"
+
+class FolderIndex:
+    # Klasör ağacındaki desteklenen dosyaların kayıtları. scan() tüm ağacı,
+    # refresh_folder() yalnızca değişen bir klasörü yeniden okur; ikisi de
+    # değişmeyen dosyalar için önbellekteki kaydı kullanır.
+    def __init__(self, folder):
+        self.folder = os.path.abspath(folder)
+        self.path = index_path(self.folder, INDEX_NAME)
+        self.entries = {}
+        self.folders = []
+        self.changed = False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                self.entries = data.get('files', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def _key(self, file_name):
+        key = os.path.relpath(os.path.abspath(file_name), self.folder).replace(os.sep, '/')
+        return '' if key == '.' else key
+
+    def path_of(self, key):
+        return os.path.join(self.folder, *key.split('/'))
+
+    def cached_files(self):
+        # Tarama bitmeden gösterilebilecek, önceki oturumdan kalan kayıtlar
+        return [(self.path_of(key), entry) for key, entry in sorted(self.entries.items())]
+
+    def update(self, file_name, stat=None):
+        # Dosyanın kaydını döndürür; boyut ve mtime aynıysa dosya okunmaz.
+        # Dosya artık yoksa ya da okunamıyorsa kaydı silinir ve None döner.
+        key = self._key(file_name)
+        try:
+            stat = stat or os.stat(file_name)
+            entry = self.entries.get(key)
+            if entry is not None and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+                return entry
+            encoding, lines = inspect_file(file_name)
+        except OSError:
+            if self.entries.pop(key, None) is not None:
+                self.changed = True
+            return None
+
+        entry = self.entries[key] = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'encoding': encoding,
+            'lines': lines,
+        }
+        self.changed = True
+        return entry
+
+    def _scan_folder(self, folder):
+        # Tek klasör düzeyi: (dosya, kayıt) listesi ve alt klasörler, ad sırasıyla
+        files = []
+        subfolders = []
+        try:
+            with os.scandir(folder) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError:
+            return files, subfolders
+
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    subfolders.append(entry.path)
+                elif entry.is_file() and is_supported(entry.name):
+                    record = self.update(entry.path, entry.stat())
+                    if record is not None:
+                        files.append((entry.path, record))
+            except OSError:
+                continue
+        return files, subfolders
+
+    def scan(self, stop_event=None):
+        # (dosya, kayıt) çiftlerini bulundukça döndürür. Tarama tamamlanınca diskte
+        # bulunmayan dosyaların kayıtları silinir ve (dosya, None) olarak bildirilir.
+        seen = set()
+        self.folders = []
+        stack = [self.folder]
+        while stack:
+            if stop_event is not None and stop_event.is_set():
+                return
+            folder = stack.pop()
+            self.folders.append(folder)
+            files, subfolders = self._scan_folder(folder)
+            for file_name, entry in files:
+                seen.add(self._key(file_name))
+                yield file_name, entry
+            stack.extend(reversed(subfolders))
+
+        for key in self.entries.keys() - seen:
+            del self.entries[key]
+            self.changed = True
+            yield self.path_of(key), None
+
+    def refresh_folder(self, folder):
+        # Dosya izleyicisinden gelen değişiklik: yalnızca bu klasör okunur. Klasörde
+        # artık olmayan dosyaların ve silinen alt klasörlerin kayıtları da düşülür.
+        files, subfolders = self._scan_folder(folder)
+        folder_key = self._key(folder)
+        prefix = folder_key + '/' if folder_key else ''
+        names = {os.path.basename(file_name) for file_name, _ in files}
+        subfolder_names = {os.path.basename(subfolder) for subfolder in subfolders}
+
+        removed = []
+        for key in [key for key in self.entries if key.startswith(prefix)]:
+            parts = key[len(prefix):].split('/', 1)
+            if (parts[0] not in names) if len(parts) == 1 else (parts[0] not in subfolder_names):
+                del self.entries[key]
+                self.changed = True
+                removed.append((self.path_of(key), None))
+        return files + removed, subfolders
+
+    def save(self):
+        if not self.changed:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with atomic_output(self.path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'files': self.entries}, f, ensure_ascii=False)
+        except OSError:
+            # Önbellek klasörü yazılamıyorsa dizin yalnızca bu oturumda kullanılır
+            return
+        self.changed = False
@@ -0,0 +1,266 @@
+import os
+import re
+import array
+import pickle
+import itertools
+import threading
+
+from donusturucu import atomic_output
+from klasor_indeksi import index_path, read_text
+
+# Klasör genelinde tam metin araması için trigram ters dizini. Her dosyanın küçük
+# harfe çevrilmiş metnindeki sözcüklerin 3 baytlık parçaları dosya numaralarına
+# eşlenir; sorgudaki parçaları içeren dosyalar adaydır ve yalnızca adaylar okunup
+# gerçek eşleşmeler aranır. Qt'ye bağımlı değildir.
+
+# Klasör dizininin yanında, kullanıcının önbellek klasöründe tutulur (bkz. index_path)
+TEXT_INDEX_NAME = 'metin_indeksi.pickle'
+TEXT_INDEX_VERSION = 1
+
+# Silinen/değişen dosyaların numaraları dizinde bu orana ulaşınca dizin sıkıştırılır
+COMPACT_RATIO = 0.25
+
+SEARCH_LIMIT = 1000
+
+def trigrams(text):
+    # Boşluk içeren parçalar dizinlenmez: sorgudaki boşluksuz her parça, eşleşen
+    # dosyada da bir sözcüğün içinde geçer. Yinelenen sözcükler bir kez işlenir,
+    # böylece büyük dosyalarda bile iş C düzeyinde kalır.
+    # re.IGNORECASE i, ı, I ve İ harflerini eşit sayar; dizin de aynı kümeye indirger
+    text = '\x00'.join(set(text.split())).casefold().replace('\u0307', '').replace('ı', 'i')
+    data = text.encode('utf-8')
+    return {
+        (a << 16) | (b << 8) | c
+        for a, b, c in set(zip(data, data[1:], data[2:]))
+        if a and b and c
+    }
+
+def required_literals(pattern):
+    # Düzenli ifadenin her eşleşmesinde geçmesi gereken düz metin parçaları.
+    # Emin olunamayan her yapıda parça kesilir; eksik parça yalnızca daha çok
+    # aday dosya demektir, yanlış sonuç değil.
+    literals = []
+    current = []
+    depth = 0
+    position = 0
+
+    def flush():
+        if current:
+            literals.append(''.join(current))
+            current.clear()
+
+    if re.search(r'(?<!\\)(?:\\\\)*\|', pattern):
+        return []
+    while position < len(pattern):
+        char = pattern[position]
+        position += 1
+        if char == '\\':
+            escaped = pattern[position:position + 1]
+            position += 1
+            if escaped and not escaped.isalnum() and depth == 0:
+                current.append(escaped)
+                continue
+            # \d, \x41, \1 gibi kaçışlar: sonrası güvenle çözümlenmez
+            flush()
+            return literals
+        if char == '[':
+            flush()
+            end = position + 1 if pattern[position:position + 1] in (']', '^]') else position
+            while end < len(pattern) and pattern[end] != ']':
+                end += 2 if pattern[end] == '\\' else 1
+            position = end + 1
+        elif char == '(':
+            flush()
+            depth += 1
+        elif char == ')':
+            flush()
+            depth -= 1
+        elif char in '*?{':
+            # Önceki karakter isteğe bağlı hale gelir
+            if current:
+                current.pop()
+            flush()
+            if char == '{':
+                position = pattern.find('}', position) + 1 or len(pattern)
+        elif char in '+.^$':
+            flush()
+        elif depth == 0:
+            current.append(char)
+        else:
+            flush()
+    flush()
+    return literals
+
+class TextIndex:
+    # files: anahtar (köke göre '/' ayraçlı yol) -> [numara, boyut, mtime]
+    # postings: trigram -> artan sıralı dosya numaraları (array)
+    # Değişen dosya yeni bir numarayla eklenir, eski numarası dead kümesine
+    # yazılır; sorgular ölü numaraları atlar ve dizin ara sıra sıkıştırılır.
+    def __init__(self, folder):
+        self.folder = os.path.abspath(folder)
+        self.path = index_path(self.folder, TEXT_INDEX_NAME)
+        self.files = {}
+        self.postings = {}
+        self.dead = set()
+        self.next_id = 0
+        self.changed = False
+        self._lock = threading.Lock()
+        self._keys = None
+
+    def load(self):
+        # Büyük dizinlerde saniyeler sürebilir; arayüz bunu arka planda çağırır
+        try:
+            with open(self.path, 'rb') as f:
+                data = pickle.load(f)
+        except Exception:
+            return
+        if not isinstance(data, dict) or data.get('version') != TEXT_INDEX_VERSION:
+            return
+        with self._lock:
+            self.files = data['files']
+            self.postings = data['postings']
+            self.dead = data['dead']
+            self.next_id = data['next_id']
+            self._keys = None
+
+    def path_of(self, key):
+        return os.path.join(self.folder, *key.split('/'))
+
+    def pending(self, entries):
+        # FolderIndex kayıtlarına göre yeniden dizinlenmesi gereken anahtarlar
+        return [
+            key for key, entry in entries.items()
+            if self.files.get(key, [None])[1:] != [entry['size'], entry['mtime']]
+        ]
+
+    def _remove(self, key):
+        old = self.files.pop(key, None)
+        if old is not None:
+            self.dead.add(old[0])
+            self._keys = None
+            self.changed = True
+
+    def update(self, entries, stop_event=None, progress=None):
+        # entries: FolderIndex.entries; aynı kök klasör olduğundan anahtarlar ortaktır
+        with self._lock:
+            for key in self.files.keys() - entries.keys():
+                self._remove(key)
+        pending = self.pending(entries)
+
+        for number, key in enumerate(pending):
+            if stop_event is not None and stop_event.is_set():
+                break
+            entry = entries[key]
+            try:
+                file_trigrams = trigrams(read_text(self.path_of(key)))
+            except OSError:
+                continue
+
+            with self._lock:
+                self._remove(key)
+                file_id = self.next_id
+                self.next_id += 1
+                for trigram in file_trigrams:
+                    ids = self.postings.get(trigram)
+                    if ids is None:
+                        ids = self.postings[trigram] = array.array('I')
+                    ids.append(file_id)
+                self.files[key] = [file_id, entry['size'], entry['mtime']]
+                self._keys = None
+                self.changed = True
+            if progress is not None:
+                progress(number + 1, len(pending))
+
+        if len(self.dead) > COMPACT_RATIO * max(len(self.files), 1):
+            self.compact()
+
+    def compact(self):
+        with self._lock:
+            dead = self.dead
+            for trigram in list(self.postings):
+                ids = array.array('I', itertools.filterfalse(dead.__contains__, self.postings[trigram]))
+                if ids:
+                    self.postings[trigram] = ids
+                else:
+                    del self.postings[trigram]
+            self.dead = set()
+            self.changed = True
+
+    def candidates(self, literals, keys=None):
+        # Tüm parçaları içeren dosyaların anahtarları; dizinde henüz olmayan
+        # anahtarlar (keys içinde olup files'ta olmayanlar) her zaman adaydır.
+        query = set()
+        for literal in literals:
+            query |= trigrams(literal)
+
+        with self._lock:
+            if self._keys is None:
+                self._keys = {file_id: key for key, (file_id, _, _) in self.files.items()}
+            if query:
+                # En seçici parçadan başlanır, küme hızla küçülür
+                postings = sorted((self.postings.get(trigram, ()) for trigram in query), key=len)
+                ids = set(postings[0])
+                for other in postings[1:]:
+                    if not ids:
+                        break
+                    ids.intersection_update(other)
+                found = {self._keys[file_id] for file_id in ids - self.dead}
+            else:
+                found = set(self.files)
+            unindexed = set() if keys is None else set(keys) - self.files.keys()
+
+        if keys is not None:
+            found &= set(keys)
+        return sorted(found | unindexed)
+
+    def search(self, pattern, regex=False, case_sensitive=False, keys=None,
+               limit=SEARCH_LIMIT, stop_event=None):
+        # (dosya, satır, sütun, satır metni) döndürür; satır 1'den, sütun 0'dan başlar.
+        # Geçersiz düzenli ifadede re.error yükselir.
+        expression = re.compile(pattern if regex else re.escape(pattern),
+                                0 if case_sensitive else re.IGNORECASE)
+        literals = required_literals(pattern) if regex else [pattern]
+        found = 0
+        for key in self.candidates(literals, keys):
+            if stop_event is not None and stop_event.is_set():
+                return
+            file_name = self.path_of(key)
+            try:
+                text = read_text(file_name)
+            except OSError:
+                continue
+
+            line_number = 1
+            last = 0
+            for match in expression.finditer(text):
+                start = match.start()
+                if match.end() == start:
+                    continue
+                line_number += text.count('\n', last, start)
+                last = start
+                line_start = text.rfind('\n', 0, start) + 1
+                line_end = text.find('\n', start)
+                line = text[line_start:line_end if line_end >= 0 else len(text)]
+                yield file_name, line_number, start - line_start, line.rstrip('\r')
+                found += 1
+                if found >= limit:
+                    return
+
+    def save(self):
+        if not self.changed:
+            return
+        with self._lock:
+            data = {
+                'version': TEXT_INDEX_VERSION,
+                'files': self.files,
+                'postings': self.postings,
+                'dead': self.dead,
+                'next_id': self.next_id,
+            }
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with atomic_output(self.path, 'wb') as f:
+                    pickle.dump(data, f, pickle.HIGHEST_PROTOCOL)
+            except OSError:
+                return
+            self.changed = False
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Modüller paket değil, depo kökünde duran betikler; testler hangi klasörden
+# çalıştırılırsa çalıştırılsın içe aktarılabilsinler
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
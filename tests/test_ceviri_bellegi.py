@@ -0,0 +1,124 @@
+import os
+import random
+import tempfile
+import unittest
+
+from ceviri_bellegi import (ORIGIN_MEMORY, ORIGIN_SERVICE, HTTPTranslationBackend,
+                            TranslationMemory, Translator, ngrams)
+from ceviri_sunucusu import StubTranslationServer
+
+# Benzer aramanın aday sınırları (trigram sayısı aralığı, seyrek trigram öneki)
+# kaba kuvvet Dice karşılaştırmasıyla denetlenir; Translator uzak servis yerine
+# yerel taklit sunucuyla sınanır
+
+THRESHOLD = 0.85
+
+def dice(first, second):
+    return 2 * len(first & second) / (len(first) + len(second))
+
+class FuzzyLookupTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.memory = TranslationMemory(os.path.join(folder.name, 'bellek.sqlite3'))
+        self.addCleanup(self.memory.close)
+
+    def test_exact_threshold_at_size_bound(self):
+        # n=23 ve t=0.85 için alt sınır 17.000000000000004 çıkar; 17 trigramlı,
+        # Dice'ı tam 0.85 olan aday elenmemelidir
+        source = 'abcdefghijklmnopq'
+        query = source + ' wxyz5'
+        self.assertEqual((len(ngrams(query)), len(ngrams(source))), (23, 17))
+        self.assertEqual(dice(ngrams(query), ngrams(source)), THRESHOLD)
+        self.memory.add(source, 'hedef')
+        self.assertEqual(self.memory._fuzzy(query, THRESHOLD), ('hedef', THRESHOLD))
+
+    def test_matches_brute_force(self):
+        rng = random.Random(1234)
+
+        def random_text():
+            words = [''.join(rng.choice('abcde') for _ in range(rng.randint(1, 6)))
+                     for _ in range(rng.randint(1, 6))]
+            return ' '.join(words)
+
+        sources = sorted({random_text() for _ in range(400)})
+        self.memory.add_many((source, source) for source in sources)
+        grams = {source: ngrams(source) for source in sources}
+
+        queries = [random_text() for _ in range(300)]
+        # Kaynaklardan küçük değişikliklerle türetilen sorgular eşiğe yakın düşer
+        for source in rng.sample(sources, 200):
+            position = rng.randrange(len(source) + 1)
+            queries.append(source[:position] + rng.choice('abcde ') + source[position:])
+
+        for query in queries:
+            query_grams = ngrams(query)
+            expected = max((dice(query_grams, grams[source]) for source in sources), default=0)
+            result = self.memory._fuzzy(query, THRESHOLD)
+            if expected >= THRESHOLD:
+                self.assertIsNotNone(result, query)
+                self.assertEqual(result[1], expected, query)
+                self.assertEqual(dice(query_grams, grams[result[0]]), expected, query)
+            else:
+                self.assertIsNone(result, query)
+
+class TranslatorTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.memory = TranslationMemory(os.path.join(folder.name, 'bellek.sqlite3'))
+        self.addCleanup(self.memory.close)
+
+        self.server = StubTranslationServer()
+        self.server.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.backend = HTTPTranslationBackend(self.server.url, max_workers=2)
+        self.backend.max_batch_size = 3
+        self.backend.retry_delay = 0.01
+        self.addCleanup(self.backend.close)
+        self.translator = Translator(self.backend, self.memory)
+
+    def test_batches_and_deduplicates(self):
+        texts = [f'satır {number}' for number in range(7)]
+        texts += ['satır 0', '  satır 1 ', '\tsatır 2\n', '', '   ']
+        results = self.translator.translate(texts)
+
+        # 7 farklı metin, en fazla 3'erli 3 istekte ve bir kez gönderilir
+        self.assertEqual(self.server.text_count, 7)
+        self.assertEqual(self.server.request_count, 3)
+        self.assertLessEqual(len(self.server.connections), 2)
+
+        self.assertEqual(results[0], ('[TR] satır 0', ORIGIN_SERVICE, 1.0))
+        self.assertEqual(results[7], ('[TR] satır 0', ORIGIN_SERVICE, 1.0))
+        self.assertEqual(results[8][0], '  [TR] satır 1 ')
+        self.assertEqual(results[9][0], '\t[TR] satır 2\n')
+        self.assertEqual(results[10], ('', None, 1.0))
+        self.assertEqual(results[11], ('   ', None, 1.0))
+
+    def test_results_are_written_to_memory(self):
+        self.translator.translate(['merhaba dünya', 'güle güle'])
+        self.assertEqual(len(self.memory), 2)
+        self.assertEqual(self.memory.lookup('merhaba dünya'), ('[TR] merhaba dünya', 1.0))
+
+        requests = self.server.request_count
+        results = self.translator.translate([' merhaba dünya '])
+        self.assertEqual(self.server.request_count, requests)
+        self.assertEqual(results, [(' [TR] merhaba dünya ', ORIGIN_MEMORY, 1.0)])
+
+    def test_retries_temporary_errors(self):
+        self.server.failures = [429, 503]
+        results = self.translator.translate(['tekrar dene'])
+        self.assertEqual(results, [('[TR] tekrar dene', ORIGIN_SERVICE, 1.0)])
+        self.assertEqual(self.server.failure_count, 2)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_gives_up_after_retries(self):
+        self.server.failures = [503] * 10
+        with self.assertRaises(RuntimeError):
+            self.translator.translate(['olmayacak'])
+        self.assertEqual(len(self.memory), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import collections
+import random
+import unittest
+
+from donusturucu import ConversionEngine
+
+# ConversionEngine'in üç yolu (sıralı str.replace, str.translate, trie regex'i)
+# rastgele tablolarla en soldaki en uzun eşleşmeyi seçen basit bir tek geçişli
+# dönüştürücüyle karşılaştırılır
+
+TABLES_PER_STRATEGY = 150
+
+def reference_convert(mappings, content):
+    # (çıktı, anahtar başına değiştirme sayıları)
+    max_length = max(map(len, mappings), default=0)
+    parts = []
+    counts = collections.Counter()
+    position = 0
+    while position < len(content):
+        for length in range(min(max_length, len(content) - position), 0, -1):
+            key = content[position:position + length]
+            if key in mappings:
+                parts.append(mappings[key])
+                counts[key] += 1
+                position += length
+                break
+        else:
+            parts.append(content[position])
+            position += 1
+    return ''.join(parts), counts
+
+def random_table(rng):
+    # Anahtar ve hedef alfabeleri bazen ayrık tutulur ki bağımsız tablolar
+    # ('replace') da yeterince üretilsin
+    key_chars = 'abcd'
+    target_chars = rng.choice(('XYZ', 'abcXY'))
+    max_key_length = rng.choice((1, 1, 2, 3))
+    mappings = {}
+    for _ in range(rng.randint(1, 6)):
+        key = ''.join(rng.choice(key_chars) for _ in range(rng.randint(1, max_key_length)))
+        mappings[key] = ''.join(rng.choice(target_chars) for _ in range(rng.randint(0, 2)))
+    return mappings
+
+def random_text(rng):
+    return ''.join(rng.choice('abcdXe') for _ in range(rng.randint(0, 40)))
+
+class ConversionEngineTest(unittest.TestCase):
+    def test_strategies_match_reference(self):
+        rng = random.Random(2024)
+        tested = collections.Counter()
+        while min(tested[strategy] for strategy in ('replace', 'translate', 'pattern')) < TABLES_PER_STRATEGY:
+            mappings = random_table(rng)
+            engine = ConversionEngine(mappings)
+            tested[engine.strategy] += 1
+            for _ in range(20):
+                content = random_text(rng)
+                expected, expected_counts = reference_convert(mappings, content)
+                message = (engine.strategy, mappings, content)
+                self.assertEqual(engine.convert(content), expected, message)
+                self.assertEqual(engine.count(content), dict(expected_counts), message)
+
+                # Akış modu: rastgele parçalara bölünmüş metin aynı sonucu vermeli
+                counts = collections.Counter()
+                output = []
+                rest = ''
+                position = 0
+                while position < len(content):
+                    size = rng.randint(1, 8)
+                    converted, rest = engine.convert_partial(rest + content[position:position + size], counts=counts)
+                    output.append(converted)
+                    position += size
+                converted, _ = engine.convert_partial(rest, final=True, counts=counts)
+                output.append(converted)
+                self.assertEqual(''.join(output), expected, message)
+                self.assertEqual(+counts, expected_counts, message)
+
+    def test_replacements_are_not_chained(self):
+        for mappings in ({'a': 'b', 'b': 'a'}, {'ab': 'c', 'c': 'ab'}, {'a': 'bc', 'bc': 'd'}):
+            content = 'abcabcab'
+            self.assertEqual(ConversionEngine(mappings).convert(content), reference_convert(mappings, content)[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import re
+import sys
+
+# Köşeli parantezli etiket / anahtar / tırnaklı metin biçimindeki yerelleştirme
+# dosyaları için artımlı ayrıştırıcı:
+#
+#     [Bolum_01]
+#     Speaker: "Çevrilecek metin"
+#
+# Her satır bağımsız ayrıştırılır; satırın etiketi ve çevrilecek metinleri
+# (anahtar, başlangıç sütunu, bitiş sütunu) satır numarasıyla dizilen bir
+# tabloda tutulur. Düzenlemede yalnızca değişen satırlar yeniden ayrıştırılır,
+# sonraki satırların numaraları liste dilimi değişimiyle kendiliğinden kayar.
+# Qt'ye bağımlı değildir.
+
+# Çeviri aracının .txt vurgulama kurallarıyla aynı yapılar; en soldaki eşleşme
+# kazandığından tırnak içindeki köşeli parantezler etiket sayılmaz
+SEGMENT_PATTERN = re.compile(
+    r'(?P<tag>\[[^\]]*\])|(?P<key>[A-Z][A-Za-z]*:)|"(?P<string>[^"]*)"'
+)
+
+def parse_line(text):
+    # (etiket, metinler) ya da None. Boş ya da yalnızca boşluk içeren tırnaklar
+    # çevrilecek metin sayılmaz; anahtarı olmayan metnin anahtarı ''dır.
+    if '"' not in text and '[' not in text:
+        return None
+    tag = None
+    key = ''
+    segments = []
+    for match in SEGMENT_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind == 'string':
+            if match.group('string').strip():
+                segments.append((key, match.start('string'), match.end('string')))
+        elif kind == 'key':
+            # Aynı anahtarlar satırlar arasında tek nesneyi paylaşır
+            key = sys.intern(match.group('key')[:-1])
+        elif tag is None:
+            tag = match.group('tag')[1:-1]
+    if tag is None and not segments:
+        return None
+    return tag, tuple(segments)
+
+class SegmentTable:
+    # lines[i]: i. satırın parse_line sonucu ya da henüz ayrıştırılmadıysa False.
+    # Segmentler (satır, anahtar, başlangıç, bitiş) dörtlüleri olarak döndürülür;
+    # sütunlar satır içindedir. Bekleyen satırlar segmentsiz sayılır.
+    def __init__(self):
+        self.lines = []
+        self.segment_count = 0
+
+    def __len__(self):
+        return self.segment_count
+
+    def reset(self, texts):
+        self.lines = []
+        self.segment_count = 0
+        self.replace_lines(0, 0, texts)
+
+    def replace_lines(self, first, count, texts):
+        # [first, first + count) satırlarının yerine texts satırları gelir
+        parsed = [parse_line(text) for text in texts]
+        removed = sum(len(line[1]) for line in self.lines[first:first + count] if line)
+        added = sum(len(line[1]) for line in parsed if line)
+        self.lines[first:first + count] = parsed
+        self.segment_count += added - removed
+
+    def mark_pending(self, first, count, added):
+        # Çok satırlık eklemeler sonradan parça parça ayrıştırılmak üzere işaretlenir
+        removed = sum(len(line[1]) for line in self.lines[first:first + count] if line)
+        self.lines[first:first + count] = [False] * added
+        self.segment_count -= removed
+
+    def first_pending(self, start=0):
+        # start'tan itibaren ilk bekleyen satır; yoksa None. Satırlar None, False
+        # ya da demet olduğundan aramayı list.index C düzeyinde yapar
+        try:
+            return self.lines.index(False, start)
+        except ValueError:
+            return None
+
+    def line_segments(self, line):
+        parsed = self.lines[line] if 0 <= line < len(self.lines) else None
+        return parsed[1] if parsed else ()
+
+    def section(self, line):
+        # Satırın bağlı olduğu etiket: kendisinde ya da üstündeki en yakın etiket
+        for number in range(min(line, len(self.lines) - 1), -1, -1):
+            parsed = self.lines[number]
+            if parsed and parsed[0] is not None:
+                return parsed[0]
+        return None
+
+    def segments(self):
+        for line, parsed in enumerate(self.lines):
+            if parsed:
+                for key, start, end in parsed[1]:
+                    yield line, key, start, end
+
+    def next_segment(self, line, column):
+        # (line, column) konumundan sonra başlayan ilk segment; yoksa None
+        for key, start, end in self.line_segments(line):
+            if start > column:
+                return line, key, start, end
+        for number in range(line + 1, len(self.lines)):
+            parsed = self.lines[number]
+            if parsed and parsed[1]:
+                key, start, end = parsed[1][0]
+                return number, key, start, end
+        return None
+
+    def previous_segment(self, line, column):
+        # (line, column) konumundan önce başlayan son segment; yoksa None
+        for key, start, end in reversed(self.line_segments(line)):
+            if start < column:
+                return line, key, start, end
+        for number in range(min(line, len(self.lines)) - 1, -1, -1):
+            parsed = self.lines[number]
+            if parsed and parsed[1]:
+                key, start, end = parsed[1][-1]
+                return number, key, start, end
+        return None